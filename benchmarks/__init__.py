@@ -0,0 +1,4 @@
+"""Benchmarks of cfglib's hot paths.
+
+Run with `python -m benchmarks`, see `python -m benchmarks --help`.
+"""
@@ -0,0 +1,54 @@
+"""Run the benchmarks: `python -m benchmarks [-o results.json] [--baseline old.json] [PATTERN...]`"""
+import argparse
+import sys
+
+from . import bench_config, bench_sources, bench_spec  # noqa: F401  Register the benchmarks
+from . import harness
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description=__doc__)
+    parser.add_argument('patterns', nargs='*', help='Glob patterns of benchmark names to run')
+    parser.add_argument('-o', '--output', help='Write the results as JSON to this file')
+    parser.add_argument('--baseline', help='Compare the results to a previous JSON output')
+    parser.add_argument(
+        '--threshold', type=float, default=0.1,
+        help='Fail if a benchmark is slower than the baseline by more than this fraction',
+    )
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.2, help='Seconds per timed run')
+    parser.add_argument('--list', action='store_true', help='List benchmarks and exit')
+    args = parser.parse_args()
+
+    if args.list:
+        for name in harness.benchmarks(args.patterns):
+            print(name)
+        return 0
+
+    def _progress(name, result):
+        print(f'{name:<60} {result["median_ns"] / 1000:>12.2f} us', file=sys.stderr)
+
+    results = harness.run_all(
+        args.patterns, repeat=args.repeat, min_time=args.min_time, progress=_progress,
+    )
+    if args.output:
+        harness.dump(results, args.output)
+
+    if not args.baseline:
+        return 0
+
+    rows, regressions = harness.compare(results, harness.load(args.baseline), args.threshold)
+    print(file=sys.stderr)
+    for name, base_ns, current_ns, ratio in rows:
+        marker = '  SLOWER' if name in regressions else ''
+        print(
+            f'{name:<60} {base_ns / 1000:>10.2f} -> {current_ns / 1000:>10.2f} us'
+            f' ({ratio:.2f}x){marker}',
+            file=sys.stderr,
+        )
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""Benchmarks of the generic configs."""
+import itertools
+
+import cfglib
+
+from .harness import benchmark
+
+
+def _layers(count: int, keys_per_layer: int = 100):
+    return [
+        cfglib.DictConfig({f'key{layer}_{i}': i for i in range(keys_per_layer)})
+        for layer in range(count)
+    ]
+
+
+@benchmark('composite_getitem', layers=1, miss_ratio=0.0)
+@benchmark('composite_getitem', layers=4, miss_ratio=0.0)
+@benchmark('composite_getitem', layers=16, miss_ratio=0.0)
+@benchmark('composite_getitem', layers=4, miss_ratio=0.5)
+@benchmark('composite_getitem', layers=16, miss_ratio=0.5)
+def composite_getitem(layers, miss_ratio):
+    """Lookups of keys spread evenly over all layers, some of them missing."""
+    cfg = cfglib.CompositeConfig(_layers(layers))
+    misses = int(100 * miss_ratio)
+    keys = [f'key{i % layers}_{i // layers}' for i in range(100 - misses)]
+    keys += [f'missing{i}' for i in range(misses)]
+
+    def _lookups():
+        for key in keys:
+            try:
+                cfg[key]
+            except KeyError:
+                pass
+
+    yield _lookups
+
+
+@benchmark('composite_getitem_untracked', layers=4)
+def composite_getitem_untracked(layers):
+    """Lookups through layers that don't track changes, so nothing can be indexed."""
+    cfg = cfglib.CompositeConfig([
+        cfglib.ProxyConfig(dict(layer)) for layer in _layers(layers)
+    ])
+    keys = [f'key{layer}_{i}' for i in range(25) for layer in range(layers)]
+
+    def _lookups():
+        for key in keys:
+            cfg[key]
+
+    yield _lookups
+
+
+@benchmark('projected_iter', source_size=10_000)
+def projected_iter(source_size):
+    """Iteration over a projection of a large source, half of which is relevant."""
+    source = cfglib.DictConfig({
+        f'{prefix}KEY_{i}': i
+        for prefix, i in itertools.product(['APP_', 'OTHER_'], range(source_size // 2))
+    })
+    cfg = cfglib.ProjectedConfig(
+        source,
+        cfglib.BasicConfigProjection(
+            is_relevant_sourcekey=lambda key: key.startswith('APP_'),
+            key_to_sourcekey=lambda key: 'APP_' + key.upper(),
+            sourcekey_to_key=lambda key: key[len('APP_'):].lower(),
+        ),
+    )
+
+    yield lambda: list(cfg)
+
+
+@benchmark('caching_reload', size=1000, changed=0)
+@benchmark('caching_reload', size=1000, changed=10)
+def caching_reload(size, changed):
+    """Reloading a cached config where a few keys of the wrapped source change every time."""
+    source = {f'key{i}': i for i in range(size)}
+    cfg = cfglib.CachingConfig(cfglib.ProxyConfig(source))
+    counter = itertools.count()
+
+    def _reload():
+        value = next(counter)
+        for i in range(changed):
+            source[f'key{i}'] = value
+
+        cfg.reload()
+
+    yield _reload
+
+
+@benchmark('composite_get_many', layers=4, keys=30)
+def composite_get_many(layers, keys):
+    """Resolving a batch of keys at once, compare with composite_getitem."""
+    cfg = cfglib.CompositeConfig(_layers(layers))
+    batch = [f'key{i % layers}_{i // layers}' for i in range(keys)]
+    yield lambda: cfg.get_many(batch)
@@ -0,0 +1,61 @@
+"""Benchmarks of the config sources."""
+import os
+
+from cfglib.sources.env import EnvConfig
+
+from .harness import benchmark
+
+
+def _large_environment(size: int):
+    """Add *size* unrelated variables and a few prefixed ones, return their names."""
+    names = [f'CFGLIB_BENCH_UNRELATED_{i}' for i in range(size)]
+    names += [f'CFGLIB_BENCH_APP_KEY_{i}' for i in range(10)]
+    for name in names:
+        os.environ[name] = 'value'
+
+    return names
+
+
+def _restore_environment(names):
+    for name in names:
+        os.environ.pop(name, None)
+
+
+@benchmark('env_getitem', env_size=10_000, live=True)
+@benchmark('env_getitem', env_size=10_000, live=False)
+def env_getitem(env_size, live):
+    """Lookups of prefixed variables in a large environment."""
+    names = _large_environment(env_size)
+    try:
+        cfg = EnvConfig(prefix='CFGLIB_BENCH_APP_', lowercase=True, live=live)
+        keys = [f'key_{i}' for i in range(10)]
+
+        def _lookups():
+            for key in keys:
+                cfg[key]
+
+        yield _lookups
+    finally:
+        _restore_environment(names)
+
+
+@benchmark('env_iter', env_size=10_000)
+def env_iter(env_size):
+    """Listing the prefixed variables of a large live environment."""
+    names = _large_environment(env_size)
+    try:
+        cfg = EnvConfig(prefix='CFGLIB_BENCH_APP_', lowercase=True)
+        yield lambda: list(cfg)
+    finally:
+        _restore_environment(names)
+
+
+@benchmark('env_reload', env_size=10_000)
+def env_reload(env_size):
+    """Copying the prefixed variables of a large environment again."""
+    names = _large_environment(env_size)
+    try:
+        cfg = EnvConfig(prefix='CFGLIB_BENCH_APP_', lowercase=True, live=False)
+        yield cfg.reload
+    finally:
+        _restore_environment(names)
@@ -0,0 +1,181 @@
+"""Benchmarks of spec validation and SpecValidatedConfig."""
+import cfglib
+from cfglib import validation as val
+
+from .harness import benchmark
+
+
+class _AccessConfig(cfglib.SpecValidatedConfig):
+    name = cfglib.StringSetting(default='tool')
+    port = cfglib.IntSetting(default=8080)
+    debug = cfglib.BoolSetting(default=False)
+
+
+class _CachedAccessConfig(_AccessConfig):
+    cache_values = True
+
+
+class _RcuAccessConfig(_AccessConfig):
+    read_copy_update = True
+
+
+@benchmark('spec_config_getattr', mode='plain')
+@benchmark('spec_config_getattr', mode='cache_values')
+@benchmark('spec_config_getattr', mode='read_copy_update')
+def spec_config_getattr(mode):
+    """Attribute access of a config with a file-like and an env-like layer."""
+    config_class = {
+        'plain': _AccessConfig,
+        'cache_values': _CachedAccessConfig,
+        'read_copy_update': _RcuAccessConfig,
+    }[mode]
+    cfg = config_class([cfglib.DictConfig({'name': 'x', 'port': 1}), cfglib.DictConfig({'port': 2})])
+
+    def _access():
+        return cfg.name, cfg.port, cfg.debug
+
+    yield _access
+
+
+def _wide_spec(width: int) -> cfglib.ConfigSpec:
+    setting_types = [cfglib.StringSetting, cfglib.IntSetting, cfglib.BoolSetting, cfglib.FloatSetting]
+    return cfglib.ConfigSpec([
+        setting_types[i % len(setting_types)](name=f's{i}', default=None)
+        for i in range(width)
+    ])
+
+
+def _wide_data(width: int):
+    values = ['a', 1, True, 1.5]
+    return cfglib.DictConfig({f's{i}': values[i % len(values)] for i in range(0, width, 2)})
+
+
+@benchmark('validate_wide', width=500, compiled=False)
+@benchmark('validate_wide', width=500, compiled=True)
+def validate_wide(width, compiled):
+    """Validation of a flat spec where half the settings fall back to defaults."""
+    spec = _wide_spec(width)
+    if compiled:
+        spec.compile()
+
+    config = _wide_data(width)
+    yield lambda: spec.validate_config(config)
+
+
+def _deep_spec(depth: int, width: int) -> cfglib.ConfigSpec:
+    settings = [cfglib.IntSetting(name=f'i{i}', default=0) for i in range(width)]
+    settings.append(cfglib.ListSetting(name='items', subsetting=cfglib.StringSetting(), default=[]))
+    if depth > 1:
+        settings.append(cfglib.DictSetting(name='child', subtype=_deep_spec(depth - 1, width)))
+
+    return cfglib.ConfigSpec(settings)
+
+
+def _deep_data(depth: int, width: int):
+    data = {f'i{i}': i for i in range(width)}
+    data['items'] = ['x'] * 10
+    if depth > 1:
+        data['child'] = _deep_data(depth - 1, width)
+
+    return data
+
+
+@benchmark('validate_deep', depth=8, width=10)
+def validate_deep(depth, width):
+    """Validation of nested DictSettings with a list at every level."""
+    spec = _deep_spec(depth, width)
+    config = cfglib.DictConfig(_deep_data(depth, width))
+    yield lambda: spec.validate_config(config)
+
+
+@benchmark('spec_config_get_many', mode='plain')
+@benchmark('spec_config_get_many', mode='cache_values')
+def spec_config_get_many(mode):
+    """The settings of spec_config_getattr fetched in one call."""
+    config_class = _CachedAccessConfig if mode == 'cache_values' else _AccessConfig
+    cfg = config_class([cfglib.DictConfig({'name': 'x', 'port': 1}), cfglib.DictConfig({'port': 2})])
+    keys = ['name', 'port', 'debug']
+    yield lambda: cfg.get_many(keys)
+
+
+@benchmark('frozen_getattr')
+def frozen_getattr():
+    """Attribute access of a frozen snapshot, compare with spec_config_getattr."""
+    cfg = _AccessConfig([cfglib.DictConfig({'name': 'x', 'port': 1}), cfglib.DictConfig({'port': 2})])
+    frozen = cfg.freeze()
+
+    def _access():
+        return frozen.name, frozen.port, frozen.debug
+
+    yield _access
+
+
+@benchmark('validate_list', size=100_000, item='int')
+@benchmark('validate_list', size=100_000, item='float')
+@benchmark('validate_list', size=100_000, item='string')
+def validate_list(size, item):
+    """A long ListSetting with typed, range-checked items."""
+    if item == 'string':
+        subsetting = cfglib.StringSetting(validators=[val.one_of(['a', 'b'])])
+        values = ['a', 'b'] * (size // 2)
+    elif item == 'float':
+        subsetting = cfglib.FloatSetting(validators=[val.value_range(0.0, 1.0)])
+        values = [i / size for i in range(size)]
+    else:
+        subsetting = cfglib.IntSetting(validators=[val.value_range(0, size)])
+        values = list(range(size))
+
+    setting = cfglib.ListSetting(name='items', subsetting=subsetting)
+    yield lambda: setting.validate_value(values)
+
+
+@benchmark('spec_config_override')
+def spec_config_override():
+    """A per-request override of one setting, compare with building a new config
+    with an extra layer in spec_config_new_layer."""
+    cfg = _RcuAccessConfig([cfglib.DictConfig({'name': 'x', 'port': 1})])
+
+    def _request():
+        with cfg.override(port=2):
+            return cfg.name, cfg.port, cfg.debug
+
+    yield _request
+
+
+@benchmark('spec_config_new_layer')
+def spec_config_new_layer():
+    """The same as spec_config_override with a new config for each request."""
+    source = cfglib.DictConfig({'name': 'x', 'port': 1})
+
+    def _request():
+        cfg = _AccessConfig([source, cfglib.DictConfig({'port': 2})])
+        return cfg.name, cfg.port, cfg.debug
+
+    yield _request
+
+
+class _PoolConfig(cfglib.SpecValidatedConfig):
+    size = cfglib.IntSetting(default=5)
+
+
+class _DbConfig(cfglib.SpecValidatedConfig):
+    host = cfglib.StringSetting(default='localhost')
+    pool = cfglib.DictSetting(subtype=_PoolConfig, default={})
+
+
+class _NestedConfig(cfglib.SpecValidatedConfig):
+    db = cfglib.DictSetting(subtype=_DbConfig, default={})
+
+
+@benchmark('spec_config_nested', access='chained')
+@benchmark('spec_config_nested', access='get_path')
+@benchmark('spec_config_nested', access='attributes')
+def spec_config_nested(access):
+    """A setting two nested configs deep."""
+    cfg = _NestedConfig([cfglib.DictConfig({'db': {'host': 'db', 'pool': {'size': 10}}})])
+    if access == 'chained':
+        yield lambda: cfg['db']['pool']['size']
+    elif access == 'get_path':
+        yield lambda: cfg.get_path('db.pool.size')
+    else:
+        yield lambda: cfg.nested.db.pool.size
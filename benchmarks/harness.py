@@ -0,0 +1,145 @@
+"""A small timeit-based benchmark harness with JSON output."""
+from __future__ import annotations
+
+import contextlib
+import fnmatch
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import timeit
+from typing import Any, Callable, ContextManager, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import cfglib
+
+
+BenchmarkSetup = Callable[[], ContextManager[Callable[[], Any]]]
+
+_BENCHMARKS: Dict[str, BenchmarkSetup] = {}
+
+
+def benchmark(name: str, **params):
+    """Register a benchmark.
+
+    The decorated function is a generator that sets up the benchmark, yields the callable
+    to be timed and cleans up afterwards. If params are given, it's called with them
+    and they're added to the name, e.g. `composite_getitem[layers=4]`.
+    """
+    def _decorator(func):
+        full_name = name
+        if params:
+            full_name += '[' + ','.join(f'{key}={value}' for key, value in params.items()) + ']'
+
+        if full_name in _BENCHMARKS:
+            raise ValueError(f'Duplicate benchmark: {full_name}')
+
+        _BENCHMARKS[full_name] = lambda: contextlib.contextmanager(func)(**params)
+        return func
+
+    return _decorator
+
+
+def benchmarks(patterns: Sequence[str] = ()) -> Dict[str, BenchmarkSetup]:
+    """Registered benchmarks whose names match any of the glob patterns (all if none)."""
+    return {
+        name: setup
+        for name, setup in _BENCHMARKS.items()
+        if not patterns or any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns)
+    }
+
+
+def run_benchmark(
+    setup: BenchmarkSetup,
+    repeat: int = 5,
+    min_time: float = 0.2,
+) -> Dict[str, Any]:
+    """Time one benchmark: calibrate the number of loops so that a run takes
+    at least *min_time* seconds, then take *repeat* runs. Times are per call."""
+    with setup() as func:
+        timer = timeit.Timer(func)
+        loops = 1
+        while True:
+            elapsed = timer.timeit(loops)
+            if elapsed >= min_time:
+                break
+
+            loops = max(loops * 2, int(loops * min_time / max(elapsed, 1e-9) * 1.2))
+
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            times = [timer.timeit(loops) / loops for _ in range(repeat)]
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    return {
+        'loops': loops,
+        'repeat': repeat,
+        'min_ns': min(times) * 1e9,
+        'median_ns': statistics.median(times) * 1e9,
+        'mean_ns': statistics.mean(times) * 1e9,
+        'stdev_ns': statistics.stdev(times) * 1e9 if len(times) > 1 else 0.0,
+    }
+
+
+def run_all(
+    patterns: Sequence[str] = (),
+    repeat: int = 5,
+    min_time: float = 0.2,
+    progress: Optional[Callable[[str, Dict[str, Any]], Any]] = None,
+) -> Dict[str, Any]:
+    """Run benchmarks and return the results as a JSON-serializable dict."""
+    results = {}
+    for name, setup in benchmarks(patterns).items():
+        results[name] = run_benchmark(setup, repeat=repeat, min_time=min_time)
+        if progress is not None:
+            progress(name, results[name])
+
+    return {
+        'version': 1,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'cfglib_version': cfglib.__version__,
+        'python': sys.version,
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'benchmarks': results,
+    }
+
+
+def compare(
+    results: Mapping[str, Any],
+    baseline: Mapping[str, Any],
+    threshold: float = 0.1,
+) -> Tuple[List[Tuple[str, float, float, float]], List[str]]:
+    """Compare median times of benchmarks present in both runs.
+
+    :return: Rows of (name, baseline ns, current ns, ratio), and the names of benchmarks
+        that are slower than the baseline by more than *threshold* (a fraction).
+    """
+    rows = []
+    regressions = []
+    for name, result in results['benchmarks'].items():
+        base_result = baseline['benchmarks'].get(name)
+        if base_result is None:
+            continue
+
+        ratio = result['median_ns'] / base_result['median_ns']
+        rows.append((name, base_result['median_ns'], result['median_ns'], ratio))
+        if ratio > 1 + threshold:
+            regressions.append(name)
+
+    return rows, regressions
+
+
+def load(path: str) -> Dict[str, Any]:
+    with open(path, encoding='utf-8') as file:
+        return json.load(file)
+
+
+def dump(results: Mapping[str, Any], path: str):
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+        file.write('\n')
@@ -2,6 +2,9 @@
 
 Objects from the `config` and `spec` submodules are reexported to the root, so you can use
 e.g. `cfglib.Config`.
+
+Rarely used parts, like `cfglib.sources`, are only imported on first access (PEP 562),
+so that `import cfglib` stays cheap for short-lived programs.
 """
 
 __author__ = '''Anton Barkovsky'''
@@ -9,7 +12,36 @@ __email__ = 'anton@swarmer.me'
 __version__ = '1.1.0'
 
 
+import importlib
+
 # pylint: disable=wildcard-import
 from .config import *
 from .spec import *
+from .stats import ConfigStats
 from .validation import (ValidationContext, ValidationError, Validator)
+
+
+# Lazily imported attributes: name -> (module, attribute or None for the module itself)
+_LAZY_ATTRIBUTES = {
+    'sources': ('.sources', None),
+    'FrozenConfig': ('.frozen', 'FrozenConfig'),
+    'FrozenDict': ('.frozen', 'FrozenDict'),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+
+    value = importlib.import_module(module_name, __name__)
+    if attribute is not None:
+        value = getattr(value, attribute)
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY_ATTRIBUTES.keys())
@@ -3,12 +3,31 @@ from __future__ import annotations
 
 import abc
 import collections.abc
+import contextlib
+import functools
+import weakref
 from itertools import chain
-from typing import *
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from .stats import ConfigStats, layer_label
+from .validation import ValidationError
 
 
 __all__ = [
     'Config',
+    'ConfigDiff',
     'MutableConfig',
     'DictConfig',
     'ProxyConfig',
@@ -19,11 +38,42 @@ __all__ = [
     'LOWERCASE_PROJECTION',
     'UPPERCASE_PROJECTION',
     'ProjectedConfig',
+    'Subscription',
     'to_cfg',
     'to_cfg_list',
 ]
 
 
+class Marker:
+    def __repr__(self):
+        if self is MISSING:
+            return 'MISSING'
+        else:
+            return super().__repr__()  # pragma: no cover
+
+    def __reduce__(self):
+        # Unpickle as the same singleton, e.g. in validation results from other processes
+        if self is MISSING:
+            return 'MISSING'
+
+        return super().__reduce__()  # pragma: no cover
+
+
+# Markers
+MISSING = Marker()
+"""A singleton marker object denoting that a setting value is (or should be) absent.
+Absence here means not being in the config at all (raising KeyError on access)."""
+
+# Markers for cached values
+_STALE = object()
+_IRRELEVANT = object()
+
+# Attributes of configs that aren't copied or pickled, see Config.__getstate__()
+_TRANSIENT_ATTRIBUTES = frozenset([
+    '_dependents', '_subscriptions', '_batch_depth', '_batched_keys', '_batched_unknown',
+])
+
+
 def to_cfg(value: Any) -> Config:
     if isinstance(value, Config):
         return value
@@ -43,6 +93,52 @@ def to_cfg_list(value: Any) -> List[Config]:
     return [to_cfg(item) for item in value]
 
 
+class ConfigDiff:
+    """Differences between two states of a config.
+
+    :param added: Keys that were not in the config before.
+    :param removed: Keys that are no longer in the config.
+    :param changed: Keys whose values have changed.
+    :param old_values: Previous values of removed and changed keys.
+    """
+
+    def __init__(
+        self,
+        added: Iterable = (),
+        removed: Iterable = (),
+        changed: Iterable = (),
+        old_values: Optional[Mapping] = None,
+    ):
+        self.added = frozenset(added)
+        self.removed = frozenset(removed)
+        self.changed = frozenset(changed)
+        self.old_values = dict(old_values or {})
+
+    @property
+    def keys(self) -> frozenset:
+        """All affected keys"""
+        return self.added | self.removed | self.changed
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.changed)
+
+    def __eq__(self, other):
+        if not isinstance(other, ConfigDiff):
+            return NotImplemented
+
+        return (
+            self.added == other.added
+            and self.removed == other.removed
+            and self.changed == other.changed
+        )
+
+    def __repr__(self):
+        return (
+            f'<ConfigDiff added={set(self.added)} removed={set(self.removed)}'
+            f' changed={set(self.changed)}>'
+        )
+
+
 class Config(collections.abc.Mapping):
     """An abstract configuration interface
 
@@ -60,6 +156,18 @@ class Config(collections.abc.Mapping):
         """
         return DictConfig(self)
 
+    def fingerprint(self) -> str:
+        """Return a digest identifying the current contents of this config,
+        used to key caches of data derived from it (like validated values).
+
+        By default the contents are hashed. Configs that can tell cheaply whether
+        their contents have changed (e.g. by a file's modification time) override this.
+        """
+        return _digest(
+            self.__class__.__qualname__,
+            *sorted(repr(item) for item in self.items()),
+        )
+
     @abc.abstractmethod
     def reload(self):
         """Reload all config items from its backing store. The contents may change arbitrarily.
@@ -69,6 +177,141 @@ class Config(collections.abc.Mapping):
         """
         pass  # pragma: no cover
 
+    async def areload(self):
+        """Asynchronous version of reload().
+
+        By default, simply calls reload(). Configs made of other configs reload them
+        concurrently, and configs that do I/O don't block the event loop.
+        """
+        return self.reload()
+
+    def subscribe(
+        self,
+        callback: Callable[[Any, Any, Any], Any],
+        keys: Iterable[Any] = (),
+        prefixes: Iterable[str] = (),
+    ) -> Subscription:
+        """Call `callback(key, old_value, new_value)` whenever the value of one of *keys*
+        or of a key starting with one of *prefixes* changes. Absent values are passed as MISSING.
+        If neither keys nor prefixes are given, all keys are watched.
+
+        Changes are picked up when this config or its sources report them,
+        e.g. on reload() or when a DictConfig is modified, and only the reported keys
+        are checked. Sources that always pull fresh data (like a live `EnvConfig`)
+        are checked on reload().
+
+        :return: A subscription that can be cancelled.
+        """
+        if self._subscriptions is None:
+            self._subscriptions = _SubscriptionRegistry()
+
+        subscription = Subscription(self._subscriptions, callback, keys, prefixes)
+        self._subscriptions.add(self, subscription)
+        return subscription
+
+    # Change propagation.
+    #
+    # Configs built on top of other configs register themselves as dependents
+    # of their sources. Whenever a source changes, it notifies its dependents
+    # about the changed keys (or None if they are not known),
+    # the dependents drop whatever they cached and notify their own dependents in turn.
+    _dependents: Optional[weakref.WeakValueDictionary] = None
+    _subscriptions: Optional[_SubscriptionRegistry] = None
+    _batch_depth = 0
+    _batched_keys: Optional[set] = None
+    _batched_unknown = False
+
+    @property
+    def _tracks_changes(self) -> bool:
+        """Whether this config notifies its dependents about every change of its contents.
+
+        Caches built on top of configs that can change behind the scenes
+        (e.g. proxies of plain mappings) are disabled.
+        """
+        return False
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Dependents and subscribers belong to this object, copies start without them
+        return {
+            name: value
+            for name, value in self.__dict__.items()
+            if name not in _TRANSIENT_ATTRIBUTES
+        }
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self._restore_sources()
+
+    def _restore_sources(self):
+        """Called after unpickling or copying. Configs built on top of other configs
+        register themselves as dependents of their sources again."""
+        pass
+
+    def _add_dependent(self, dependent: 'Config'):
+        """Register *dependent* to be invalidated when this config changes.
+        Dependents are referenced weakly."""
+        if self._dependents is None:
+            self._dependents = weakref.WeakValueDictionary()
+
+        self._dependents[id(dependent)] = dependent
+
+    def _remove_dependent(self, dependent: 'Config'):
+        """Stop invalidating *dependent* when this config changes."""
+        if self._dependents is not None:
+            self._dependents.pop(id(dependent), None)
+
+    def _notify_changed(self, keys: Optional[Collection] = None):
+        """Invalidate all dependents of this config and call the subscribers.
+
+        :param keys: Changed keys, None if unknown.
+        """
+        if not self._dependents and not self._subscriptions:
+            return
+
+        if self._batch_depth:
+            if keys is None:
+                self._batched_unknown = True
+            elif not self._batched_unknown:
+                self._batched_keys.update(keys)  # type: ignore
+            return
+
+        if self._dependents:
+            for dependent in list(self._dependents.values()):
+                dependent._invalidate(keys)  # pylint: disable=protected-access
+
+        if self._subscriptions:
+            self._subscriptions.dispatch(self, keys)
+
+    @contextlib.contextmanager
+    def _batch_changes(self):
+        """Collect change notifications and send them once at the end,
+        so that subscribers don't see intermediate states."""
+        if not self._batch_depth:
+            self._batched_keys = set()
+            self._batched_unknown = False
+
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                keys = None if self._batched_unknown else self._batched_keys
+                self._batched_keys = None
+                self._batched_unknown = False
+                if keys is None or keys:
+                    self._notify_changed(keys)
+
+    def _invalidate(self, keys: Optional[Collection] = None):
+        """Called when one of the sources of this config has changed.
+
+        Configs that cache data derived from their sources should override this
+        to drop the cached data, and call the parent implementation.
+
+        :param keys: Keys of the source that changed, None if unknown.
+        """
+        self._notify_changed(keys)
+
 
 class MutableConfig(abc.ABC, collections.abc.MutableMapping, Config):
     """An abstract base class for mutable configs (with __setitem__)"""
@@ -82,10 +325,91 @@ class DictConfig(dict, MutableConfig):
         """Does nothing."""
         pass
 
-    def replace(self, other: Config):
-        """Update self in place to become a shallow copy of *other*"""
-        self.clear()
+    @property
+    def _tracks_changes(self) -> bool:
+        return True
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._notify_changed((key,))
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._notify_changed((key,))
+
+    def __ior__(self, other):  # type: ignore
         self.update(other)
+        return self
+
+    def clear(self):
+        keys = list(self)
+        super().clear()
+        if keys:
+            self._notify_changed(keys)
+
+    def pop(self, key, *args):
+        result = super().pop(key, *args)
+        self._notify_changed((key,))
+        return result
+
+    def popitem(self):
+        result = super().popitem()
+        self._notify_changed((result[0],))
+        return result
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+
+        self[key] = default
+        return default
+
+    def update(self, *args, **kwargs):  # pylint: disable=arguments-differ
+        updated = dict(*args, **kwargs)
+        super().update(updated)
+        if updated:
+            self._notify_changed(updated.keys())
+
+    def replace(self, other: Mapping) -> ConfigDiff:
+        """Update self in place to become a shallow copy of *other*.
+
+        Only the keys that differ are touched: changed and added keys are updated in
+        one step, then removed keys are deleted, so the config is never seen empty.
+
+        :return: The differences between the old and the new contents.
+        """
+        new = dict(other)
+        old_values = {}
+        updated = {}
+        added = []
+        changed = []
+        for key, value in new.items():
+            try:
+                old_value = dict.__getitem__(self, key)
+            except KeyError:
+                added.append(key)
+                updated[key] = value
+                continue
+
+            if old_value is not value and old_value != value:
+                changed.append(key)
+                old_values[key] = old_value
+                updated[key] = value
+
+        removed = [key for key in dict.keys(self) if key not in new]
+        for key in removed:
+            old_values[key] = dict.__getitem__(self, key)
+
+        diff = ConfigDiff(added, removed, changed, old_values)
+        if not diff:
+            return diff
+
+        dict.update(self, updated)
+        for key in removed:
+            dict.__delitem__(self, key)
+
+        self._notify_changed(diff.keys)
+        return diff
 
 
 class ProxyConfig(MutableConfig):
@@ -100,8 +424,27 @@ class ProxyConfig(MutableConfig):
 
     def __init__(self, source: Mapping):
         self.source = source
+
+    @property
+    def source(self) -> Mapping:
+        """The mapping this config proxies. Can be replaced at any time."""
+        return self._source
+
+    @source.setter
+    def source(self, source: Mapping):
+        self._source = source
         self._mutable = isinstance(source, collections.abc.MutableMapping)
 
+        if isinstance(source, Config):
+            source._add_dependent(self)  # pylint: disable=protected-access
+
+        self._invalidate()
+
+    @property
+    def _tracks_changes(self) -> bool:
+        # pylint: disable=protected-access
+        return isinstance(self.source, Config) and self.source._tracks_changes
+
     def __getitem__(self, key):
         return self.source[key]
 
@@ -125,8 +468,24 @@ class ProxyConfig(MutableConfig):
 
     def reload(self):
         """Reload source if it's a Config, otherwise do nothing."""
-        if isinstance(self.source, Config):
-            self.source.reload()
+        with self._batch_changes():
+            if isinstance(self.source, Config):
+                self.source.reload()
+
+            if not self._tracks_changes:
+                self._invalidate()
+
+    async def areload(self):
+        """Asynchronous version of reload()."""
+        with self._batch_changes():
+            if isinstance(self.source, Config):
+                await self.source.areload()
+
+            if not self._tracks_changes:
+                self._invalidate()
+
+    def _restore_sources(self):
+        self.source = self._source
 
 
 class CachingConfig(DictConfig):
@@ -139,10 +498,18 @@ class CachingConfig(DictConfig):
         self.wrapped_config = wrapped_config
         self.replace(self.wrapped_config)
 
-    def reload(self):
-        """Refresh the underlying config and update the cache."""
+    def reload(self) -> ConfigDiff:
+        """Refresh the underlying config and update the cache.
+
+        :return: The differences between the old and the new contents.
+        """
         self.wrapped_config.reload()
-        self.replace(self.wrapped_config)
+        return self.replace(self.wrapped_config)
+
+    async def areload(self) -> ConfigDiff:
+        """Asynchronous version of reload()."""
+        await self.wrapped_config.areload()
+        return self.replace(self.wrapped_config)
 
 
 class CompositeConfig(Config):
@@ -151,13 +518,135 @@ class CompositeConfig(Config):
     Entries are searched in subconfigs in reverse order and the first found
     value is returned. That is, the first subconfig has the lowest priority,
     and the last subconfig takes precedence over all others.
+
+    If all subconfigs track their changes, a resolution index mapping each key
+    to the subconfig that provides it and the set of all keys are built on first
+    access and kept until subconfigs change or get reloaded.
     """
 
+    # Key -> subconfig that provides it, None if subconfigs don't track changes
+    _index: Any = _STALE
+    _keys: Optional[frozenset] = None
+    _invalidations = 0
+
+    _stats: Optional[ConfigStats] = None
+    # Whether to count accesses, or only which layers resolve them
+    _stats_accesses = True
+
+    # Subconfigs this config is registered with as a dependent, by id
+    _registered_subconfigs: Dict[int, Config] = {}
+
     def __init__(self, subconfigs: Iterable[Config]):  # type: ignore
         self.subconfigs = list(subconfigs)
 
+    def instrument(self, stats: Optional[ConfigStats] = None) -> ConfigStats:
+        """Start collecting statistics of lookups: accesses and misses by key,
+        which layer resolved each hit and how often each layer was checked in vain.
+
+        While instrumented, lookups check the layers one by one instead of using the index.
+        Otherwise instrumentation costs a single attribute check per lookup.
+
+        :param stats: Where to collect the statistics, a new `ConfigStats` by default.
+            The same object can be shared by several configs.
+        :return: The stats object.
+        """
+        if stats is None:
+            stats = ConfigStats()
+
+        self._stats = stats
+        return stats
+
+    def uninstrument(self):
+        """Stop collecting statistics."""
+        self._stats = None
+
+    @property
+    def subconfigs(self) -> List[Config]:
+        """Source configs, from lowest priority to highest.
+
+        The list can be modified in place or replaced, caches are invalidated either way.
+        """
+        return self._subconfigs
+
+    @subconfigs.setter
+    def subconfigs(self, subconfigs: Iterable[Config]):
+        if not isinstance(subconfigs, _SubconfigList):
+            subconfigs = _SubconfigList(subconfigs)
+
+        # pylint: disable=protected-access
+        old_subconfigs = self.__dict__.get('_subconfigs')
+        if old_subconfigs is not None and old_subconfigs is not subconfigs:
+            old_subconfigs._remove_owner(self)
+
+        subconfigs._add_owner(self)
+        self._subconfigs = subconfigs
+        self._subconfigs_changed()
+
+    def _subconfigs_changed(self):
+        # pylint: disable=protected-access
+        subconfigs = {id(subconfig): subconfig for subconfig in self._subconfigs}
+        for subconfig_id, subconfig in self._registered_subconfigs.items():
+            if subconfig_id not in subconfigs:
+                subconfig._remove_dependent(self)
+
+        for subconfig in subconfigs.values():
+            subconfig._add_dependent(self)
+
+        self._registered_subconfigs = subconfigs
+        self._invalidate()
+
+    def _restore_sources(self):
+        self.subconfigs = self._subconfigs
+
+    @property
+    def _tracks_changes(self) -> bool:
+        # pylint: disable=protected-access
+        return all(subconfig._tracks_changes for subconfig in self.subconfigs)
+
+    def _invalidate(self, keys=None):
+        self._invalidations += 1
+        self._index = _STALE
+        self._keys = None
+        super()._invalidate(keys)
+
+    def _build_index(self) -> Optional[Dict[Any, Config]]:
+        invalidations = self._invalidations
+
+        if self._tracks_changes:
+            index: Optional[Dict[Any, Config]] = {}
+            for subconfig in self.subconfigs:
+                for key in subconfig:
+                    index[key] = subconfig  # type: ignore
+        else:
+            index = None
+
+        # Don't publish an index if subconfigs changed while it was being built
+        if self._invalidations == invalidations:
+            self._index = index
+
+        return index
+
     def __getitem__(self, item):
-        for subconfig in self.subconfigs[::-1]:
+        if self._stats is not None:
+            return self._getitem_instrumented(item, self._stats)
+
+        index = self._index
+        if index is _STALE:
+            index = self._build_index()
+
+        if index is not None:
+            subconfig = index.get(item)  # type: ignore
+            if subconfig is None:
+                raise KeyError(f'Key {item} not found in any subconfig')
+
+            try:
+                return subconfig[item]
+            except KeyError:
+                # Some configs (like SpecValidatedConfig) may list keys they can't provide,
+                # so fall back to searching the lower priority subconfigs
+                pass
+
+        for subconfig in reversed(self.subconfigs):
             try:
                 return subconfig[item]
             except KeyError:
@@ -165,6 +654,78 @@ class CompositeConfig(Config):
 
         raise KeyError(f'Key {item} not found in any subconfig')
 
+    def get_many(self, keys: Iterable[Any], default: Any = MISSING, named: bool = False) -> tuple:
+        """Look up several keys at once, resolving them in a single pass over the layers.
+
+        :param keys: Keys to look up.
+        :param default: The value for keys that aren't found, by default KeyError is raised.
+        :param named: Whether to return a namedtuple with the keys as field names.
+        :return: The values in the order of *keys*.
+        """
+        keys = tuple(keys)
+        return _pack_values(keys, self._get_many(keys), default, named)
+
+    def _get_many(self, keys: Sequence[Any]) -> List[Any]:
+        """Values of *keys*, MISSING for the ones that aren't found."""
+        if self._stats is not None:
+            return [_current_value(self, key) for key in keys]
+
+        index = self._index
+        if index is _STALE:
+            index = self._build_index()
+
+        values = [MISSING] * len(keys)
+        pending = range(len(keys))
+        if index is not None:
+            unresolved = []
+            for i in pending:
+                subconfig = index.get(keys[i])
+                if subconfig is None:
+                    continue
+
+                try:
+                    values[i] = subconfig[keys[i]]
+                except KeyError:
+                    unresolved.append(i)
+
+            pending = unresolved  # type: ignore
+
+        for subconfig in reversed(self.subconfigs):
+            if not pending:
+                break
+
+            unresolved = []
+            for i in pending:
+                try:
+                    values[i] = subconfig[keys[i]]
+                except KeyError:
+                    unresolved.append(i)
+
+            pending = unresolved  # type: ignore
+
+        return values
+
+    def _getitem_instrumented(self, item, stats: ConfigStats):
+        subconfigs = self.subconfigs
+        for index in range(len(subconfigs) - 1, -1, -1):
+            subconfig = subconfigs[index]
+            try:
+                value = subconfig[item]
+            except KeyError:
+                stats.record_layer_miss(layer_label(index, subconfig))
+                continue
+
+            stats.record_hit(item, layer_label(index, subconfig))
+            if self._stats_accesses:
+                stats.record_access(item, True)
+
+            return value
+
+        if self._stats_accesses:
+            stats.record_access(item, False)
+
+        raise KeyError(f'Key {item} not found in any subconfig')
+
     def __iter__(self):
         return iter(self._all_keys)
 
@@ -177,16 +738,101 @@ class CompositeConfig(Config):
 
     @property
     def _all_keys(self) -> frozenset:
-        all_keys = frozenset(chain.from_iterable(
-            iter(subconfig)
-            for subconfig in self.subconfigs
-        ))
+        all_keys = self._keys
+        if all_keys is not None:
+            return all_keys
+
+        invalidations = self._invalidations
+        index = self._index
+        if index is _STALE:
+            index = self._build_index()
+
+        if index is None:
+            return frozenset(chain.from_iterable(
+                iter(subconfig)
+                for subconfig in self.subconfigs
+            ))
+
+        all_keys = frozenset(index)
+        if self._invalidations == invalidations:
+            self._keys = all_keys
+
         return all_keys
 
+    def fingerprint(self) -> str:
+        """Combine the fingerprints of subconfigs."""
+        return _digest(
+            self.__class__.__qualname__,
+            *(subconfig.fingerprint() for subconfig in self.subconfigs),
+        )
+
     def reload(self):
         """Reload subconfigs."""
-        for subconfig in self.subconfigs:
-            subconfig.reload()
+        with self._batch_changes():
+            for subconfig in self.subconfigs:
+                subconfig.reload()
+
+            if not self._tracks_changes:
+                self._invalidate()
+
+    async def areload(self):
+        """Reload subconfigs concurrently."""
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        with self._batch_changes():
+            await asyncio.gather(*(
+                subconfig.areload()
+                for subconfig in list(self.subconfigs)
+            ))
+
+            if not self._tracks_changes:
+                self._invalidate()
+
+
+class _SubconfigList(list):
+    """A list of subconfigs that notifies the composite configs using it when modified."""
+
+    # Composite configs using this list, created by the first _add_owner()
+    _owners: Optional[weakref.WeakValueDictionary] = None
+
+    def _add_owner(self, owner: CompositeConfig):
+        if self._owners is None:
+            self._owners = weakref.WeakValueDictionary()
+
+        self._owners[id(owner)] = owner
+
+    def _remove_owner(self, owner: CompositeConfig):
+        if self._owners is not None:
+            self._owners.pop(id(owner), None)
+
+    def _changed(self):
+        if self._owners is not None:
+            for owner in list(self._owners.values()):
+                owner._subconfigs_changed()  # pylint: disable=protected-access
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Owners register themselves again when they are restored
+        return {name: value for name, value in self.__dict__.items() if name != '_owners'}
+
+
+def _notifying(method_name: str):
+    method = getattr(list, method_name)
+
+    def _method(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._changed()  # pylint: disable=protected-access
+        return result
+
+    _method.__name__ = method_name
+    return _method
+
+
+for _method_name in (
+    '__setitem__', '__delitem__', '__iadd__', '__imul__',
+    'append', 'extend', 'insert', 'pop', 'remove', 'clear', 'sort', 'reverse',
+):
+    setattr(_SubconfigList, _method_name, _notifying(_method_name))
+del _method_name
 
 
 class ConfigProjection(abc.ABC):  # pragma: no cover
@@ -290,57 +936,389 @@ UPPERCASE_PROJECTION = BasicConfigProjection(
 )
 
 
-class ProjectedConfig(MutableConfig):
-    """Config that renames or filters source config's keys."""
+class ProjectedConfig(MutableConfig):  # pylint: disable=too-many-instance-attributes
+    """Config that renames or filters source config's keys.
+
+    Key translations are memoized, so the projection must always map the same key
+    the same way. At most `max_memoized_keys` translations are kept in each direction,
+    the oldest ones are dropped first. If the source config tracks its changes,
+    the mapping of all keys to source keys is also cached until the source changes
+    or gets reloaded.
+    """
+
+    max_memoized_keys = 10_000
+
+    # Key -> source key for all relevant keys, None if subconfig doesn't track changes
+    _keymap: Any = _STALE
+    _invalidations = 0
+
+    _stats: Optional[ConfigStats] = None
 
     def __init__(self, subconfig: Config, projection: ConfigProjection):
-        self.subconfig = subconfig
         self.projection = projection
+        self.subconfig = subconfig
 
-    def __getitem__(self, key):
-        if not self.projection.is_relevant_key(key):
+    def instrument(self, stats: Optional[ConfigStats] = None) -> ConfigStats:
+        """Start collecting statistics of lookups: accesses and misses by key.
+        Otherwise instrumentation costs a single attribute check per lookup.
+
+        :param stats: Where to collect the statistics, a new `ConfigStats` by default.
+        :return: The stats object.
+        """
+        if stats is None:
+            stats = ConfigStats()
+
+        self._stats = stats
+        return stats
+
+    def uninstrument(self):
+        """Stop collecting statistics."""
+        self._stats = None
+
+    @property
+    def projection(self) -> ConfigProjection:
+        """The projection used to translate keys. Can be replaced at any time."""
+        return self._projection
+
+    @projection.setter
+    def projection(self, projection: ConfigProjection):
+        self._projection = projection
+
+        # Memoized translations, irrelevant keys are mapped to _IRRELEVANT
+        self._sourcekeys_by_key: Dict[str, Any] = {}
+        self._keys_by_sourcekey: Dict[str, Any] = {}
+
+        self._invalidate()
+
+    @property
+    def subconfig(self) -> Config:
+        """The source config. Can be replaced at any time."""
+        return self._subconfig
+
+    @subconfig.setter
+    def subconfig(self, subconfig: Config):
+        self._subconfig = subconfig
+        subconfig._add_dependent(self)  # pylint: disable=protected-access
+        self._invalidate()
+
+    def _restore_sources(self):
+        # Memoized translations refer to markers of this process
+        self.projection = self._projection
+        self.subconfig = self._subconfig
+
+    def _to_sourcekey(self, key: str) -> Any:
+        try:
+            return self._sourcekeys_by_key[key]
+        except KeyError:
+            pass
+
+        sourcekey: Any
+        if self.projection.is_relevant_key(key):
+            sourcekey = self.projection.key_to_sourcekey(key)
+        else:
+            sourcekey = _IRRELEVANT
+
+        _memoize(self._sourcekeys_by_key, key, sourcekey, self.max_memoized_keys)
+        return sourcekey
+
+    def _to_key(self, sourcekey: str) -> Any:
+        try:
+            return self._keys_by_sourcekey[sourcekey]
+        except KeyError:
+            pass
+
+        key: Any
+        if self.projection.is_relevant_sourcekey(sourcekey):
+            key = self.projection.sourcekey_to_key(sourcekey)
+        else:
+            key = _IRRELEVANT
+
+        _memoize(self._keys_by_sourcekey, sourcekey, key, self.max_memoized_keys)
+        return key
+
+    def _relevant_sourcekey(self, key: str) -> str:
+        sourcekey = self._to_sourcekey(key)
+        if sourcekey is _IRRELEVANT:
             raise KeyError(f'Key {key} not relevant')
 
-        sourcekey = self.projection.key_to_sourcekey(key)
+        return sourcekey
+
+    def _invalidate(self, keys=None):
+        self._invalidations += 1
+        self._keymap = _STALE
+
+        if keys is not None:
+            keys = [
+                key
+                for key in map(self._to_key, keys)
+                if key is not _IRRELEVANT
+            ]
+
+        super()._invalidate(keys)
+
+    def _build_keymap(self) -> Optional[Dict[str, str]]:
+        invalidations = self._invalidations
+
+        if self._tracks_changes:
+            keymap: Optional[Dict[str, str]] = {
+                key: sourcekey
+                for sourcekey, key in self._relevant_items()
+            }
+        else:
+            keymap = None
+
+        if self._invalidations == invalidations:
+            self._keymap = keymap
+
+        return keymap
+
+    def _relevant_items(self) -> Iterator[Tuple[str, str]]:
+        """Iterate over (sourcekey, key) pairs of the source config"""
+        for sourcekey in self.subconfig:
+            key = self._to_key(sourcekey)
+            if key is not _IRRELEVANT:
+                yield sourcekey, key
+
+    def __getitem__(self, key):
+        if self._stats is not None:
+            return self._getitem_instrumented(key, self._stats)
+
+        keymap = self._keymap
+        if keymap is _STALE:
+            keymap = self._build_keymap()
+
+        if keymap is None:
+            sourcekey = self._relevant_sourcekey(key)
+        else:
+            try:
+                sourcekey = keymap[key]
+            except KeyError:
+                raise KeyError(f'Key {key} not found') from None
+
         return self.subconfig[sourcekey]
 
+    def _getitem_instrumented(self, key, stats: ConfigStats):
+        try:
+            value = self.subconfig[self._relevant_sourcekey(key)]
+        except KeyError:
+            stats.record_access(key, False)
+            raise
+
+        stats.record_access(key, True)
+        return value
+
     def __setitem__(self, key, value):
         if not isinstance(self.subconfig, MutableConfig):
             raise TypeError('ProjectedConfig\'s subconfig is not mutable')
 
-        if not self.projection.is_relevant_key(key):
-            raise KeyError(f'Key {key} not relevant')
-
-        sourcekey = self.projection.key_to_sourcekey(key)
-        self.subconfig[sourcekey] = value
+        self.subconfig[self._relevant_sourcekey(key)] = value
 
     def __delitem__(self, key):
         if not isinstance(self.subconfig, MutableConfig):
             raise TypeError('ProjectedConfig\'s subconfig is not mutable')
 
-        if not self.projection.is_relevant_key(key):
-            raise KeyError(f'Key {key} not relevant')
-
-        sourcekey = self.projection.key_to_sourcekey(key)
-        del self.subconfig[sourcekey]
+        del self.subconfig[self._relevant_sourcekey(key)]
 
     def __len__(self):
-        return len(list(self._relevant_sourcekeys))
+        keymap = self._keymap
+        if keymap is _STALE:
+            keymap = self._build_keymap()
+
+        if keymap is None:
+            return sum(1 for _ in self._relevant_items())
+
+        return len(keymap)
 
     def __iter__(self):
-        return (
-            self.projection.sourcekey_to_key(sourcekey)
-            for sourcekey in self._relevant_sourcekeys
-        )
+        keymap = self._keymap
+        if keymap is _STALE:
+            keymap = self._build_keymap()
+
+        if keymap is None:
+            return (key for _, key in self._relevant_items())
+
+        return iter(keymap)
 
     @property
-    def _relevant_sourcekeys(self) -> Iterable[str]:
-        return (
-            sourcekey
-            for sourcekey in iter(self.subconfig)
-            if self.projection.is_relevant_sourcekey(sourcekey)
-        )
+    def _tracks_changes(self) -> bool:
+        return self.subconfig._tracks_changes  # pylint: disable=protected-access
 
     def reload(self):
         """Reload the source config."""
-        self.subconfig.reload()
+        with self._batch_changes():
+            self.subconfig.reload()
+
+            if not self._tracks_changes:
+                self._invalidate()
+
+    async def areload(self):
+        """Asynchronous version of reload()."""
+        with self._batch_changes():
+            await self.subconfig.areload()
+
+            if not self._tracks_changes:
+                self._invalidate()
+
+
+def _memoize(memo: Dict[str, Any], key: str, value: Any, max_size: int):
+    """Add a translation to a memo, dropping the oldest one if it's full,
+    so that lookups of arbitrary keys don't grow it without bound."""
+    if len(memo) >= max_size:
+        del memo[next(iter(memo))]
+
+    memo[key] = value
+
+
+class Subscription:
+    """A callback subscribed to changes of config values, see `Config.subscribe`."""
+
+    def __init__(
+        self,
+        registry: _SubscriptionRegistry,
+        callback: Callable[[Any, Any, Any], Any],
+        keys: Iterable[Any],
+        prefixes: Iterable[str],
+    ):
+        self._registry = registry
+        self.callback = callback
+        self.keys = frozenset(keys)
+        self.prefixes = tuple(prefixes)
+        self.all_keys = not self.keys and not self.prefixes
+
+    def matches(self, key: Any) -> bool:
+        """Whether this subscription watches *key*"""
+        return (
+            self.all_keys
+            or key in self.keys
+            or (isinstance(key, str) and key.startswith(self.prefixes))
+        )
+
+    def cancel(self):
+        """Stop calling the callback."""
+        self._registry.remove(self)
+
+
+class _SubscriptionRegistry:
+    """Subscriptions of one config, indexed so that dispatching scales with changed keys,
+    along with the last seen values of watched keys."""
+
+    def __init__(self):
+        self.by_key: Dict[Any, List[Subscription]] = {}
+        self.by_prefix: List[Subscription] = []
+        self.last_values: Dict[Any, Any] = {}
+
+    def __bool__(self):
+        return bool(self.by_key or self.by_prefix)
+
+    def add(self, config: Config, subscription: Subscription):
+        for key in subscription.keys:
+            self.by_key.setdefault(key, []).append(subscription)
+            self._remember(key, _current_value(config, key))
+
+        if subscription.prefixes or subscription.all_keys:
+            self.by_prefix.append(subscription)
+            for key in config:
+                if subscription.matches(key):
+                    self._remember(key, _current_value(config, key))
+
+    def remove(self, subscription: Subscription):
+        for key in subscription.keys:
+            subscriptions = self.by_key.get(key, [])
+            if subscription in subscriptions:
+                subscriptions.remove(subscription)
+            if not subscriptions:
+                self.by_key.pop(key, None)
+
+        if subscription in self.by_prefix:
+            self.by_prefix.remove(subscription)
+
+        for key in list(self.last_values):
+            if not self._subscriptions_for(key):
+                del self.last_values[key]
+
+    def _remember(self, key, value):
+        if value is MISSING:
+            self.last_values.pop(key, None)
+        else:
+            self.last_values[key] = value
+
+    def _subscriptions_for(self, key) -> List[Subscription]:
+        subscriptions = list(self.by_key.get(key, ()))
+        for subscription in self.by_prefix:
+            if subscription.matches(key):
+                subscriptions.append(subscription)
+
+        return subscriptions
+
+    def dispatch(self, config: Config, keys: Optional[Collection]):
+        """Call subscribers of keys whose values have changed.
+
+        :param keys: Keys that may have changed, None if unknown.
+        """
+        if keys is None:
+            # Check everything we've seen, plus new keys matching the prefixes
+            keys = set(self.last_values)
+            if self.by_prefix:
+                keys.update(
+                    key
+                    for key in config
+                    if any(subscription.matches(key) for subscription in self.by_prefix)
+                )
+
+        for key in keys:
+            subscriptions = self._subscriptions_for(key)
+            if not subscriptions:
+                continue
+
+            try:
+                new_value = _current_value(config, key)
+            except ValidationError:
+                # Invalid values are not reported, subscribers get called
+                # once the value becomes valid again
+                continue
+
+            old_value = self.last_values.get(key, MISSING)
+            if new_value is old_value or new_value == old_value:
+                continue
+
+            self._remember(key, new_value)
+            for subscription in subscriptions:
+                subscription.callback(key, old_value, new_value)
+
+
+def _current_value(config: Config, key: Any) -> Any:
+    try:
+        return config[key]
+    except KeyError:
+        return MISSING
+
+
+def _pack_values(keys: Tuple[Any, ...], values: List[Any], default: Any, named: bool) -> tuple:
+    """Build the result of get_many() from looked up values, MISSING for absent ones."""
+    for i, value in enumerate(values):
+        if value is MISSING:
+            if default is MISSING:
+                raise KeyError(f'Key {keys[i]} not found')
+
+            values[i] = default
+
+    if named:
+        return _namedtuple_class(keys)(*values)
+
+    return tuple(values)
+
+
+@functools.lru_cache(maxsize=256)
+def _namedtuple_class(keys: Tuple[str, ...]) -> type:
+    return collections.namedtuple('ConfigValues', keys)  # type: ignore
+
+
+def _digest(*parts: str) -> str:
+    import hashlib  # pylint: disable=import-outside-toplevel
+
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode('utf-8', 'surrogatepass'))
+        digest.update(b'\0')
+
+    return digest.hexdigest()
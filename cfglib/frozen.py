@@ -0,0 +1,187 @@
+"""Immutable, hashable snapshots of validated configs."""
+from __future__ import annotations
+
+import collections.abc
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Mapping, Tuple, Type
+
+from .config import MISSING, Config
+
+if TYPE_CHECKING:
+    from .spec import SpecValidatedConfig
+
+
+__all__ = [
+    'FrozenConfig',
+    'FrozenDict',
+]
+
+
+class FrozenDict(dict):
+    """A hashable dict that can't be modified, used for mapping values of frozen configs."""
+
+    __slots__ = ('_hash',)
+
+    def __hash__(self):
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(frozenset(self.items()))
+            return self._hash
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError(f'{self.__class__.__name__} is immutable')
+
+    __setitem__ = __delitem__ = __ior__ = _immutable  # type: ignore
+    clear = pop = popitem = setdefault = update = _immutable  # type: ignore
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+    def __repr__(self):
+        return f'FrozenDict({dict.__repr__(self)})'
+
+
+class FrozenConfig:
+    """Base class of the immutable config classes generated for each spec,
+    see `SpecValidatedConfig.freeze()`.
+
+    Settings are stored in `__slots__`, so attribute access is a plain slot read.
+    Missing settings are left unset and raise AttributeError (or KeyError with indexing).
+    The hash is computed on creation, and equality compares the hashes first.
+
+    Like with namedtuples, the API that isn't settings starts with an underscore:
+    `_fields` and `_asdict()`. Frozen configs also support `cfg['name']`, `in`,
+    iteration over the names of present settings and len().
+    """
+
+    __slots__ = ('_hash',)
+
+    _fields: Tuple[str, ...] = ()
+    """Names of all settings."""
+
+    # The SpecValidatedConfig subclass, set on subclasses
+    _config_class: Type[SpecValidatedConfig]  # pylint: disable=declare-non-slot
+
+    @classmethod
+    def _make(cls, values: Mapping[str, Any]):
+        """Create an instance from validated values, MISSING for absent settings."""
+        instance = object.__new__(cls)
+        hash_values = []
+        for name in cls._fields:
+            value = values.get(name, MISSING)
+            if value is not MISSING:
+                value = freeze_value(value)
+                _set_slot(instance, name, value)
+
+            hash_values.append(value)
+
+        _set_slot(instance, '_hash', hash((cls, tuple(hash_values))))
+        return instance
+
+    def _asdict(self) -> Dict[str, Any]:
+        """Values of present settings by name."""
+        return {
+            name: getattr(self, name)
+            for name in self._fields
+            if hasattr(self, name)
+        }
+
+    def __getitem__(self, item):
+        if item in self._fields:
+            try:
+                return getattr(self, item)
+            except AttributeError:
+                pass
+
+        raise KeyError(f'Key {item} not found')
+
+    def __contains__(self, item):
+        return item in self._fields and hasattr(self, item)
+
+    def __iter__(self):
+        return (name for name in self._fields if hasattr(self, name))
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __hash__(self):
+        return self._hash  # pylint: disable=no-member
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        if other._hash != self._hash:  # pylint: disable=no-member
+            return False
+
+        return all(
+            getattr(self, name, MISSING) == getattr(other, name, MISSING)
+            for name in self._fields
+        )
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'{self.__class__.__name__} is frozen')
+
+    def __delattr__(self, name):
+        raise AttributeError(f'{self.__class__.__name__} is frozen')
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return _restore_frozen_config, (self._config_class, self._asdict())
+
+    def __repr__(self):
+        values = ', '.join(f'{name}={value!r}' for name, value in self._asdict().items())
+        return f'{self.__class__.__name__}({values})'
+
+
+def frozen_class(config_class: type, setting_names: Iterable[str]) -> Type[FrozenConfig]:
+    """Generate a FrozenConfig subclass with a slot for each setting."""
+    fields = tuple(setting_names)
+    for name in fields:
+        if not isinstance(name, str) or not name.isidentifier() or name.startswith('_'):
+            raise ValueError(
+                f'Can\'t freeze {config_class.__name__}: setting name {name!r}'
+                f' is not an identifier or starts with an underscore'
+            )
+
+    return type(f'Frozen{config_class.__name__}', (FrozenConfig,), {
+        '__slots__': fields,
+        '__module__': config_class.__module__,
+        '__qualname__': f'Frozen{config_class.__qualname__}',
+        '_fields': fields,
+        '_config_class': config_class,
+    })
+
+
+def freeze_value(value: Any) -> Any:
+    """Convert a validated value to an immutable, hashable one: nested spec-validated configs
+    are frozen, mappings become FrozenDicts and lists become tuples."""
+    if isinstance(value, (str, bytes, int, float, bool, type(None), FrozenConfig)):
+        return value
+    elif isinstance(value, Config) and hasattr(value, 'freeze'):
+        return value.freeze()  # type: ignore
+    elif isinstance(value, collections.abc.Mapping):
+        return FrozenDict({key: freeze_value(item) for key, item in value.items()})
+    elif isinstance(value, (list, tuple)):
+        return tuple(freeze_value(item) for item in value)
+    elif isinstance(value, (set, frozenset)):
+        return frozenset(freeze_value(item) for item in value)
+
+    return value
+
+
+def _set_slot(instance: FrozenConfig, name: str, value: Any):
+    # Bypass __setattr__ of frozen configs
+    object.__setattr__(instance, name, value)
+
+
+def _restore_frozen_config(
+    config_class: Type[SpecValidatedConfig],
+    values: Dict[str, Any],
+) -> FrozenConfig:
+    return config_class._frozen_class()._make(values)  # pylint: disable=protected-access
@@ -1 +1,44 @@
-"""Configs that take values from external sources."""
+# Names in __all__ are defined on first access by __getattr__
+# pylint: disable=undefined-all-variable
+"""Configs that take values from external sources.
+
+Source classes can be imported from their submodules or from this package, e.g.
+`from cfglib.sources import EnvConfig`; submodules are only imported when first used.
+"""
+import importlib
+
+
+# Source classes by name -> submodule
+_LAZY_ATTRIBUTES = {
+    'AsyncSourceConfig': 'aio',
+    'ArgsNamespaceConfig': 'args',
+    'ArgsNamespaceConfigProjection': 'args',
+    'EnvConfig': 'env',
+    'EnvConfigProjection': 'env',
+    'FileConfig': 'file',
+    'JsonFileConfig': 'file',
+    'TomlFileConfig': 'file',
+    'HttpConfig': 'http',
+    'HttpConfigError': 'http',
+    'SnapshotPublisher': 'shared',
+    'SharedSnapshotConfig': 'shared',
+    'default_snapshot_path': 'shared',
+    'FileWatcher': 'watch',
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY_ATTRIBUTES.keys())
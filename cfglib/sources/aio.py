@@ -0,0 +1,56 @@
+"""A protocol for configs that load their contents asynchronously."""
+from __future__ import annotations
+
+import abc
+import asyncio
+from typing import Mapping, Optional
+
+from ..config import ConfigDiff, DictConfig
+
+
+# pylint: disable=too-many-ancestors
+class AsyncSourceConfig(DictConfig):
+    """Base class for configs that load their contents asynchronously, e.g. over the network.
+
+    Subclasses implement fetch(). The config is empty until it's reloaded for the first time,
+    use `await config.areload()` or `await SomeSourceConfig(...).loaded()`.
+
+    Such configs can be used as layers of a `CompositeConfig` or `SpecValidatedConfig`,
+    whose areload() reloads all async layers concurrently.
+    """
+
+    @abc.abstractmethod
+    async def fetch(self) -> Optional[Mapping]:
+        """Load the contents. Return None if they are known to be unchanged since the last fetch."""
+        ...  # pragma: no cover
+
+    async def loaded(self) -> AsyncSourceConfig:
+        """Reload this config and return it."""
+        await self.areload()
+        return self
+
+    async def areload(self) -> ConfigDiff:
+        """Fetch the contents and update the config.
+
+        :return: The differences between the old and the new contents.
+        """
+        contents = await self.fetch()
+        if contents is None:
+            return ConfigDiff()
+
+        return self.replace(contents)
+
+    def reload(self) -> ConfigDiff:
+        """Run areload() in a new event loop.
+
+        Can't be called from a running event loop, use areload() there instead.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.areload())
+
+        raise RuntimeError(
+            f'{self.__class__.__name__}.reload() called from a running event loop,'
+            f' use areload() instead'
+        )
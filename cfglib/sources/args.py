@@ -1,7 +1,7 @@
 from collections import abc as collections_abc
-from typing import *
+from typing import Container, Iterable, Optional
 
-from ..config import ConfigProjection, ProjectedConfig, ProxyConfig
+from ..config import ConfigProjection, DictConfig, ProjectedConfig
 from ..spec import MISSING
 
 
@@ -17,7 +17,7 @@ class ArgsNamespaceConfig(ProjectedConfig):
     ):
         projection = ArgsNamespaceConfigProjection(uppercase, relevant_keys)
         args_data = {k: v for k, v in args.__dict__.items() if v is not MISSING}
-        super().__init__(ProxyConfig(args_data), projection)
+        super().__init__(DictConfig(args_data), projection)
 
 
 class _Universe(collections_abc.Container):
@@ -1,16 +1,62 @@
+from __future__ import annotations
+
 import os
+from typing import Dict
 
-from ..config import ConfigProjection, ProjectedConfig, ProxyConfig
+from ..config import ConfigProjection, DictConfig, ProjectedConfig, ProxyConfig
 
 
 # pylint: disable=too-many-ancestors
 class EnvConfig(ProjectedConfig):
-    """A config that takes its contents from the environment."""
+    """A config that takes its contents from the environment.
+
+    :param prefix: Only variables starting with the prefix are used, with the prefix removed.
+    :param lowercase: Only use uppercase variables and make their names lowercase.
+    :param live: Whether to read the live environment on every access.
+        If False, the relevant variables are copied on initialization and on reload(),
+        and reads never touch os.environ. Writes still go to the environment.
+    """
 
-    def __init__(self, prefix: str = '', lowercase: bool = False):
+    def __init__(self, prefix: str = '', lowercase: bool = False, live: bool = True):
         projection = EnvConfigProjection(prefix, lowercase)
+        self.live = live
+
+        if live:
+            super().__init__(ProxyConfig(os.environ), projection)
+        else:
+            super().__init__(DictConfig(_read_environ(projection)), projection)
+
+    def __setitem__(self, key, value):
+        if not self.live:
+            os.environ[self._relevant_sourcekey(key)] = value
+
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        if not self.live:
+            os.environ.pop(self._relevant_sourcekey(key), None)
+
+        super().__delitem__(key)
+
+    def reload(self):
+        """Copy the environment again if not live, otherwise do nothing."""
+        if self.live:
+            super().reload()
+            return
+
+        self.subconfig.replace(_read_environ(self.projection))  # type: ignore
+
+    async def areload(self):
+        """Same as reload(), which doesn't block."""
+        self.reload()
+
 
-        super().__init__(ProxyConfig(os.environ), projection)
+def _read_environ(projection: EnvConfigProjection) -> Dict[str, str]:
+    return {
+        sourcekey: value
+        for sourcekey, value in os.environ.items()
+        if projection.is_relevant_sourcekey(sourcekey)
+    }
 
 
 class EnvConfigProjection(ConfigProjection):
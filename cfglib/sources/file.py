@@ -0,0 +1,107 @@
+"""Configs that take their contents from files."""
+from __future__ import annotations
+
+import abc
+import asyncio
+import json
+import os
+from typing import Mapping, Optional, Tuple, Union
+
+from ..config import ConfigDiff, DictConfig, _digest
+
+try:
+    import tomllib  # type: ignore
+except ImportError:  # pragma: no cover
+    tomllib = None  # type: ignore
+
+
+# pylint: disable=too-many-ancestors
+class FileConfig(DictConfig):
+    """A config that takes its contents from a file.
+
+    The file is read on initialization and on reload(). Reloading costs a single
+    stat call if the file's modification time, size and inode are unchanged.
+
+    :param path: Path to the file.
+    :param required: Whether the file must exist. A missing optional file gives an empty config.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], required: bool = True):
+        super().__init__()
+
+        self.path = os.fspath(path)
+        self.required = required
+        self._stat_key: Optional[Tuple[int, int, int]] = None
+
+        self.reload()
+
+    @abc.abstractmethod
+    def parse(self, data: bytes) -> Mapping:
+        """Parse file contents into a mapping."""
+        ...  # pragma: no cover
+
+    def reload(self) -> ConfigDiff:
+        """Reread the file if it has changed.
+
+        :return: The differences between the old and the new contents.
+        """
+        try:
+            if _stat_key(os.stat(self.path)) == self._stat_key:
+                return ConfigDiff()
+
+            with open(self.path, 'rb') as file:
+                stat_key = _stat_key(os.fstat(file.fileno()))
+                data = file.read()
+        except FileNotFoundError:
+            if self.required:
+                raise
+
+            self._stat_key = None
+            return self.replace({})
+
+        contents = self.parse(data)
+        if not isinstance(contents, Mapping):
+            raise ValueError(f'Config file {self.path} must contain a mapping at the top level')
+
+        self._stat_key = stat_key
+        return self.replace(contents)
+
+    def fingerprint(self) -> str:
+        """Identify the contents by the path, modification time, size and inode
+        of the file they were loaded from."""
+        if self._stat_key is None:
+            return super().fingerprint()
+
+        return _digest(self.__class__.__qualname__, self.path, repr(self._stat_key))
+
+    async def areload(self) -> ConfigDiff:
+        """Same as reload(), but the file is read in the default executor
+        so that the event loop isn't blocked."""
+        return await asyncio.get_running_loop().run_in_executor(None, self.reload)
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} {self.path} {dict(self)}>'
+
+
+class JsonFileConfig(FileConfig):
+    """A config that takes its contents from a JSON file."""
+
+    def parse(self, data: bytes) -> Mapping:
+        return json.loads(data)
+
+
+class TomlFileConfig(FileConfig):
+    """A config that takes its contents from a TOML file. Requires Python 3.11+."""
+
+    def __init__(self, path: Union[str, os.PathLike], required: bool = True):
+        if tomllib is None:  # pragma: no cover
+            raise ImportError('TomlFileConfig requires tomllib (Python 3.11+)')
+
+        super().__init__(path, required)
+
+    def parse(self, data: bytes) -> Mapping:
+        return tomllib.loads(data.decode('utf-8'))
+
+
+def _stat_key(stat: os.stat_result) -> Tuple[int, int, int]:
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
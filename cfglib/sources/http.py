@@ -0,0 +1,225 @@
+"""A config that takes its contents from a JSON document served over HTTP."""
+from __future__ import annotations
+
+import asyncio
+import http.client
+import json
+import threading
+import time
+import urllib.parse
+from typing import Dict, Mapping, Optional, Tuple
+
+from ..config import ConfigDiff, DictConfig
+
+
+class HttpConfigError(Exception):
+    """Raised when an HttpConfig fails to load its document"""
+    pass
+
+
+# pylint: disable=too-many-ancestors,too-many-instance-attributes
+class HttpConfig(DictConfig):
+    """A config that loads a JSON object from an HTTP endpoint, e.g. a config service.
+
+    One keep-alive connection is reused across reloads, and requests are conditional
+    (If-None-Match/If-Modified-Since), so a 304 response skips parsing entirely
+    and leaves the config untouched.
+
+    :param url: http:// or https:// URL of the document.
+    :param timeout: Timeout of a request in seconds.
+    :param stale_on_error: Whether to keep the last loaded contents if a reload fails
+        (the error is stored in `last_error`). The first load always raises on errors.
+    :param headers: Additional request headers.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        timeout: float = 5.0,
+        stale_on_error: bool = True,
+        headers: Optional[Mapping[str, str]] = None,
+    ):
+        super().__init__()
+
+        parsed_url = urllib.parse.urlsplit(url)
+        if parsed_url.scheme not in ('http', 'https'):
+            raise ValueError(f'Unsupported URL scheme: {url}')
+        if not parsed_url.hostname:
+            raise ValueError(f'URL without a host: {url}')
+
+        self.url = url
+        self.timeout = timeout
+        self.stale_on_error = stale_on_error
+        self.headers = dict(headers or {})
+        self.last_error: Optional[Exception] = None
+
+        self._parsed_url = parsed_url
+        self._host: str = parsed_url.hostname
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self._loaded = False
+        self._connection: Optional[http.client.HTTPConnection] = None
+        self._lock = threading.Lock()
+        # Guards the validators (ETag/Last-Modified) together with the contents
+        self._update_lock = threading.Lock()
+        self._watch_thread: Optional[threading.Thread] = None
+        self._watch_stop = threading.Event()
+
+        self.reload()
+
+    def reload(self) -> ConfigDiff:
+        """Request the document, if it has changed update the config.
+
+        :return: The differences between the old and the new contents.
+        """
+        with self._lock:
+            if self._connection is None:
+                self._connection = self._connect(self.timeout)
+
+            return self._load(self._connection, {})
+
+    async def areload(self) -> ConfigDiff:
+        """Same as reload(), but the request is done in the default executor
+        so that the event loop isn't blocked."""
+        return await asyncio.get_running_loop().run_in_executor(None, self.reload)
+
+    def watch(self, wait: float = 30.0) -> ConfigDiff:
+        """Long-poll the endpoint: ask the server to hold the request for up to *wait* seconds
+        until the document changes (with a `Prefer: wait=N` header), then update the config.
+
+        Servers that don't support long polling simply respond immediately.
+        Uses its own connection, so it doesn't block reload() in other threads.
+        """
+        connection = self._connect(self.timeout + wait)
+        try:
+            return self._load(connection, {'Prefer': f'wait={int(wait)}'})
+        finally:
+            connection.close()
+
+    def start_watching(self, wait: float = 30.0, min_interval: float = 1.0):
+        """Keep long-polling the endpoint in a background daemon thread,
+        so that changes are pushed to the config as soon as the server reports them.
+
+        :param wait: How long the server is asked to hold each request.
+        :param min_interval: Minimum time in seconds between the starts of two requests,
+            so that servers that don't support long polling aren't flooded with requests.
+        """
+        if self._watch_thread is not None:
+            raise RuntimeError('HttpConfig is already being watched')
+
+        self._watch_stop.clear()
+        self._watch_thread = threading.Thread(
+            target=self._watch_loop,
+            args=(wait, min_interval),
+            name=f'cfglib-http-watch {self.url}',
+            daemon=True,
+        )
+        self._watch_thread.start()
+
+    def stop_watching(self):
+        """Stop the background thread started by start_watching() after its current request."""
+        self._watch_stop.set()
+        if self._watch_thread is not None:
+            self._watch_thread.join()
+            self._watch_thread = None
+
+    def close(self):
+        """Stop watching and close the connection."""
+        self.stop_watching()
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _watch_loop(self, wait: float, min_interval: float):
+        while not self._watch_stop.is_set():
+            started = time.monotonic()
+            try:
+                self.watch(wait)
+            except Exception as exc:  # pylint: disable=broad-except
+                self.last_error = exc
+
+            if self.last_error is not None:
+                # Don't spin if the server is down
+                self._watch_stop.wait(self.timeout)
+            else:
+                # Nor if it responds immediately
+                self._watch_stop.wait(max(0.0, min_interval - (time.monotonic() - started)))
+
+    def _connect(self, timeout: float) -> http.client.HTTPConnection:
+        connection_class = (
+            http.client.HTTPSConnection
+            if self._parsed_url.scheme == 'https'
+            else http.client.HTTPConnection
+        )
+        return connection_class(
+            self._host,
+            self._parsed_url.port,
+            timeout=timeout,
+        )
+
+    def _load(self, connection: http.client.HTTPConnection, headers: Dict[str, str]) -> ConfigDiff:
+        try:
+            response = self._request(connection, headers)
+        except (OSError, http.client.HTTPException, HttpConfigError, ValueError) as exc:
+            connection.close()
+            if not self._loaded or not self.stale_on_error:
+                raise
+
+            self.last_error = exc
+            return ConfigDiff()
+
+        self.last_error = None
+        if response is None:
+            return ConfigDiff()
+
+        # reload() and watch() may load concurrently,
+        # the validators must always match the contents they were sent with
+        contents, etag, last_modified = response
+        with self._update_lock:
+            self._etag = etag
+            self._last_modified = last_modified
+            self._loaded = True
+            return self.replace(contents)
+
+    def _request(
+        self,
+        connection: http.client.HTTPConnection,
+        headers: Dict[str, str],
+    ) -> Optional[Tuple[Mapping, Optional[str], Optional[str]]]:
+        """Do a conditional request, return None if the document hasn't changed,
+        otherwise the document with its ETag and Last-Modified headers."""
+        headers = {**self.headers, **headers, 'Accept': 'application/json'}
+        if self._etag is not None:
+            headers['If-None-Match'] = self._etag
+        if self._last_modified is not None:
+            headers['If-Modified-Since'] = self._last_modified
+
+        path = self._parsed_url.path or '/'
+        if self._parsed_url.query:
+            path = f'{path}?{self._parsed_url.query}'
+
+        try:
+            connection.request('GET', path, headers=headers)
+            response = connection.getresponse()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            # The server closed the idle keep-alive connection, retry once on a new one
+            connection.close()
+            connection.request('GET', path, headers=headers)
+            response = connection.getresponse()
+
+        body = response.read()
+        if response.status == 304:
+            return None
+
+        if response.status != 200:
+            raise HttpConfigError(f'Unexpected response from {self.url}: {response.status}')
+
+        contents = json.loads(body)
+        if not isinstance(contents, Mapping):
+            raise HttpConfigError(f'Document at {self.url} must be a JSON object')
+
+        return contents, response.getheader('ETag'), response.getheader('Last-Modified')
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} {self.url} {dict(self)}>'
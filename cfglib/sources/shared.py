@@ -0,0 +1,371 @@
+"""Validated config snapshots shared between processes, e.g. pre-fork worker pools."""
+from __future__ import annotations
+
+import mmap
+import os
+import pickle
+import stat
+import struct
+import tempfile
+import threading
+import time
+from typing import Any, Collection, Optional, Tuple, Union
+
+from ..config import MISSING, Config, ConfigDiff, DictConfig
+from ..spec import SpecValidatedConfig
+
+
+# Header: magic, generation, payload length. The generation is odd while a snapshot
+# is being written, readers retry until they see the same even generation twice.
+_HEADER = struct.Struct('<8sQQ')
+_GENERATION = struct.Struct('<Q')
+_GENERATION_OFFSET = 8
+_MAGIC = b'CFGSNAP1'
+
+
+def default_snapshot_path(name: str) -> str:
+    """A path for a snapshot file in a directory private to the current user,
+    in /dev/shm if it exists so that it never touches a disk.
+
+    Snapshots are unpickled, so they must not be writable by other users.
+    Workers running as another user can't access the directory:
+    pass a path in a directory that only trusted users can write to instead.
+    """
+    base_directory = '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+    if not hasattr(os, 'getuid'):
+        return os.path.join(base_directory, f'cfglib-{name}.snapshot')
+
+    directory = os.path.join(base_directory, f'cfglib-{os.getuid()}')
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        pass
+
+    # Another user might have created it first
+    info = os.lstat(directory)
+    if (
+        not stat.S_ISDIR(info.st_mode)
+        or info.st_uid != os.getuid()
+        or stat.S_IMODE(info.st_mode) & 0o077
+    ):
+        raise PermissionError(f'{directory} is not a private directory of the current user')
+
+    return os.path.join(directory, f'{name}.snapshot')
+
+
+class SnapshotPublisher:
+    """Publishes validated snapshots of a config to a memory-mapped file.
+
+    Intended for pre-fork servers: the master process loads and validates the config once
+    and publishes it, workers attach with `SharedSnapshotConfig` and only pick up new
+    generations, without reading sources or validating anything themselves.
+
+    Values are stored as plain data: nested configs become dicts.
+    Only one publisher may write to a path at a time. A publisher that replaces
+    a previous one (e.g. after a restart) writes to the same file, so that attached
+    workers see its snapshots.
+
+    Snapshots are pickled, so the file must only be writable by trusted users:
+    it's created with *mode*, and `SharedSnapshotConfig` refuses files that other
+    users can write to.
+
+    :param config: The config to publish, usually a `SpecValidatedConfig`.
+    :param path: Path to the snapshot file, see `default_snapshot_path`.
+    :param mode: Permissions of the snapshot file, e.g. 0o640 for workers
+        running as another user of the same group. Must not be writable by others.
+
+    Example:
+
+    .. code-block:: python
+
+        # In the master
+        publisher = SnapshotPublisher(ToolConfig(...), default_snapshot_path('tool'))
+
+        # On SIGHUP
+        publisher.config.reload()
+        publisher.publish()
+
+        # In workers
+        cfg = SharedSnapshotConfig(default_snapshot_path('tool'))
+        ...
+        cfg.reload()  # Cheap if nothing was published
+    """
+
+    def __init__(self, config: Config, path: Union[str, os.PathLike], mode: int = 0o600):
+        if mode & 0o022:
+            raise ValueError('Snapshot files must not be writable by group or others')
+
+        self.config = config
+        self.path = os.fspath(path)
+
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._mmap: Optional[mmap.mmap] = None
+
+        payload = _dump_snapshot(config)
+        if self._map_existing(mode):
+            # Readers attached to the file keep working, generations continue from its own
+            with self._lock:
+                self._write(payload)
+            return
+
+        # Readers must never see a partially initialized file, so the first snapshot
+        # is written to a temporary file that replaces the old one
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.cfglib-snapshot-')
+        try:
+            # mkstemp() creates files only accessible to the current user
+            if hasattr(os, 'fchmod'):
+                os.fchmod(fd, mode)
+
+            with os.fdopen(fd, 'wb') as file:
+                file.write(_HEADER.pack(_MAGIC, 0, len(payload)))
+                file.write(payload)
+
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        self._map(_HEADER.size + len(payload))
+
+    @property
+    def generation(self) -> int:
+        """The generation of the last published snapshot."""
+        return self._generation
+
+    def publish(self) -> int:
+        """Publish a snapshot of the config's current values.
+
+        :return: The new generation.
+        """
+        payload = _dump_snapshot(self.config)
+
+        with self._lock:
+            if self._mmap is None:
+                raise ValueError('SnapshotPublisher is closed')
+
+            return self._write(payload)
+
+    def _write(self, payload: bytes) -> int:
+        assert self._mmap is not None
+        generation = self._generation
+        self._write_generation(generation + 1)
+
+        size = _HEADER.size + len(payload)
+        if size > len(self._mmap):
+            # Readers remap when they see a payload that doesn't fit their mapping
+            self._mmap.close()
+            self._map(size)
+
+        self._mmap[_HEADER.size:size] = payload
+        self._mmap[:_HEADER.size] = _HEADER.pack(_MAGIC, generation + 1, len(payload))
+        self._write_generation(generation + 2)
+
+        self._generation = generation + 2
+        return self._generation
+
+    def close(self):
+        """Unmap the file. The file itself is left for workers that are still attached."""
+        with self._lock:
+            if self._mmap is not None:
+                self._mmap.close()
+                self._mmap = None
+
+    def unlink(self):
+        """Close and remove the snapshot file."""
+        self.close()
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self) -> SnapshotPublisher:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _map_existing(self, mode: int) -> bool:
+        """Map an existing snapshot file of the current user, return whether there is one."""
+        if not hasattr(os, 'getuid'):
+            return False  # pragma: no cover
+
+        try:
+            file = open(self.path, 'r+b')  # pylint: disable=consider-using-with
+        except OSError:
+            return False
+
+        with file:
+            info = os.fstat(file.fileno())
+            if (
+                not stat.S_ISREG(info.st_mode)
+                or info.st_uid != os.getuid()
+                or info.st_size < _HEADER.size
+                or file.read(len(_MAGIC)) != _MAGIC
+            ):
+                return False
+
+            os.fchmod(file.fileno(), mode)
+            self._mmap = mmap.mmap(file.fileno(), 0)
+
+        # A publisher that died while writing leaves an odd generation
+        generation = _GENERATION.unpack_from(self._mmap, _GENERATION_OFFSET)[0]
+        self._generation = generation + generation % 2
+        return True
+
+    def _map(self, size: int):
+        with open(self.path, 'r+b') as file:
+            if os.fstat(file.fileno()).st_size < size:
+                file.truncate(size)
+
+            self._mmap = mmap.mmap(file.fileno(), 0)
+
+    def _write_generation(self, generation: int):
+        _GENERATION.pack_into(self._mmap, _GENERATION_OFFSET, generation)  # type: ignore
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} {self.path} generation={self._generation}>'
+
+
+# pylint: disable=too-many-ancestors
+class SharedSnapshotConfig(DictConfig):
+    """A config that takes its contents from snapshots published by a `SnapshotPublisher`,
+    possibly in another process.
+
+    reload() reads a single counter from shared memory, and only unpickles the snapshot
+    if a new generation has been published since.
+
+    Snapshots are unpickled, so the file is checked to belong to a trusted user
+    and not to be writable by group or others, otherwise PermissionError is raised.
+
+    :param path: Path to the snapshot file.
+    :param owners: User IDs that may own the snapshot file,
+        by default the current user and root.
+    :param timeout: How long reload() waits for the publisher to finish writing
+        a snapshot before raising TimeoutError, e.g. if the publisher died meanwhile.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        owners: Optional[Collection[int]] = None,
+        timeout: float = 1.0,
+    ):
+        super().__init__()
+
+        self.path = os.fspath(path)
+        self.timeout = timeout
+        if owners is None and hasattr(os, 'getuid'):
+            owners = {os.getuid(), 0}
+        self.owners = owners
+        self._generation: Optional[int] = None
+        self._lock = threading.Lock()
+        self._mmap = self._map()
+
+        self.reload()
+
+    @property
+    def generation(self) -> Optional[int]:
+        """The generation of the currently loaded snapshot."""
+        return self._generation
+
+    @property
+    def is_stale(self) -> bool:
+        """Whether a newer generation has been published, without loading it."""
+        return self._read_generation() != self._generation
+
+    def reload(self) -> ConfigDiff:
+        """Load the latest snapshot if it's newer than the loaded one.
+
+        :return: The differences between the old and the new contents.
+        """
+        with self._lock:
+            if self._read_generation() == self._generation:
+                return ConfigDiff()
+
+            generation, payload = self._read_snapshot()
+            contents = pickle.loads(payload)
+            self._generation = generation
+            return self.replace(contents)
+
+    def close(self):
+        """Unmap the file, the config keeps its current contents."""
+        with self._lock:
+            self._mmap.close()
+
+    def _map(self) -> mmap.mmap:
+        with open(self.path, 'rb') as file:
+            self._check_file(os.fstat(file.fileno()))
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if mapped[:len(_MAGIC)] != _MAGIC:
+            mapped.close()
+            raise ValueError(f'{self.path} is not a config snapshot')
+
+        return mapped
+
+    def _check_file(self, info: os.stat_result):
+        if not hasattr(os, 'getuid'):
+            # No POSIX permissions to check
+            return  # pragma: no cover
+
+        if self.owners is not None and info.st_uid not in self.owners:
+            raise PermissionError(f'{self.path} belongs to an untrusted user {info.st_uid}')
+
+        if stat.S_IMODE(info.st_mode) & 0o022:
+            raise PermissionError(f'{self.path} is writable by group or others')
+
+    def _read_generation(self) -> int:
+        return _GENERATION.unpack_from(self._mmap, _GENERATION_OFFSET)[0]
+
+    def _read_snapshot(self) -> Tuple[int, bytes]:
+        deadline = time.monotonic() + self.timeout
+        while True:
+            _magic, generation, length = _HEADER.unpack_from(self._mmap)
+            if generation % 2:
+                # The publisher is in the middle of writing
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f'Publisher of {self.path} didn\'t finish writing')
+
+                time.sleep(0)
+                continue
+
+            if _HEADER.size + length > len(self._mmap):
+                self._mmap.close()
+                self._mmap = self._map()
+                continue
+
+            payload = self._mmap[_HEADER.size:_HEADER.size + length]
+            if self._read_generation() == generation:
+                return generation, payload
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} {self.path} {dict(self)}>'
+
+
+def _dump_snapshot(config: Config) -> bytes:
+    if isinstance(config, SpecValidatedConfig):
+        values = config.validate()
+    else:
+        values = dict(config)
+
+    return pickle.dumps(
+        {key: _to_plain(value) for key, value in values.items() if value is not MISSING},
+        protocol=pickle.HIGHEST_PROTOCOL,
+    )
+
+
+def _to_plain(value: Any) -> Any:
+    if isinstance(value, SpecValidatedConfig):
+        return {
+            key: _to_plain(item)
+            for key, item in value.validate().items()
+            if item is not MISSING
+        }
+    elif isinstance(value, Config):
+        return {key: _to_plain(item) for key, item in value.items()}
+    elif isinstance(value, list):
+        return [_to_plain(item) for item in value]
+
+    return value
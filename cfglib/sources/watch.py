@@ -0,0 +1,324 @@
+"""Automatic reloading of file configs when their files change."""
+from __future__ import annotations
+
+import ctypes
+import errno
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Set
+
+from .file import FileConfig
+
+
+logger = logging.getLogger(__name__)
+
+
+# inotify(7) constants
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+
+_WATCH_MASK = (
+    _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO
+    | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF | _IN_MOVE_SELF
+)
+_EVENT_HEADER = struct.Struct('iIII')
+
+
+class FileWatcher:  # pylint: disable=too-many-instance-attributes
+    """Watches the files behind file configs and reloads a config when its file changes.
+
+    Only the affected config is reloaded; configs built on top of it (composite stacks,
+    SpecValidatedConfig) are notified of the change as usual.
+
+    Directories containing the files are watched rather than the files themselves,
+    so files replaced by an atomic rename, or by swapping a symlink the way Kubernetes
+    updates mounted ConfigMaps, are picked up as well. Bursts of events are debounced
+    into a single reload.
+
+    Uses inotify on Linux, and falls back to polling elsewhere (or for directories
+    that can't be watched). Use the watcher as a context manager or call stop()
+    to release its file descriptors, otherwise they are closed when it's garbage collected.
+
+    :param configs: File configs to watch.
+    :param debounce: Seconds to wait after the last change before reloading.
+    :param poll_interval: Seconds between checks of the configs that aren't watched by inotify.
+    :param use_inotify: Whether to use inotify, by default it's used if available.
+    :param on_error: Called with the config and the exception if a reload fails.
+        By default the error is logged. The config keeps its old contents either way.
+
+    Example:
+
+    .. code-block:: python
+
+        file_config = JsonFileConfig('/etc/tool/config.json')
+        cfg = ToolConfig([file_config, EnvConfig(prefix='TOOL_')])
+
+        with FileWatcher([file_config]):
+            serve(cfg)
+    """
+
+    def __init__(
+        self,
+        configs: Iterable[FileConfig] = (),
+        debounce: float = 0.1,
+        poll_interval: float = 1.0,
+        use_inotify: Optional[bool] = None,
+        on_error: Optional[Callable[[FileConfig, Exception], Any]] = None,
+    ):
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.on_error = on_error
+
+        self._lock = threading.Lock()
+        self._configs: List[FileConfig] = []
+        self._watched_dirs: Dict[str, int] = {}
+        self._dirs_by_wd: Dict[int, str] = {}
+        self._pending: Set[int] = set()
+        self._deadline: Optional[float] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+
+        if use_inotify is None:
+            use_inotify = _libc is not None
+
+        self._inotify_fd: Optional[int] = None
+        if use_inotify:
+            self._inotify_fd = _inotify_init()
+
+        try:
+            self._wakeup_read, self._wakeup_write = os.pipe()
+        except OSError:
+            _close_fds([self._inotify_fd])
+            raise
+
+        self._close_fds = weakref.finalize(
+            self, _close_fds, [self._inotify_fd, self._wakeup_read, self._wakeup_write],
+        )
+
+        for config in configs:
+            self.add(config)
+
+    @property
+    def uses_inotify(self) -> bool:
+        return self._inotify_fd is not None
+
+    def add(self, config: FileConfig):
+        """Start watching a file config."""
+        with self._lock:
+            self._configs.append(config)
+            for directory in _config_dirs(config):
+                self._watch_dir(directory)
+
+    def remove(self, config: FileConfig):
+        """Stop watching a file config."""
+        with self._lock:
+            self._configs.remove(config)
+
+    def start(self) -> FileWatcher:
+        """Start watching in a background daemon thread."""
+        if self._thread is not None:
+            raise RuntimeError('FileWatcher is already started')
+
+        self._thread = threading.Thread(target=self._run, name='cfglib-file-watcher', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop the background thread and release resources."""
+        if self._stopping:
+            return
+
+        self._stopping = True
+        os.write(self._wakeup_write, b'\0')
+
+        if self._thread is not None:
+            self._thread.join()
+
+        self._close_fds()
+        self._inotify_fd = None
+
+    def __enter__(self) -> FileWatcher:
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def _watch_dir(self, directory: str):
+        if self._inotify_fd is None or directory in self._watched_dirs:
+            return
+
+        wd = _libc.inotify_add_watch(  # type: ignore
+            self._inotify_fd, os.fsencode(directory), _WATCH_MASK,
+        )
+        if wd < 0:
+            # Most likely the directory doesn't exist (yet), it's polled meanwhile
+            return
+
+        self._watched_dirs[directory] = wd
+        self._dirs_by_wd[wd] = directory
+
+    def _run(self):
+        next_poll = time.monotonic()
+        while not self._stopping:
+            now = time.monotonic()
+            timeout = next_poll - now
+            if self._deadline is not None:
+                timeout = min(timeout, self._deadline - now)
+
+            fds = [self._wakeup_read]
+            if self._inotify_fd is not None:
+                fds.append(self._inotify_fd)
+
+            readable, _, _ = select.select(fds, [], [], max(timeout, 0))
+            if self._stopping:
+                break
+
+            if self._inotify_fd in readable:
+                self._read_events()
+
+            now = time.monotonic()
+            if self._deadline is not None and now >= self._deadline:
+                self._deadline = None
+                self._reload_pending()
+
+            if now >= next_poll:
+                next_poll = now + self.poll_interval
+                self._poll()
+
+    def _read_events(self):
+        try:
+            data = os.read(self._inotify_fd, 64 * 1024)
+        except BlockingIOError:
+            return
+
+        with self._lock:
+            offset = 0
+            while offset < len(data):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                name = os.fsdecode(data[
+                    offset + _EVENT_HEADER.size:offset + _EVENT_HEADER.size + length
+                ].rstrip(b'\0'))
+                offset += _EVENT_HEADER.size + length
+
+                if mask & _IN_Q_OVERFLOW:
+                    self._pending.update(id(config) for config in self._configs)
+                elif mask & _IN_IGNORED:
+                    directory = self._dirs_by_wd.pop(wd, None)
+                    self._watched_dirs.pop(directory, None)  # type: ignore
+                elif wd in self._dirs_by_wd:
+                    self._mark_changed(self._dirs_by_wd[wd], name)
+
+        self._deadline = time.monotonic() + self.debounce
+
+    def _mark_changed(self, directory: str, name: str):
+        for config in self._configs:
+            path = os.path.abspath(config.path)
+            if directory == os.path.dirname(path):
+                # Events for other names next to a symlink may be swaps of the directory
+                # it points into (like Kubernetes' ..data), reloading is stat-gated anyway
+                if name == os.path.basename(path) or os.path.islink(path):
+                    self._pending.add(id(config))
+                    continue
+
+            real_path = os.path.realpath(path)
+            if (directory, name) == os.path.split(real_path):
+                self._pending.add(id(config))
+
+    def _reload_pending(self):
+        with self._lock:
+            configs = [config for config in self._configs if id(config) in self._pending]
+            self._pending.clear()
+
+        for config in configs:
+            self._reload(config)
+
+    def _poll(self):
+        with self._lock:
+            for config in self._configs:
+                for directory in _config_dirs(config):
+                    self._watch_dir(directory)
+
+            configs = [
+                config
+                for config in self._configs
+                if not all(
+                    directory in self._watched_dirs
+                    for directory in _config_dirs(config)
+                )
+            ]
+
+        for config in configs:
+            self._reload(config)
+
+    def _reload(self, config: FileConfig):
+        try:
+            config.reload()
+        except Exception as exc:  # pylint: disable=broad-except
+            if self.on_error is not None:
+                self.on_error(config, exc)
+            else:
+                logger.exception('Failed to reload %s', config.path)
+
+
+def _close_fds(fds: List[Optional[int]]):
+    for fd in fds:
+        if fd is not None:
+            os.close(fd)
+
+
+def _config_dirs(config: FileConfig) -> FrozenSet[str]:
+    """Directories to watch for a config: the one containing the path,
+    and the one containing the file the path resolves to."""
+    path = os.path.abspath(config.path)
+    return frozenset([
+        os.path.dirname(path),
+        os.path.dirname(os.path.realpath(path)),
+    ])
+
+
+def _load_libc() -> Optional[ctypes.CDLL]:
+    if not sys.platform.startswith('linux'):
+        return None
+
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+    except OSError:  # pragma: no cover
+        return None
+
+    if not hasattr(libc, 'inotify_init1'):  # pragma: no cover
+        return None
+
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    return libc
+
+
+def _inotify_init() -> int:
+    if _libc is None:
+        raise OSError(errno.ENOSYS, 'inotify is not available')
+
+    fd = _libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+    if fd < 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err))
+
+    return fd
+
+
+_libc = _load_libc()
@@ -2,12 +2,44 @@
 from __future__ import annotations
 
 import collections.abc
+import contextlib
+import contextvars
 import enum
-from typing import *
-
-from .config import CompositeConfig, Config, DictConfig, to_cfg_list
+import functools
+import os
+import threading
+import time
+import types
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from .config import (
+    MISSING, CompositeConfig, Config, DictConfig, Marker, _digest, _pack_values, to_cfg_list,
+)
+from .stats import ConfigStats
 from .validation import Validator, ValidationContext, ValidationError
 
+if TYPE_CHECKING:
+    import concurrent.futures
+
+    from .frozen import FrozenConfig
+
 __all__ = [
     'MISSING',
 
@@ -27,20 +59,6 @@ __all__ = [
 ]
 
 
-class Marker:
-    def __repr__(self):
-        if self is MISSING:
-            return 'MISSING'
-        else:
-            return super().__repr__()  # pragma: no cover
-
-
-# Markers
-MISSING = Marker()
-"""A singleton marker object denoting that a setting value is (or should be) absent.
-Absence here means not being in the config at all (raising KeyError on access)."""
-
-
 T = TypeVar('T')  # pylint: disable=invalid-name
 ExtOptional = Union[Marker, None, T]
 
@@ -138,6 +156,46 @@ class Setting:
         value = self.apply_validators(value)
         return value
 
+    def validate_values(self, values: List[Any]) -> List[Any]:
+        """Validate a list of values (e.g. items of a ListSetting), with the same result
+        as validating each of them with validate_value().
+
+        If none of the values is None or missing, the built-in type checks are done
+        in a single pass and validators supporting batches (see `Validator`) are
+        applied to the whole list. Otherwise, or if anything is invalid,
+        values are validated one by one.
+        """
+        if self._can_validate_batch(values):
+            ctx = ValidationContext(self.name)
+            try:
+                batch = values
+                for validator in self.validators:
+                    batch = validator.batch(ctx, batch)  # type: ignore
+
+                return list(batch)
+            except Exception:  # pylint: disable=broad-except
+                # Validate one by one to raise the same error as validate_value(),
+                # e.g. a batch comparison may fail on an item that an earlier validator rejects
+                pass
+
+        return [self.validate_value(value) for value in values]
+
+    def _can_validate_batch(self, values: List[Any]) -> bool:
+        setting_class = type(self)
+        if (
+            setting_class.validate_value is not Setting.validate_value
+            or setting_class.apply_validators is not Setting.apply_validators
+            or not all(hasattr(validator, 'batch') for validator in self.validators)
+        ):
+            return False
+
+        value_types = set(map(type, values))
+        if setting_class.validate_value_custom is Setting.validate_value_custom:
+            return type(None) not in value_types and Marker not in value_types
+
+        batch_types = _BATCH_TYPES.get(setting_class.validate_value_custom)
+        return batch_types is not None and value_types <= batch_types
+
     def apply_validators(self, value: Any) -> Any:
         ctx = ValidationContext(self.name)
         for validator in self.validators:
@@ -287,10 +345,7 @@ class ListSetting(Setting):
                 raise ValueError(f'Invalid on_empty choice in field {self.name}')
 
         if self.subsetting:
-            value = [
-                self.subsetting.validate_value(item)
-                for item in value
-            ]
+            value = self.subsetting.validate_values(value)
 
         return value
 
@@ -316,39 +371,218 @@ class ConfigSpec:
             raise ValueError('All settings must have unique names')
 
         self.allow_extra = allow_extra
+        self._fingerprint: Any = _NOT_CACHED
+        self._compiled: Optional[Callable[[Config], Dict[str, Any]]] = None
+        self._path_index: Optional[Dict[str, _SettingPath]] = None
+
+    def compile(self) -> Callable[[Config], Dict[str, Any]]:
+        """Generate a function specialized for this spec that validates a whole config,
+        and use it in validate_config() from now on.
+
+        The function gives the same results and errors as the generic validation,
+        but the handling of missing and null values is resolved ahead of time
+        and type checks of the built-in setting types are inlined.
+        Settings' parameters are captured when compiling, so settings must not be
+        modified afterwards.
+        """
+        if self._compiled is None:
+            self._compiled = _compile_spec(self)
+
+        return self._compiled
+
+    @property
+    def compiled(self) -> bool:
+        """Whether compile() was called, so that validate_config() uses the compiled function."""
+        return self._compiled is not None
+
+    def fingerprint(self) -> Optional[str]:
+        """Return a digest of this spec: its settings, their parameters and validators,
+        and the code of setting types. Specs that validate differently get different digests.
+
+        Validators must be pure functions of the value: functions or partials whose result
+        only depends on their code, arguments, closures and the constants they reference.
+        Returns None if the spec can't be fingerprinted, e.g. when a validator
+        is a callable object or reads a mutable global.
+        """
+        if self._fingerprint is _NOT_CACHED:
+            try:
+                self._fingerprint = _digest(_describe(self))
+            except _NotDescribable:
+                self._fingerprint = None
+
+        return self._fingerprint
+
+    def _get_path_index(self) -> Dict[str, _SettingPath]:
+        """Settings of this spec and of the nested specs of DictSettings by dotted path,
+        built on first use."""
+        if self._path_index is None:
+            self._path_index = {}
+            _index_paths(self, (), (), self._path_index)
+
+        return self._path_index
+
+    def validate_setting(
+        self,
+        config: Config,
+        setting_name: str,
+        stats: Optional[ConfigStats] = None,
+    ):
+        """Validate one setting of a config.
 
-    def validate_setting(self, config: Config, setting_name: str):
-        """Validate one setting of a config."""
+        :param stats: Where to record the time spent validating.
+        """
 
-        try:
-            setting = self.settings[setting_name]
-        except KeyError as exc:
-            raise KeyError(f'Unknown setting, not in config spec: {setting_name}') from exc
+        if setting_name not in self.settings:
+            raise KeyError(f'Unknown setting, not in config spec: {setting_name}')
 
         try:
             value = config[setting_name]
         except KeyError as exc:
             value = MISSING
 
-        return setting.validate_value(value)
+        return self.validate_setting_value(setting_name, value, stats)
 
-    def validate_config(self, config: Config):
-        """Validate all settings of a config."""
+    def validate_setting_value(
+        self,
+        setting_name: str,
+        value: Any,
+        stats: Optional[ConfigStats] = None,
+    ):
+        """Validate a source value of a setting, MISSING if it's absent.
 
-        extra_fields = frozenset(config) - frozenset(self.settings)
-        if extra_fields and not self.allow_extra:
-            raise ValidationError(
-                f'Unexpected fields in the config: '
-                f'{",".join(extra_fields)}'
-            )
+        :param stats: Where to record the time spent validating.
+        """
+
+        try:
+            setting = self.settings[setting_name]
+        except KeyError as exc:
+            raise KeyError(f'Unknown setting, not in config spec: {setting_name}') from exc
+
+        if stats is None:
+            return setting.validate_value(value)
+
+        start = time.perf_counter()
+        try:
+            return setting.validate_value(value)
+        finally:
+            stats.record_validation(setting_name, time.perf_counter() - start)
+
+    def validate_config(
+        self,
+        config: Config,
+        stats: Optional[ConfigStats] = None,
+        executor: Optional[concurrent.futures.Executor] = None,
+        chunk_size: int = 10_000,
+    ):
+        """Validate all settings of a config.
+
+        :param stats: Where to record the time spent validating each setting.
+        :param executor: Validate settings in parallel in this executor, e.g. a thread pool
+            if validators do I/O or a process pool if they are CPU-heavy (settings and
+            their validators must be picklable then). Source values are still read
+            in the calling thread. Results are the same as with serial validation,
+            and if several settings are invalid, the error of the first one is raised.
+        :param chunk_size: With an executor, items of larger lists of ListSettings
+            are validated in chunks of this size.
+        """
+
+        if self._compiled is not None and stats is None and executor is None:
+            return self._compiled(config)
+
+        if not self.allow_extra:
+            extra_fields = frozenset(config) - self.settings.keys()
+            if extra_fields:
+                raise ValidationError(
+                    f'Unexpected fields in the config: '
+                    f'{",".join(extra_fields)}'
+                )
+
+        if executor is not None:
+            return self._validate_config_parallel(config, stats, executor, chunk_size)
 
         result = {}
         for setting_name in self.settings:
-            result[setting_name] = self.validate_setting(config, setting_name)
+            result[setting_name] = self.validate_setting(config, setting_name, stats)
+
+        return result
+
+    def _validate_config_parallel(
+        self,
+        config: Config,
+        stats: Optional[ConfigStats],
+        executor: concurrent.futures.Executor,
+        chunk_size: int,
+    ) -> Dict[str, Any]:
+        # Futures of each setting, for chunked lists a future per chunk of items
+        tasks: Dict[str, List[concurrent.futures.Future]] = {}
+        chunked = set()
+        for setting_name, setting in self.settings.items():
+            try:
+                value = config[setting_name]
+            except KeyError:
+                value = MISSING
+
+            if _can_chunk(setting, value, chunk_size):
+                chunked.add(setting_name)
+                tasks[setting_name] = [
+                    executor.submit(
+                        _timed_call,
+                        setting.subsetting.validate_values,  # type: ignore
+                        value[start:start + chunk_size],
+                    )
+                    for start in range(0, len(value), chunk_size)
+                ]
+            else:
+                tasks[setting_name] = [executor.submit(_timed_call, setting.validate_value, value)]
+
+        result = {}
+        try:
+            # Wait in spec order, so that errors are the same as in serial validation
+            for setting_name, setting in self.settings.items():
+                outcomes = [future.result() for future in tasks[setting_name]]
+                seconds = sum(elapsed for elapsed, _ in outcomes)
+                if setting_name in chunked:
+                    items = [item for _, chunk in outcomes for item in chunk]
+                    elapsed, value = _timed_call(setting.apply_validators, items)
+                    seconds += elapsed
+                else:
+                    value = outcomes[0][1]
+
+                if stats is not None:
+                    stats.record_validation(setting_name, seconds)
+
+                result[setting_name] = value
+        finally:
+            for futures in tasks.values():
+                for future in futures:
+                    future.cancel()
 
         return result
 
 
+class _LazySpec:
+    """The SPEC of a SpecValidatedConfig that is built from its settings on first access."""
+
+    def __init__(self, config_class: Type[SpecValidatedConfig], settings: List[Setting]):
+        self.config_class = config_class
+        self.settings = settings
+        self._lock = threading.Lock()
+
+    def __get__(self, instance, owner) -> ConfigSpec:
+        with self._lock:
+            config_class = self.config_class
+            spec = config_class.__dict__['SPEC']
+            if spec is self:
+                spec = ConfigSpec(self.settings, allow_extra=config_class.allow_extra)
+                if config_class.compile_spec:
+                    spec.compile()
+
+                # Replace this descriptor, so that later lookups are plain attribute reads
+                config_class.SPEC = spec
+
+            return spec
+
+
 class SpecValidatedConfig(CompositeConfig):
     """An all-in-one class that allows to specify settings and validate values;
     takes an iterable of configs as its source of values.
@@ -358,6 +592,8 @@ class SpecValidatedConfig(CompositeConfig):
 
     :param subconfigs: A number of source configs, from lowest priority to highest.
     :param validate: Whether to validate the config right after initialization.
+        If 'lazy', each setting is validated on first access and the value is cached
+        like with `cache_values`.
 
     Example:
 
@@ -371,15 +607,83 @@ class SpecValidatedConfig(CompositeConfig):
     allow_extra = False
     """Whether source configs can include extra keys not from the spec."""
 
+    cache_values = False
+    """Whether to cache validated values instead of revalidating a setting on every access.
+
+    The cache is dropped when this config is reloaded, when `subconfigs` change
+    and when a source config reports a change (e.g. a DictConfig is modified).
+    Values are only cached while all source configs report their changes: sources that
+    can change behind the scenes, like `EnvConfig` or plain mappings, disable the cache.
+    validate() always validates the sources and refills the cache.
+    """
+
+    read_copy_update = False
+    """Whether to serve all reads from a fully validated generation of values.
+
+    On reload, or when a source config reports a change, a new generation is validated
+    off to the side and published by replacing a single reference. Readers never lock
+    and always see one consistent generation; `snapshot()` returns a whole generation.
+    If a new generation fails validation, the previous one stays published: reload()
+    and validate() raise the error, while an error caused by a change reported by
+    a source config is stored in `last_error`.
+    """
+
+    validation_cache_dir: Optional[str] = None
+    """A directory where validated values are stored between runs, e.g. of a CLI tool.
+
+    When set, validate() first computes the fingerprints of the source configs
+    (see `Config.fingerprint()`) and, if they match the ones stored for this spec,
+    loads the stored values instead of running any validators. Loaded values are cached
+    like with `cache_values`. Values are pickled, so the directory must not be writable
+    by untrusted users.
+
+    Stored values are looked up by `validation_cache_key`, or by the spec's fingerprint
+    (see `ConfigSpec.fingerprint()`), so validators must be pure functions of the value.
+    If neither is available, values aren't stored.
+    """
+
+    validation_cache_key: Optional[str] = None
+    """A key of stored values for `validation_cache_dir`, to use instead of the spec's
+    fingerprint, e.g. when it can't be computed. It must change whenever validation does."""
+
+    compile_spec = False
+    """Whether to compile the spec into a specialized validation function
+    before the class is first used, see `ConfigSpec.compile()`."""
+
     SPEC: ExtOptional[ConfigSpec] = None
-    """ConfigSpec of this config."""
+    """ConfigSpec of this config. If it's not set, it's collected from the settings
+    defined in the class, but only built when first needed (usually on the first
+    instantiation), so that defining config classes is cheap."""
+
+    last_error: Optional[ValidationError] = None
+    """In read_copy_update mode, the error of the last failed attempt to publish a new
+    generation after a source config reported a change, None once a generation is published."""
+
+    # Validated values by setting name, None if caching is disabled
+    _value_cache: Optional[Dict[str, Any]] = None
+
+    # The published generation of validated values in read_copy_update mode
+    _generation: Optional[Dict[str, Any]] = None
+
+    # Validated overrides of the current context, created by the first override()
+    _override_var: Optional[contextvars.ContextVar[Optional[Dict[str, Any]]]] = None
+
+    # The root view of the nested property, created on first use
+    _nested_view: Optional[_PathView] = None
+
+    # FrozenConfig subclass of this class, created by the first freeze()
+    _frozen: Optional[Type[FrozenConfig]] = None
 
     def __init_subclass__(cls, **kwargs):  # pylint: disable=unused-argument
         super().__init_subclass__(**kwargs)
 
-        if getattr(cls, 'SPEC', None) is not None:
-            return
+        # Look SPEC up without building a lazy spec of a parent class
+        spec = next(klass.__dict__['SPEC'] for klass in cls.__mro__ if 'SPEC' in klass.__dict__)
+        if spec is None:
+            cls.SPEC = _LazySpec(cls, cls._collect_settings())
 
+    @classmethod
+    def _collect_settings(cls) -> List[Setting]:
         settings = []
         for name, setting in cls.__dict__.items():
             if not isinstance(setting, Setting):
@@ -393,38 +697,544 @@ class SpecValidatedConfig(CompositeConfig):
 
             settings.append(setting)
 
-        spec = ConfigSpec(settings, allow_extra=cls.allow_extra)
-        cls.SPEC = spec
+        return settings
 
     def __init__(
         self,
         subconfigs: Union[Mapping, Iterable[Mapping]],
-        validate=True,
+        validate: Union[bool, str] = True,
     ):
-        super().__init__(to_cfg_list(subconfigs))
+        if validate not in (True, False, 'lazy'):
+            raise ValueError(f'Invalid validate choice: {validate}')
+
+        if self.read_copy_update and validate is not True:
+            raise ValueError('Configs in read_copy_update mode are always validated')
+
+        if self.compile_spec:
+            self._spec.compile()
+
+        self._generation_lock = threading.Lock()
+        self._changes_seen = 0
+        self._changes_published = 0
+
+        self._caches_values = (
+            self.cache_values or validate == 'lazy' or self.validation_cache_dir is not None
+        )
+        self._value_cache = None
 
         # Store a second composite config that can be passed to spec validation
-        # as a plain ordinary config
+        # as a plain ordinary config. It shares the subconfig list with this config.
         self._composite_config = CompositeConfig([])
-        self._composite_config.subconfigs = self.subconfigs
 
-        if validate:
+        super().__init__(to_cfg_list(subconfigs))
+
+        if validate is True:
             self.validate()
 
-    def validate(self):
-        """Revalidate this config according to the spec."""
-        self.SPEC.validate_config(self._composite_config)
+    @property
+    def _spec(self) -> ConfigSpec:
+        """SPEC as a ConfigSpec, which it always is once the config is created."""
+        return cast(ConfigSpec, self.SPEC)
+
+    def validate(self, executor: Optional[concurrent.futures.Executor] = None) -> Dict[str, Any]:
+        """Revalidate this config according to the spec and return the validated values.
+
+        :param executor: Validate settings in parallel in this executor,
+            see `ConfigSpec.validate_config()`.
+        """
+        if self.read_copy_update:
+            return dict(self._publish_generation(executor))
+
+        cache = self._value_cache
+        values = self._validate_all(executor)
+
+        if cache is not None:
+            cache.update(values)
+
+        return values
+
+    def _validate_all(
+        self,
+        executor: Optional[concurrent.futures.Executor] = None,
+    ) -> Dict[str, Any]:
+        cache_dir = self.validation_cache_dir
+        cache_key = None
+        if cache_dir is not None:
+            cache_key = (
+                self._spec.fingerprint()
+                if self.validation_cache_key is None
+                else _digest('key', self.validation_cache_key)
+            )
+
+        if cache_dir is None or cache_key is None:
+            return self._spec.validate_config(
+                self._composite_config, stats=self._stats, executor=executor,
+            )
+
+        import pickle  # pylint: disable=import-outside-toplevel
+
+        path = os.path.join(cache_dir, f'{cache_key}.pickle')
+        sources_fingerprint = self._composite_config.fingerprint()
+        try:
+            with open(path, 'rb') as file:
+                stored_fingerprint, stored_values = pickle.load(file)
+        except Exception:  # pylint: disable=broad-except
+            # Missing, corrupted or incompatible, validate as usual
+            pass
+        else:
+            if stored_fingerprint == sources_fingerprint:
+                return {
+                    setting_name: stored_values.get(setting_name, MISSING)
+                    for setting_name in self._spec.settings
+                }
+
+        values = self._spec.validate_config(
+            self._composite_config, stats=self._stats, executor=executor,
+        )
+        _store_values(path, sources_fingerprint, values)
+        return values
+
+    def _subconfigs_changed(self):
+        # Changes of subconfigs reach this config through the composite config,
+        # so that the composite is always up to date when this config is invalidated
+        if self._composite_config.subconfigs is not self.subconfigs:
+            self._composite_config.subconfigs = self.subconfigs
+
+        self._composite_config._add_dependent(self)  # pylint: disable=protected-access
+        self._invalidate()
+
+    def _publish_generation(
+        self,
+        executor: Optional[concurrent.futures.Executor] = None,
+    ) -> Dict[str, Any]:
+        with self._generation_lock:
+            while True:
+                changes_seen = self._changes_seen
+                generation = self._validate_all(executor=executor)
+
+                # Sources changed while validating, the generation may be inconsistent
+                if changes_seen == self._changes_seen:
+                    break
+
+            self._generation = generation
+            self._changes_published = changes_seen
+            self.last_error = None
+            return generation
+
+    def _invalidate(self, keys=None):
+        # Values can only be cached while every change of the sources is reported
+        # pylint: disable=protected-access
+        if self._caches_values and self._composite_config._tracks_changes:
+            self._value_cache = {}
+        else:
+            self._value_cache = None
+
+        if self._generation is not None:
+            self._changes_seen += 1
+
+            # During reload() the new generation is published once at the end.
+            # Errors must not interrupt notifying the other dependents of the sources.
+            if not self._batch_depth:
+                try:
+                    self._publish_generation()
+                except ValidationError as exc:
+                    self.last_error = exc
+
+        super()._invalidate(keys)
+
+    def reload(self):
+        """Reload subconfigs. In read_copy_update mode, validate and publish a new generation;
+        if validation fails, the previous generation stays published."""
+        if not self.read_copy_update:
+            super().reload()
+            return
+
+        with self._batch_changes():
+            super().reload()
+            self._publish_generation()
+
+        # Sources may have changed after publishing, but before the batch has ended
+        if self._changes_seen != self._changes_published:
+            self._publish_generation()
+
+    async def areload(self):
+        """Reload subconfigs concurrently, otherwise the same as reload()."""
+        if not self.read_copy_update:
+            await super().areload()
+            return
+
+        with self._batch_changes():
+            await super().areload()
+            self._publish_generation()
+
+        if self._changes_seen != self._changes_published:
+            self._publish_generation()
+
+    def freeze(self) -> FrozenConfig:
+        """Return an immutable, hashable copy of the validated values.
+
+        It's an instance of a `__slots__` class generated once per config class,
+        so it's compact, attribute access is a plain slot read and it can be used
+        as a key of dicts and caches like `functools.lru_cache`. Nested configs are
+        frozen as well, mappings become `FrozenDict`s and lists become tuples.
+
+        Setting names must be identifiers not starting with an underscore.
+        """
+        generation = self._apply_overrides(self._current_values())
+        return self._frozen_class()._make(generation)  # pylint: disable=protected-access
+
+    def _current_values(self) -> Dict[str, Any]:
+        """Validated values of all settings, reusing cached values."""
+        generation = self._generation
+        if generation is not None:
+            return generation
+
+        cache = self._value_cache
+        if cache is None:
+            return self.validate()
+
+        values = {}
+        for setting_name in self._spec.settings:
+            try:
+                values[setting_name] = cache[setting_name]
+            except KeyError:
+                values[setting_name] = cache[setting_name] = self._spec.validate_setting(
+                    self._composite_config, setting_name, self._stats,
+                )
+
+        return values
+
+    @classmethod
+    def _frozen_class(cls) -> Type[FrozenConfig]:
+        frozen = cls.__dict__.get('_frozen')
+        if frozen is None:
+            from .frozen import frozen_class  # pylint: disable=import-outside-toplevel
+
+            frozen = frozen_class(cls, cast(ConfigSpec, cls.SPEC).settings)
+            cls._frozen = frozen
+
+        return frozen
+
+    def snapshot(self) -> DictConfig:
+        generation = self._apply_overrides(self._current_values())
+        return DictConfig({
+            key: value
+            for key, value in generation.items()
+            if value is not MISSING
+        })
+
+    def instrument(self, stats: Optional[ConfigStats] = None) -> ConfigStats:
+        """Start collecting statistics: accesses and misses by key, which layer resolved
+        each source value, and the time spent validating each setting.
+        Otherwise instrumentation costs a single attribute check per lookup.
+
+        :param stats: Where to collect the statistics, a new `ConfigStats` by default.
+        :return: The stats object.
+        """
+        stats = super().instrument(stats)
+
+        # pylint: disable=protected-access
+        self._composite_config._stats_accesses = False
+        self._composite_config.instrument(stats)
+        return stats
+
+    def uninstrument(self):
+        super().uninstrument()
+        self._composite_config.uninstrument()
+
+    def _getitem_instrumented(self, item, stats: ConfigStats):
+        generation = self._generation
+        cache = self._value_cache
+        try:
+            if generation is not None:
+                try:
+                    value = generation[item]
+                except KeyError:
+                    raise KeyError(f'Unknown setting, not in config spec: {item}') from None
+            elif cache is None:
+                value = self._spec.validate_setting(self._composite_config, item, stats)
+            else:
+                try:
+                    value = cache[item]
+                except KeyError:
+                    value = cache[item] = self._spec.validate_setting(
+                        self._composite_config, item, stats,
+                    )
+        except KeyError:
+            stats.record_access(item, False)
+            raise
+
+        stats.record_access(item, value is not MISSING)
+        if value is MISSING:
+            raise KeyError(f'Key {item} not found')
+
+        return value
+
+    @contextlib.contextmanager
+    def override(
+        self,
+        values: Optional[Mapping[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Iterator[SpecValidatedConfig]:
+        """Shadow some settings with other values, but only in the current context:
+        the current thread or asyncio task, and tasks it starts inside the block.
+
+        Only the overridden settings are validated, when entering the block. Values are
+        validated like source values. Overrides can be nested, inner ones take precedence.
+        Other threads and tasks see the config as usual, and until the first override()
+        lookups pay only for a single attribute check. validate() ignores overrides,
+        reads like `cfg[...]`, get_many(), snapshot() and freeze() see them.
+
+        :param values: Values by setting name, can be combined with keyword arguments.
+
+        Example:
+
+        .. code-block:: python
+
+            with cfg.override(max_connections=tenant.max_connections):
+                handle_request()  # Sees the tenant's limit in cfg.max_connections
+        """
+        overrides = dict(values or {}, **kwargs)
+        validated = {
+            setting_name: self._spec.validate_setting_value(setting_name, value)
+            for setting_name, value in overrides.items()
+        }
+
+        override_var = self._override_var
+        if override_var is None:
+            with _OVERRIDE_VAR_LOCK:
+                override_var = self._override_var
+                if override_var is None:
+                    override_var = contextvars.ContextVar(
+                        f'{self.__class__.__name__}_overrides', default=None,
+                    )
+                    self._override_var = override_var
+
+        # Layers are never modified, a nested override gets its own merged copy
+        outer = override_var.get()
+        token = override_var.set({**outer, **validated} if outer else validated)
+        try:
+            yield self
+        finally:
+            override_var.reset(token)
+
+    def get_path(self, path: Union[str, Sequence[str]], default: Any = MISSING) -> Any:
+        """Look up a setting of a nested config (a DictSetting with a subtype) by its path,
+        e.g. `cfg.get_path('db.pool.size')` instead of `cfg['db']['pool']['size']`.
+
+        Paths are resolved with an index precomputed from the spec tree. Source values
+        of the DictSettings on the way are looked into directly, without building nested
+        configs, and only the setting at the end of the path is validated,
+        so other settings of the nested configs aren't validated either.
+        Validated values are used instead where they are cached or overridden,
+        and DictSettings with validators or custom validation are validated as usual.
+
+        :param path: Setting names joined with dots, or a sequence of names.
+        :param default: The value if the setting is missing, by default KeyError is raised.
+        """
+        if not isinstance(path, str):
+            path = '.'.join(path)
+
+        value = self._get_path(path)
+        if value is MISSING:
+            if default is MISSING:
+                raise KeyError(f'Key {path} not found')
+
+            return default
+
+        return value
+
+    @property
+    def nested(self) -> _PathView:
+        """Attribute access by path, `cfg.nested.db.pool.size` is the same as
+        `cfg.get_path('db.pool.size')`. Settings with nested configs give views like
+        `cfg.nested.db`, use get_path() for their values."""
+        view = self._nested_view
+        if view is None:
+            view = self._nested_view = _PathView(self, '')
+
+        return view
+
+    def _get_path(self, path: str) -> Any:
+        try:
+            setting_path = self._spec._get_path_index()[path]  # pylint: disable=protected-access
+        except KeyError:
+            raise KeyError(f'Unknown setting path, not in config spec: {path}') from None
+
+        names = setting_path.names
+        value = self._cached_value(names[0])
+        if value is not _NOT_CACHED:
+            return _descend_validated(value, names[1:])
+
+        try:
+            value = self._composite_config[names[0]]
+        except KeyError:
+            value = MISSING
+
+        # Descend through source values of DictSettings, as their subtypes would see them
+        for depth, setting in enumerate(setting_path.settings[:-1]):
+            if not setting_path.direct[depth] or value is MISSING or value is None:
+                return _descend_validated(setting.validate_value(value), names[depth + 1:])
+
+            if not isinstance(value, collections.abc.Mapping):
+                raise ValidationError(f'A value for setting {setting.name} must be a mapping')
+
+            nested_spec = setting_path.specs[depth + 1]
+            if not nested_spec.allow_extra:
+                extra_fields = value.keys() - nested_spec.settings.keys()
+                if extra_fields:
+                    raise ValidationError(
+                        f'Unexpected fields in the config: {",".join(extra_fields)}'
+                    )
+
+            value = value.get(names[depth + 1], MISSING)
+
+        return setting_path.settings[-1].validate_value(value)
+
+    def _cached_value(self, item: str) -> Any:
+        """The validated value of a setting if it's overridden or cached, _NOT_CACHED otherwise."""
+        if self._override_var is not None:
+            overrides = self._override_var.get()
+            if overrides and item in overrides:
+                return overrides[item]
+
+        generation = self._generation
+        if generation is not None:
+            return generation[item]
+
+        cache = self._value_cache
+        if cache is not None:
+            return cache.get(item, _NOT_CACHED)
+
+        return _NOT_CACHED
+
+    def _apply_overrides(self, values: Dict[str, Any]) -> Dict[str, Any]:
+        if self._override_var is not None:
+            overrides = self._override_var.get()
+            if overrides:
+                return {**values, **overrides}
+
+        return values
+
+    def _getitem_overridden(self, item, value):
+        if self._stats is not None:
+            self._stats.record_access(item, value is not MISSING)
+
+        if value is MISSING:
+            raise KeyError(f'Key {item} not found')
+
+        return value
+
+    def get_many(self, keys: Iterable[Any], default: Any = MISSING, named: bool = False) -> tuple:
+        """Look up several settings at once: source values of the settings that aren't cached
+        are resolved in a single pass over the layers, then validated together.
+
+        :param keys: Setting names.
+        :param default: The value for settings that are missing, by default KeyError is raised.
+        :param named: Whether to return a namedtuple with the setting names as field names.
+        :return: The values in the order of *keys*.
+        """
+        keys = tuple(keys)
+        settings = self._spec.settings
+        for key in keys:
+            if key not in settings:
+                raise KeyError(f'Unknown setting, not in config spec: {key}')
+
+        generation = self._generation
+        if generation is not None:
+            values = [generation[key] for key in keys]
+        else:
+            values = self._validate_many(keys)
+
+        if self._override_var is not None:
+            overrides = self._override_var.get()
+            if overrides:
+                values = [overrides.get(key, value) for key, value in zip(keys, values)]
+
+        if self._stats is not None:
+            for key, value in zip(keys, values):
+                self._stats.record_access(key, value is not MISSING)
+
+        return _pack_values(keys, values, default, named)
+
+    def _validate_many(self, keys: Tuple[str, ...]) -> List[Any]:
+        cache = self._value_cache
+        values = [MISSING] * len(keys)
+        if cache is None:
+            pending = list(range(len(keys)))
+        else:
+            pending = []
+            for i, key in enumerate(keys):
+                try:
+                    values[i] = cache[key]
+                except KeyError:
+                    pending.append(i)
+
+        if not pending:
+            return values
+
+        # pylint: disable=protected-access
+        source_values = self._composite_config._get_many([keys[i] for i in pending])
+        settings = self._spec.settings
+        stats = self._stats
+        for i, source_value in zip(pending, source_values):
+            if stats is None:
+                value = settings[keys[i]].validate_value(source_value)
+            else:
+                value = self._spec.validate_setting_value(keys[i], source_value, stats)
+
+            if cache is not None:
+                cache[keys[i]] = value
+
+            values[i] = value
+
+        return values
 
     def __getitem__(self, item):
-        value = self.SPEC.validate_setting(self._composite_config, item)
+        if self._override_var is not None:
+            overrides = self._override_var.get()
+            if overrides and item in overrides:
+                return self._getitem_overridden(item, overrides[item])
+
+        if self._stats is not None:
+            return self._getitem_instrumented(item, self._stats)
+
+        generation = self._generation
+        if generation is not None:
+            try:
+                value = generation[item]
+            except KeyError:
+                raise KeyError(f'Unknown setting, not in config spec: {item}') from None
+
+            if value is MISSING:
+                raise KeyError(f'Key {item} not found')
+
+            return value
+
+        cache = self._value_cache
+        if cache is None:
+            value = self._spec.validate_setting(self._composite_config, item)
+        else:
+            try:
+                value = cache[item]
+            except KeyError:
+                value = cache[item] = self._spec.validate_setting(self._composite_config, item)
 
         if value is MISSING:
             raise KeyError(f'Key {item} not found')
 
         return value
 
+    def __reduce__(self):
+        values = {
+            key: value
+            for key, value in self._current_values().items()
+            if value is not MISSING
+        }
+        return _restore_validated_config, (self.__class__, values)
+
     def __iter__(self):
-        return (key for key in self.SPEC.settings)
+        return (key for key in self._spec.settings)
 
     def __len__(self):
         return len(list(self.__iter__()))
@@ -438,3 +1248,458 @@ class SpecValidatedConfig(CompositeConfig):
     def __repr__(self):
         snapshot = self.snapshot()
         return f'<{self.__class__.__name__} {snapshot}>'
+
+
+class _PathView:
+    """A node of the spec tree of a config, see `SpecValidatedConfig.nested`."""
+
+    def __init__(self, config: SpecValidatedConfig, prefix: str):
+        self._config = config
+        self._prefix = prefix
+
+    def __getattr__(self, item):
+        path = f'{self._prefix}.{item}' if self._prefix else item
+        # pylint: disable=protected-access
+        setting_path = self._config._spec._get_path_index().get(path)
+        if setting_path is None:
+            raise AttributeError(f'Unknown setting path, not in config spec: {path}')
+
+        if setting_path.nested:
+            # Store the view, so that later lookups are plain attribute reads
+            view = self.__dict__[item] = _PathView(self._config, path)
+            return view
+
+        value = self._config._get_path(path)
+        if value is MISSING:
+            raise AttributeError(f'Key {path} not found')
+
+        return value
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} {self._prefix or "."} of {self._config!r}>'
+
+
+class _SettingPath(NamedTuple):
+    names: Tuple[str, ...]
+    settings: Tuple[Setting, ...]
+
+    # For each setting but the last, whether nested settings can be looked up
+    # in its source value without validating the setting itself
+    direct: Tuple[bool, ...]
+
+    # Whether the setting has nested settings
+    nested: bool
+
+    # The spec containing each setting, the first one is the spec of the config
+    specs: Tuple[ConfigSpec, ...]
+
+
+def _index_paths(
+    spec: ConfigSpec,
+    names: Tuple[str, ...],
+    settings: Tuple[Setting, ...],
+    index: Dict[str, _SettingPath],
+    parents: Tuple[ConfigSpec, ...] = (),
+):
+    direct = tuple(_is_direct(setting) for setting in settings)
+    for setting_name, setting in spec.settings.items():
+        nested_spec = _nested_spec(setting)
+        if any(nested_spec is parent for parent in parents + (spec,)):
+            nested_spec = None
+
+        path = _SettingPath(
+            names + (setting_name,),
+            settings + (setting,),
+            direct,
+            nested_spec is not None,
+            parents + (spec,),
+        )
+        index.setdefault('.'.join(path.names), path)
+
+        if nested_spec is not None:
+            _index_paths(nested_spec, path.names, path.settings, index, parents + (spec,))
+
+
+def _nested_spec(setting: Setting) -> Optional[ConfigSpec]:
+    if not isinstance(setting, DictSetting):
+        return None
+
+    subtype = setting.subtype
+    if isinstance(subtype, ConfigSpec):
+        return subtype
+    elif isinstance(subtype, type) and issubclass(subtype, SpecValidatedConfig):
+        return subtype.SPEC  # type: ignore
+
+    return None
+
+
+def _is_direct(setting: Setting) -> bool:
+    setting_class = type(setting)
+    return (
+        setting_class.validate_value is Setting.validate_value
+        and setting_class.validate_value_custom is DictSetting.validate_value_custom
+        and setting_class.apply_validators is Setting.apply_validators
+        and not setting.validators
+    )
+
+
+def _descend_validated(value: Any, names: Tuple[str, ...]) -> Any:
+    """Look up a path in validated values, MISSING if it's absent."""
+    for depth, name in enumerate(names):
+        if value is MISSING:
+            return MISSING
+        elif isinstance(value, SpecValidatedConfig):
+            return value._get_path('.'.join(names[depth:]))  # pylint: disable=protected-access
+
+        try:
+            value = value[name]
+        except KeyError:
+            return MISSING
+
+    return value
+
+
+# Marks settings without a cached value
+_NOT_CACHED = object()
+
+
+# Guards creating the override ContextVar of a config
+_OVERRIDE_VAR_LOCK = threading.Lock()
+
+
+_INLINE_TYPE_CHECKS = {
+    StringSetting.validate_value_custom: ('str', 'A value for setting {} must be a string or None'),
+    BoolSetting.validate_value_custom: ('bool', 'A value for setting {} must be a bool'),
+    IntSetting.validate_value_custom: ('int', 'A value for setting {} must be an int'),
+    FloatSetting.validate_value_custom: ('float', 'A value for setting {} must be a float'),
+}
+
+
+# Exact types of values that validate_value_custom() of built-in settings accepts as they are.
+# Read-only, so that it can be part of spec fingerprints.
+_BATCH_TYPES = types.MappingProxyType({
+    StringSetting.validate_value_custom: frozenset([str]),
+    BoolSetting.validate_value_custom: frozenset([bool]),
+    IntSetting.validate_value_custom: frozenset([int, bool]),
+    FloatSetting.validate_value_custom: frozenset([float]),
+})
+
+
+def _compile_spec(spec: ConfigSpec) -> Callable[[Config], Dict[str, Any]]:
+    """Generate the source of a function validating a config according to *spec*, and exec it.
+
+    The generated code mirrors Setting.validate_value() step by step,
+    with every branch that depends only on the setting's parameters taken at compile time.
+    Two variants are generated: one for any config, and one that reads plain dicts
+    (like DictConfig) with dict.get() instead of catching KeyError for every missing key.
+    """
+    namespace: Dict[str, Any] = {
+        'MISSING': MISSING,
+        'ValidationError': ValidationError,
+        'ValidationContext': ValidationContext,
+        '_setting_keys': spec.settings.keys(),
+    }
+    body: List[Any] = []
+    for i, (setting_name, setting) in enumerate(spec.settings.items()):
+        namespace[f'_name{i}'] = setting_name
+        namespace[f'_setting{i}'] = setting
+        body.append(i)  # Replaced with the lookup of the value
+
+        if type(setting).validate_value is not Setting.validate_value:
+            body.append(f'    result[_name{i}] = _setting{i}.validate_value(value)')
+            continue
+
+        body.append('    if value is MISSING:')
+        body += _compile_absent_value(
+            namespace, i, setting, setting.on_missing, 'on_missing', 'missing',
+        )
+        body.append('    elif value is None:')
+        body += _compile_absent_value(
+            namespace, i, setting, setting.on_null, 'on_null', 'is None',
+        )
+        body.append('    else:')
+        body += _compile_present_value(namespace, i, setting)
+        body.append(f'    result[_name{i}] = value')
+
+    body.append('    return result')
+
+    header = []
+    if not spec.allow_extra:
+        header += [
+            '    extra_fields = frozenset(config) - _setting_keys',
+            '    if extra_fields:',
+            '        raise ValidationError(',
+            '            f\'Unexpected fields in the config: {",".join(extra_fields)}\'',
+            '        )',
+        ]
+
+    header.append('    result = {}')
+
+    def mapping_lookup(i: int) -> str:
+        return (
+            f'    try:\n        value = config[_name{i}]\n'
+            f'    except KeyError:\n        value = MISSING'
+        )
+
+    def dict_lookup(i: int) -> str:
+        return f'    value = get(_name{i}, MISSING)'
+
+    source = '\n'.join([
+        'def validate_mapping(config):',
+        *header,
+        *(mapping_lookup(line) if isinstance(line, int) else line for line in body),
+        '',
+        'def validate_dict(config):',
+        *header,
+        '    get = config.get',
+        *(dict_lookup(line) if isinstance(line, int) else line for line in body),
+    ])
+    code = compile(source, '<cfglib compiled spec>', 'exec')
+    exec(code, namespace)  # pylint: disable=exec-used
+    validate_mapping = namespace['validate_mapping']
+    validate_dict = namespace['validate_dict']
+
+    def validate_config(config: Config) -> Dict[str, Any]:
+        config_type = type(config)
+        if (
+            config_type.__getitem__ is dict.__getitem__
+            and config_type.get is dict.get
+            and not hasattr(config_type, '__missing__')
+        ):
+            return validate_dict(config)
+
+        return validate_mapping(config)
+
+    return validate_config
+
+
+def _compile_absent_value(
+    namespace: Dict[str, Any],
+    i: int,
+    setting: Setting,
+    action: MissingSettingAction,
+    action_name: str,
+    description: str,
+) -> List[str]:
+    if action is ERROR:
+        message = (
+            f'Config field {setting.name} missing'
+            if action_name == 'on_missing'
+            else f'Config field {setting.name} must not be None'
+        )
+        return [f'        raise ValidationError({message!r})']
+    elif action is USE_DEFAULT:
+        if setting.default is MISSING:
+            message = f'Config field {setting.name} {description} and no default is provided'
+            return [f'        raise ValidationError({message!r})']
+
+        namespace[f'_default{i}'] = setting.default
+        return [f'        value = _default{i}']
+    elif action is LEAVE:
+        return ['        value = MISSING' if action_name == 'on_missing' else '        pass']
+
+    message = f'Invalid {action_name} choice in field {setting.name}'
+    return [f'        raise ValueError({message!r})']
+
+
+def _compile_present_value(namespace: Dict[str, Any], i: int, setting: Setting) -> List[str]:
+    lines = []
+
+    validate_value_custom = type(setting).validate_value_custom
+    if validate_value_custom in _INLINE_TYPE_CHECKS:
+        type_name, message = _INLINE_TYPE_CHECKS[validate_value_custom]
+        lines += [
+            f'        if not isinstance(value, {type_name}):',
+            f'            raise ValidationError({message.format(setting.name)!r})',
+        ]
+    elif validate_value_custom is not Setting.validate_value_custom:
+        lines.append(f'        value = _setting{i}.validate_value_custom(value)')
+
+    if type(setting).apply_validators is not Setting.apply_validators:
+        lines.append(f'        value = _setting{i}.apply_validators(value)')
+    elif setting.validators:
+        lines.append(f'        ctx = ValidationContext(_name{i})')
+        for j, validator in enumerate(setting.validators):
+            namespace[f'_validator{i}_{j}'] = validator
+            lines.append(f'        value = _validator{i}_{j}(ctx, value)')
+
+    if not lines:
+        lines.append('        pass')
+
+    return lines
+
+
+def _restore_validated_config(
+    config_class: Type[SpecValidatedConfig],
+    values: Dict[str, Any],
+) -> SpecValidatedConfig:
+    """Unpickle a SpecValidatedConfig from its validated values without validating them again."""
+    if config_class.read_copy_update:
+        return config_class([DictConfig(values)])
+
+    config = config_class([DictConfig(values)], validate=False)
+    config._value_cache = {  # pylint: disable=protected-access
+        setting_name: values.get(setting_name, MISSING)
+        for setting_name in config._spec.settings  # pylint: disable=protected-access
+    }
+    return config
+
+
+def _store_values(path: str, sources_fingerprint: str, values: Dict[str, Any]):
+    # pylint: disable=import-outside-toplevel
+    import pickle
+    import tempfile
+
+    try:
+        data = pickle.dumps(
+            (
+                sources_fingerprint,
+                {key: value for key, value in values.items() if value is not MISSING},
+            ),
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+    except Exception:  # pylint: disable=broad-except
+        # Some values can't be pickled, there's nothing to cache
+        return
+
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.cfglib-')
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(data)
+
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _can_chunk(setting: Setting, value: Any, chunk_size: int) -> bool:
+    """Whether the items of a ListSetting's value can be validated in separate chunks:
+    validate_value() then amounts to validating the items and applying the validators."""
+    setting_class = type(setting)
+    return (
+        isinstance(setting, ListSetting)
+        and setting.subsetting is not None
+        and setting_class.validate_value is Setting.validate_value
+        and setting_class.validate_value_custom is ListSetting.validate_value_custom
+        and isinstance(value, list)
+        and len(value) > chunk_size
+    )
+
+
+def _timed_call(func: Callable[..., T], *args: Any) -> Tuple[float, T]:
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+class _NotDescribable(Exception):
+    """Raised when a part of a spec can't be described deterministically."""
+    pass
+
+
+# Values that are fully described by their repr
+_PLAIN_TYPES = (type(None), bool, int, float, complex, str, bytes, type(Ellipsis))
+
+
+def _describe(value: Any) -> str:
+    """A deterministic description of a spec or a part of it, for fingerprints.
+
+    Raises _NotDescribable for values that can't be described, like callable objects
+    or functions that read mutable globals.
+    """
+    if isinstance(value, ConfigSpec):
+        settings = ', '.join(_describe(setting) for setting in value.settings.values())
+        return f'ConfigSpec([{settings}], allow_extra={value.allow_extra})'
+    elif isinstance(value, Setting):
+        attributes = ', '.join(
+            f'{name}={_describe(attribute)}'
+            for name, attribute in sorted(vars(value).items())
+        )
+        return f'{_describe(type(value))}({attributes})'
+    elif isinstance(value, type) and issubclass(value, SpecValidatedConfig):
+        return f'{value.__module__}.{value.__qualname__}:{_describe(value.SPEC)}'
+    elif isinstance(value, type) and issubclass(value, Setting):
+        methods = ', '.join(
+            f'{name}={_describe(method)}'
+            for cls in value.__mro__
+            if issubclass(cls, Setting)
+            for name, method in sorted(vars(cls).items())
+            if isinstance(method, types.FunctionType)
+        )
+        return f'{value.__module__}.{value.__qualname__}<{methods}>'
+    elif isinstance(value, (type, types.BuiltinFunctionType)):
+        return f'{value.__module__}.{value.__qualname__}'
+    elif isinstance(value, types.FunctionType):
+        # Classes in closures are mostly the __class__ cell of super(), refer to them by name
+        closure = ', '.join(
+            _describe_reference(cell.cell_contents)
+            if isinstance(cell.cell_contents, type)
+            else _describe(cell.cell_contents)
+            for cell in value.__closure__ or ()
+        )
+        global_values = ', '.join(
+            f'{name}={_describe_reference(value.__globals__[name])}'
+            for name in sorted(_referenced_names(value.__code__))
+            if name in value.__globals__
+        )
+        return (
+            f'{value.__module__}.{value.__qualname__}'
+            f'<{_describe(value.__code__)}, {_describe(value.__defaults__)},'
+            f' {_describe(value.__kwdefaults__)}, [{closure}], {{{global_values}}}>'
+        )
+    elif isinstance(value, functools.partial):
+        return (
+            f'partial({_describe(value.func)}, {_describe(value.args)},'
+            f' {_describe(value.keywords)}, {_describe(vars(value))})'
+        )
+    elif isinstance(value, types.CodeType):
+        consts = ', '.join(_describe(const) for const in value.co_consts)
+        return f'{value.co_code.hex()}({consts}; {value.co_names})'
+    elif isinstance(value, (list, tuple, frozenset, set)):
+        items_list = [_describe(item) for item in value]
+        if isinstance(value, (frozenset, set)):
+            items_list.sort()
+
+        return f'{type(value).__name__}[{", ".join(items_list)}]'
+    elif isinstance(value, dict):
+        items = ', '.join(f'{_describe(key)}: {_describe(item)}' for key, item in value.items())
+        return f'{{{items}}}'
+    elif isinstance(value, enum.Enum):
+        return f'{_describe(type(value))}.{value.name}'
+    elif isinstance(value, _PLAIN_TYPES) or value is MISSING:
+        return repr(value)
+
+    raise _NotDescribable(f'Can\'t describe {type(value).__qualname__} objects')
+
+
+def _describe_reference(value: Any) -> str:
+    """Describe a global or a class referenced by a function.
+
+    Modules, functions and classes are referred to by name, so that changes of
+    internal state like lazily imported modules don't change the description.
+    Mutable values could change between validations, so they can't be described.
+    """
+    if isinstance(value, types.ModuleType):
+        return f'module {value.__name__}'
+    elif isinstance(value, (type, types.FunctionType, types.BuiltinFunctionType)):
+        return f'{value.__module__}.{value.__qualname__}'
+    elif isinstance(value, types.MappingProxyType):
+        return _describe(dict(value))
+    elif type(value).__module__ == 'typing':
+        # Special forms and aliases, like typing.Mapping
+        return repr(value)
+    elif isinstance(value, (tuple, frozenset, enum.Enum, _PLAIN_TYPES)) or value is MISSING:
+        return _describe(value)
+
+    raise _NotDescribable(f'Can\'t describe a reference to {type(value).__qualname__} objects')
+
+
+def _referenced_names(code: types.CodeType) -> Iterator[str]:
+    """Names of globals and attributes used by code, including nested functions."""
+    yield from code.co_names
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            yield from _referenced_names(const)
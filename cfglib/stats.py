@@ -0,0 +1,129 @@
+"""Access statistics of instrumented configs."""
+from __future__ import annotations
+
+import collections
+from typing import TYPE_CHECKING, Any, Callable, Counter, DefaultDict, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import logging
+
+
+__all__ = [
+    'ConfigStats',
+    'log_exporter',
+]
+
+
+StatsExporter = Callable[[Dict[str, Any]], Any]
+
+
+class ConfigStats:
+    """Counters collected by instrumented configs, see e.g. `CompositeConfig.instrument()`.
+
+    Updates aren't locked, so counts may be slightly off if a config is used
+    by several threads at once.
+
+    :param exporter: Called by export() with a snapshot() of the stats,
+        e.g. `log_exporter()` or a function pushing them to a metrics system.
+    """
+
+    def __init__(self, exporter: Optional[StatsExporter] = None):
+        self.exporter = exporter
+        self.reset()
+
+    def reset(self):
+        """Zero all counters."""
+        self.accesses: Counter[Any] = collections.Counter()
+        """Number of lookups by key."""
+
+        self.misses: Counter[Any] = collections.Counter()
+        """Number of lookups of keys that weren't found, by key."""
+
+        self.resolved_by: DefaultDict[Any, Counter[str]] = collections.defaultdict(
+            collections.Counter
+        )
+        """For each key, the number of hits served by each layer of a composite config."""
+
+        self.layer_misses: Counter[str] = collections.Counter()
+        """Number of times a layer of a composite config was checked for a key it didn't have."""
+
+        self.validations: Counter[Any] = collections.Counter()
+        """Number of times each setting was validated."""
+
+        self.validation_time: DefaultDict[Any, float] = collections.defaultdict(float)
+        """Total time spent validating each setting, in seconds."""
+
+    def record_access(self, key: Any, found: bool):
+        self.accesses[key] += 1
+        if not found:
+            self.misses[key] += 1
+
+    def record_hit(self, key: Any, layer: str):
+        self.resolved_by[key][layer] += 1
+
+    def record_layer_miss(self, layer: str):
+        self.layer_misses[layer] += 1
+
+    def record_validation(self, setting_name: Any, seconds: float):
+        self.validations[setting_name] += 1
+        self.validation_time[setting_name] += seconds
+
+    def hot_keys(self, count: Optional[int] = None) -> List[Tuple[Any, int]]:
+        """The most accessed keys with their access counts."""
+        return self.accesses.most_common(count)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """A copy of all counters as plain dicts."""
+        return {
+            'accesses': dict(self.accesses),
+            'misses': dict(self.misses),
+            'resolved_by': {key: dict(layers) for key, layers in self.resolved_by.items()},
+            'layer_misses': dict(self.layer_misses),
+            'validations': dict(self.validations),
+            'validation_time': dict(self.validation_time),
+        }
+
+    def export(self, reset: bool = False):
+        """Pass a snapshot of the stats to the exporter.
+
+        :param reset: Whether to zero the counters afterwards, so that each export
+            covers the period since the previous one.
+        """
+        if self.exporter is None:
+            raise ValueError('No exporter is set')
+
+        snapshot = self.snapshot()
+        if reset:
+            self.reset()
+
+        self.exporter(snapshot)
+
+    def __repr__(self):
+        return f'<ConfigStats accesses={sum(self.accesses.values())} hot={self.hot_keys(3)}>'
+
+
+def layer_label(index: int, layer: Any) -> str:
+    """How layers of composite configs are identified in stats: position and class."""
+    return f'{index}:{layer.__class__.__name__}'
+
+
+def log_exporter(
+    logger: Optional[logging.Logger] = None,
+    level: int = 20,
+) -> StatsExporter:
+    """An exporter that logs stats as JSON.
+
+    :param logger: The logger to use, `cfglib.stats` by default.
+    :param level: Logging level, INFO by default.
+    """
+    # Imported here since they're slow to import and rarely needed
+    import json  # pylint: disable=import-outside-toplevel
+    import logging  # pylint: disable=import-outside-toplevel
+
+    if logger is None:
+        logger = logging.getLogger('cfglib.stats')
+
+    def _export(snapshot: Dict[str, Any]):
+        logger.log(level, 'Config stats: %s', json.dumps(snapshot, default=str, sort_keys=True))
+
+    return _export
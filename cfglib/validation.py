@@ -1,4 +1,5 @@
-from typing import *
+import functools
+from typing import Any, Callable, FrozenSet, Iterable, List, Optional, Tuple, Union
 
 
 __all__ = [
@@ -7,6 +8,8 @@ __all__ = [
     'ValidationError',
 
     'value_type',
+    'one_of',
+    'value_range',
 ]
 
 
@@ -16,6 +19,13 @@ class ValidationContext:
 
 
 Validator = Callable[[ValidationContext, Any], Any]
+"""A validator takes a value and returns it, possibly converted, or raises ValidationError.
+
+A validator may also have a `batch` attribute: a function taking a context and a list
+of values that gives the same result as applying the validator to each value,
+but checks the whole list at once. It's used to validate the items of list settings.
+When a batch fails, the values are validated one by one to report the first invalid one.
+"""
 
 
 # Exceptions
@@ -25,31 +35,164 @@ class ValidationError(Exception):
 
 
 def value_type(type_spec: Union[type, Tuple[type, ...]]):
-    def _type_validator(ctx: ValidationContext, value: Any) -> Any:
-        if not isinstance(value, type_spec):
-            if isinstance(type_spec, type):
-                expected = type_spec.__name__
-            else:
-                expected = f'one of: {", ".join(t.__name__ for t in type_spec)}'
-
-            raise ValidationError(
-                f'The type of a value for setting {ctx.field_name or "<?>"}'
-                f' must be {expected}'
-            )
-
-        return value
-
-    return _type_validator
+    return _validator(_check_type, _check_type_batch, type_spec)
 
 
 def one_of(options: Iterable[Any]):
-    def _oneof_validator(ctx: ValidationContext, value: Any) -> Any:
-        if value not in options:
-            expected = f'one of: {", ".join(map(repr, options))}'
-            raise ValidationError(
-                f'A value for setting {ctx.field_name or "<?>"} must be {expected}'
-            )
-
-        return value
+    options = tuple(options)
+    try:
+        options_set = frozenset(options)
+    except TypeError:
+        # Unhashable options can only be checked one by one
+        return _validator(_check_option, None, options, None)
 
-    return _oneof_validator
+    return _validator(_check_option, _check_option_batch, options, options_set)
+
+
+def value_range(min_value: Any = None, max_value: Any = None):
+    """Check that min_value <= value <= max_value, either bound can be None.
+
+    Batches of floats are checked with NumPy if it's installed."""
+    return _validator(_check_range, _check_range_batch, min_value, max_value)
+
+
+# Built-in validators are partials of module-level functions rather than closures,
+# so that they can be pickled, e.g. to validate in a process pool
+def _validator(check: Callable, batch_check: Optional[Callable], *params: Any) -> Validator:
+    validator = functools.partial(check, *params)
+    if batch_check is not None:
+        validator.batch = functools.partial(batch_check, *params)  # type: ignore
+
+    return validator
+
+
+def _check_type(
+    type_spec: Union[type, Tuple[type, ...]],
+    ctx: ValidationContext,
+    value: Any,
+) -> Any:
+    if not isinstance(value, type_spec):
+        if isinstance(type_spec, type):
+            expected = type_spec.__name__
+        else:
+            expected = f'one of: {", ".join(t.__name__ for t in type_spec)}'
+
+        raise ValidationError(
+            f'The type of a value for setting {ctx.field_name or "<?>"}'
+            f' must be {expected}'
+        )
+
+    return value
+
+
+def _check_type_batch(
+    type_spec: Union[type, Tuple[type, ...]],
+    ctx: ValidationContext,
+    values: List[Any],
+) -> List[Any]:
+    if not all(issubclass(value_class, type_spec) for value_class in set(map(type, values))):
+        return [_check_type(type_spec, ctx, value) for value in values]
+
+    return values
+
+
+def _check_option(
+    options: Iterable[Any],
+    options_set: Optional[FrozenSet[Any]],  # pylint: disable=unused-argument
+    ctx: ValidationContext,
+    value: Any,
+) -> Any:
+    if value not in options:
+        expected = f'one of: {", ".join(map(repr, options))}'
+        raise ValidationError(
+            f'A value for setting {ctx.field_name or "<?>"} must be {expected}'
+        )
+
+    return value
+
+
+def _check_option_batch(
+    options: Iterable[Any],
+    options_set: FrozenSet[Any],
+    ctx: ValidationContext,
+    values: List[Any],
+) -> List[Any]:
+    try:
+        valid = options_set.issuperset(values)
+    except TypeError:
+        valid = False
+
+    if not valid:
+        return [_check_option(options, options_set, ctx, value) for value in values]
+
+    return values
+
+
+def _check_range(min_value: Any, max_value: Any, ctx: ValidationContext, value: Any) -> Any:
+    if (
+        (min_value is not None and value < min_value)
+        or (max_value is not None and value > max_value)
+    ):
+        raise ValidationError(
+            f'A value for setting {ctx.field_name or "<?>"} must be'
+            f' between {min_value} and {max_value}'
+        )
+
+    return value
+
+
+def _check_range_batch(
+    min_value: Any,
+    max_value: Any,
+    ctx: ValidationContext,
+    values: List[Any],
+) -> List[Any]:
+    if not values:
+        return values
+
+    value_types = set(map(type, values))
+    numpy = _numpy()
+    if value_types <= {int, bool}:
+        valid = (
+            (min_value is None or not min(values) < min_value)
+            and (max_value is None or not max(values) > max_value)
+        )
+    elif numpy is not None and value_types == {float} and len(values) >= _NUMPY_MIN_SIZE:
+        # Comparisons with NaN are false like in the scalar version
+        array = numpy.fromiter(values, dtype=float, count=len(values))
+        valid = not (
+            (min_value is not None and (array < min_value).any())
+            or (max_value is not None and (array > max_value).any())
+        )
+    else:
+        valid = not any(
+            (min_value is not None and value < min_value)
+            or (max_value is not None and value > max_value)
+            for value in values
+        )
+
+    if not valid:
+        return [_check_range(min_value, max_value, ctx, value) for value in values]
+
+    return values
+
+
+# Smaller lists of floats are faster to check without converting them
+_NUMPY_MIN_SIZE = 64
+
+_numpy_module: Any = None
+
+
+def _numpy() -> Any:
+    """NumPy if it's installed, None otherwise. Imported on first use
+    so that it doesn't slow down importing cfglib."""
+    global _numpy_module  # pylint: disable=global-statement
+    if _numpy_module is None:
+        try:
+            import numpy  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            numpy = False
+
+        _numpy_module = numpy
+
+    return _numpy_module or None
@@ -1,10 +1,10 @@
 import argparse
-import json
 import sys
 
 import cfglib
 from cfglib.sources.args import ArgsNamespaceConfig
 from cfglib.sources.env import EnvConfig
+from cfglib.sources.file import JsonFileConfig
 
 
 # Config definitions
@@ -12,9 +12,8 @@ from cfglib.sources.env import EnvConfig
 # to be imported by the rest of the project like:
 # from xyz.config import cfg
 def parse_config_file(config_file_path) -> cfglib.Config:
-    with open(config_file_path) as config_file:
-        file_config = cfglib.DictConfig(json.load(config_file))
-        return cfglib.ProjectedConfig(file_config, cfglib.UPPERCASE_PROJECTION)
+    file_config = JsonFileConfig(config_file_path)
+    return cfglib.ProjectedConfig(file_config, cfglib.UPPERCASE_PROJECTION)
 
 
 class ExampleToolConfig(cfglib.SpecValidatedConfig):
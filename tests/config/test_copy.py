@@ -0,0 +1,53 @@
+import copy
+import pickle
+
+import cfglib
+from cfglib.sources.env import EnvConfigProjection
+
+
+def test_pickle_configs():
+    base = cfglib.DictConfig({'a': 1})
+    source = cfglib.DictConfig({'APP_B': 2, 'OTHER': 3})
+    projected = cfglib.ProjectedConfig(source, EnvConfigProjection('APP_'))
+    composite = cfglib.CompositeConfig([base, cfglib.ProxyConfig(projected)])
+    events = []
+    composite.subscribe(lambda *event: events.append(event))
+    assert composite == {'a': 1, 'B': 2}
+    assert 'OTHER' not in projected
+
+    restored = pickle.loads(pickle.dumps(composite))
+    assert restored == {'a': 1, 'B': 2}
+
+    # Sources of the restored configs notify them about changes
+    restored_base, restored_proxy = restored.subconfigs
+    restored_base['a'] = 10
+    restored_proxy.source.subconfig['APP_B'] = 20
+    assert restored == {'a': 10, 'B': 20}
+    assert 'OTHER' not in restored_proxy.source
+
+    restored.subconfigs.append(cfglib.DictConfig({'c': 3}))
+    assert restored['c'] == 3
+
+    # The original is unaffected
+    assert composite == {'a': 1, 'B': 2}
+    assert not events
+
+    assert pickle.loads(pickle.dumps(base)) == {'a': 1}
+
+
+def test_copy_configs():
+    source = cfglib.DictConfig({'a': 1})
+    composite = cfglib.CompositeConfig([source])
+    events = []
+    source.subscribe(lambda *event: events.append(event))
+    assert composite['a'] == 1
+
+    source_copy = copy.copy(source)
+    source_copy['a'] = 2
+    assert composite['a'] == 1
+    assert not events
+
+    composite_copy = copy.copy(composite)
+    source['a'] = 3
+    assert composite['a'] == composite_copy['a'] == 3
+    assert events == [('a', 1, 3)]
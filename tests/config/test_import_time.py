@@ -0,0 +1,75 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import cfglib
+
+
+# Budget for `import cfglib` itself, excluding the interpreter startup.
+# Can be raised on slow machines, or set to 0 to skip the check.
+IMPORT_TIME_BUDGET_US = int(os.environ.get('CFGLIB_IMPORT_TIME_BUDGET_US', 40_000))
+
+# Modules that are slow to import and only needed by some features
+LAZY_MODULES = [
+    'asyncio',
+    'concurrent.futures',
+    'hashlib',
+    'json',
+    'logging',
+    'pickle',
+    'tempfile',
+    'cfglib.frozen',
+    'cfglib.sources',
+]
+
+
+def _run_python(code, pycache_prefix, *options):
+    env = {key: value for key, value in os.environ.items() if key != 'PYTHONDONTWRITEBYTECODE'}
+    return subprocess.run(
+        [sys.executable, '-X', f'pycache_prefix={pycache_prefix}', *options, '-c', code],
+        env=env,
+        cwd=os.path.dirname(os.path.dirname(cfglib.__file__)),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_lazy_modules(tmp_path):
+    code = 'import sys, cfglib; print(" ".join(sys.modules))'
+    modules = set(_run_python(code, tmp_path).stdout.split())
+    assert 'cfglib.spec' in modules
+    assert not modules & set(LAZY_MODULES)
+
+
+@pytest.mark.skipif(not IMPORT_TIME_BUDGET_US, reason='No import time budget')
+def test_import_time(tmp_path):
+    # The first run writes bytecode, so that compiling isn't measured
+    _run_python('import cfglib', tmp_path)
+
+    times = []
+    for _ in range(3):
+        output = _run_python('import cfglib', tmp_path, '-X', 'importtime').stderr
+        cumulative_times = [
+            int(line.split('|')[1])
+            for line in output.splitlines()
+            if line.split('|')[-1].strip() == 'cfglib'
+        ]
+        times.append(cumulative_times[0])
+
+    assert min(times) < IMPORT_TIME_BUDGET_US
+
+
+def test_lazy_attributes():
+    assert cfglib.FrozenConfig is cfglib.frozen.FrozenConfig
+    assert cfglib.sources.EnvConfig is cfglib.sources.env.EnvConfig
+    assert 'sources' in dir(cfglib)
+    assert 'HttpConfig' in dir(cfglib.sources)
+
+    with pytest.raises(AttributeError):
+        _ = cfglib.NoSuchThing
+
+    with pytest.raises(AttributeError):
+        _ = cfglib.sources.NoSuchConfig
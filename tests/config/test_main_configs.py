@@ -100,3 +100,164 @@ def test_to_cfg():
 
     with raises(TypeError):
         cfglib.to_cfg(5)
+
+
+def test_dict_config_mutations_notify():
+    source_cfg = cfglib.DictConfig({'x': 1})
+
+    class _Dependent(cfglib.DictConfig):
+        def __init__(self):
+            super().__init__()
+            self.invalidations = []
+
+        def _invalidate(self, keys=None):
+            self.invalidations.append(set(keys))
+
+    dependent = _Dependent()
+    source_cfg._add_dependent(dependent)  # pylint: disable=protected-access
+
+    source_cfg['y'] = 2
+    del source_cfg['y']
+    source_cfg.update(z=3)
+    source_cfg.pop('z')
+    source_cfg.setdefault('x', 5)
+    source_cfg.setdefault('w', 5)
+    source_cfg |= {'v': 6}
+    source_cfg.update([('u', 7)], t=8)
+    source_cfg.update()
+    source_cfg.popitem()
+    source_cfg.clear()
+    source_cfg.clear()
+    assert dependent.invalidations == [
+        {'y'}, {'y'}, {'z'}, {'z'}, {'w'}, {'v'}, {'u', 't'}, {'t'}, {'x', 'w', 'v', 'u'},
+    ]
+
+
+def test_composite_config_index():
+    low = cfglib.DictConfig({'x': 'low', 'y': 'low'})
+    high = cfglib.DictConfig({'x': 'high'})
+    composite_config = cfglib.CompositeConfig([low, high])
+    assert composite_config['x'] == 'high'
+    assert composite_config['y'] == 'low'
+
+    high['y'] = 'high'
+    assert composite_config['y'] == 'high'
+
+    del high['x']
+    assert composite_config['x'] == 'low'
+
+    composite_config.subconfigs.append(cfglib.DictConfig({'z': 'top'}))
+    assert composite_config['z'] == 'top'
+
+    composite_config.subconfigs.pop()
+    with raises(KeyError):
+        _ = composite_config['z']
+
+    nested_config = cfglib.CompositeConfig([composite_config])
+    assert nested_config['x'] == 'low'
+    low['x'] = 'changed'
+    assert nested_config['x'] == 'changed'
+
+
+def test_composite_config_untracked():
+    data = {'x': 1}
+    composite_config = cfglib.CompositeConfig([
+        cfglib.DictConfig({'x': 0}),
+        cfglib.ProxyConfig(data),
+    ])
+    assert composite_config['x'] == 1
+
+    del data['x']
+    assert composite_config['x'] == 0
+
+
+def test_composite_config_keys():
+    low = cfglib.DictConfig({'x': 1})
+    composite_config = cfglib.CompositeConfig([low, cfglib.DictConfig({'x': 2, 'y': 3})])
+    assert len(composite_config) == 2
+    assert set(composite_config) == {'x', 'y'}
+
+    low['z'] = 4
+    assert len(composite_config) == 3
+    assert set(composite_config) == {'x', 'y', 'z'}
+
+    composite_config.subconfigs.clear()
+    assert len(composite_config) == 0
+
+
+def test_composite_config_removed_subconfigs():
+    class _CountingConfig(cfglib.CompositeConfig):
+        invalidations = 0
+
+        def _invalidate(self, keys=None):
+            self.invalidations += 1
+            super()._invalidate(keys)
+
+    low = cfglib.DictConfig({'x': 1})
+    high = cfglib.DictConfig({'x': 2})
+    composite_config = _CountingConfig([low, high])
+    events = []
+    composite_config.subscribe(lambda *event: events.append(event))
+
+    composite_config.subconfigs.remove(high)
+    assert events == [('x', 2, 1)]
+
+    # Removed and replaced subconfigs don't reach the composite config anymore
+    old_subconfigs = composite_config.subconfigs
+    composite_config.subconfigs = [cfglib.DictConfig({'x': 3})]
+    invalidations = composite_config.invalidations
+    high['x'] = 20
+    low['x'] = 10
+    old_subconfigs.append(high)
+    assert composite_config.invalidations == invalidations
+    assert events == [('x', 2, 1), ('x', 1, 3)]
+
+
+def test_caching_config_diff():
+    source_cfg = cfglib.DictConfig({'x': 1, 'y': 2, 'z': 3})
+    cached_cfg = cfglib.CachingConfig(source_cfg)
+    composite_config = cfglib.CompositeConfig([cached_cfg])
+    assert len(composite_config) == 3
+
+    diff = cached_cfg.reload()
+    assert not diff
+    assert diff == cfglib.ConfigDiff()
+
+    source_cfg['x'] = 10
+    source_cfg['w'] = 0
+    del source_cfg['z']
+    diff = cached_cfg.reload()
+    assert diff == cfglib.ConfigDiff(added=['w'], removed=['z'], changed=['x'])
+    assert diff.keys == {'w', 'x', 'z'}
+    assert diff.old_values == {'x': 1, 'z': 3}
+    assert 'ConfigDiff' in repr(diff)
+
+    assert cached_cfg == {'x': 10, 'y': 2, 'w': 0}
+    assert composite_config['w'] == 0
+    assert len(composite_config) == 3
+
+
+def test_composite_get_many():
+    lower = cfglib.DictConfig({'a': 1, 'b': 2})
+    upper = cfglib.DictConfig({'b': 3})
+    cfg = cfglib.CompositeConfig([lower, upper])
+
+    assert cfg.get_many(['a', 'b']) == (1, 3)
+    assert cfg.get_many([]) == ()
+
+    with raises(KeyError):
+        cfg.get_many(['a', 'c'])
+
+    assert cfg.get_many(['a', 'c'], default=None) == (1, None)
+
+    values = cfg.get_many(['a', 'b'], named=True)
+    assert values.a == 1
+    assert values.b == 3
+    assert values == (1, 3)
+
+    # Untracked layers aren't indexed
+    source = {'c': 4}
+    cfg.subconfigs.append(cfglib.ProxyConfig(source))
+    assert cfg.get_many(['a', 'b', 'c']) == (1, 3, 4)
+    source['a'] = 5
+    assert cfg.get_many(['a', 'b', 'c']) == (5, 3, 4)
@@ -238,3 +238,74 @@ def test_env_projection():
 
     with raises(KeyError):
         _ = projected_cfg['prefix_b']
+
+
+def test_projection_memoized():
+    calls = []
+
+    def _key_to_sourcekey(key):
+        calls.append(key)
+        return key.lower()
+
+    projection = cfglib.BasicConfigProjection(
+        key_to_sourcekey=_key_to_sourcekey,
+        sourcekey_to_key=str.upper,
+    )
+    source_cfg = cfglib.DictConfig({'a': 4, 'b': 5})
+    projected_cfg = cfglib.ProjectedConfig(source_cfg, projection)
+
+    assert projected_cfg['A'] == 4
+    assert len(projected_cfg) == 2
+    calls.clear()
+
+    assert projected_cfg['A'] == 4
+    assert list(projected_cfg) == ['A', 'B']
+    assert len(projected_cfg) == 2
+    assert not calls
+
+    source_cfg['c'] = 6
+    assert len(projected_cfg) == 3
+    assert projected_cfg['C'] == 6
+
+    projected_cfg.subconfig = cfglib.DictConfig({'d': 7})
+    assert list(projected_cfg) == ['D']
+
+    projected_cfg.projection = cfglib.BasicConfigProjection()
+    assert list(projected_cfg) == ['d']
+
+
+def test_projection_memo_bounded():
+    calls = []
+
+    def _key_to_sourcekey(key):
+        calls.append(key)
+        return key.lower()
+
+    class _SmallMemoConfig(cfglib.ProjectedConfig):
+        max_memoized_keys = 2
+
+    projection = cfglib.BasicConfigProjection(
+        key_to_sourcekey=_key_to_sourcekey,
+        sourcekey_to_key=str.upper,
+    )
+    projected_cfg = _SmallMemoConfig(cfglib.ProxyConfig({'a': 4}), projection)
+
+    for key in ['A', 'X', 'Y']:
+        projected_cfg.get(key)
+    calls.clear()
+
+    # Only the latest translations are kept
+    assert projected_cfg.get('Y') is None
+    assert not calls
+    assert projected_cfg['A'] == 4
+    assert calls
+
+
+def test_projection_untracked_source():
+    data = {'a': 4}
+    projected_cfg = cfglib.ProjectedConfig(cfglib.ProxyConfig(data), cfglib.UPPERCASE_PROJECTION)
+    assert len(projected_cfg) == 1
+
+    data['b'] = 5
+    assert len(projected_cfg) == 2
+    assert projected_cfg['B'] == 5
@@ -0,0 +1,106 @@
+import logging
+
+import pytest
+
+import cfglib
+from cfglib.stats import log_exporter
+
+
+def test_composite_config_stats():
+    cfg = cfglib.CompositeConfig([
+        cfglib.DictConfig({'a': 1, 'b': 2}),
+        cfglib.DictConfig({'b': 3}),
+    ])
+    stats = cfg.instrument()
+
+    for _ in range(3):
+        assert cfg['a'] == 1
+
+    assert cfg['b'] == 3
+    with pytest.raises(KeyError):
+        _ = cfg['c']
+
+    assert stats.accesses == {'a': 3, 'b': 1, 'c': 1}
+    assert stats.misses == {'c': 1}
+    assert stats.resolved_by == {'a': {'0:DictConfig': 3}, 'b': {'1:DictConfig': 1}}
+    assert stats.layer_misses == {'1:DictConfig': 4, '0:DictConfig': 1}
+    assert stats.hot_keys(1) == [('a', 3)]
+    assert 'accesses=5' in repr(stats)
+
+    cfg.uninstrument()
+    assert cfg['a'] == 1
+    assert stats.accesses['a'] == 3
+
+
+def test_projected_config_stats():
+    source = cfglib.DictConfig({'A': 1, 'b': 2})
+    cfg = cfglib.ProjectedConfig(source, cfglib.LOWERCASE_PROJECTION)
+    stats = cfg.instrument()
+
+    assert cfg['a'] == 1
+    with pytest.raises(KeyError):
+        _ = cfg['c']
+
+    with pytest.raises(KeyError):
+        _ = cfg['B']
+
+    assert stats.accesses == {'a': 1, 'c': 1, 'B': 1}
+    assert stats.misses == {'c': 1, 'B': 1}
+
+
+def test_spec_validated_config_stats():
+    class TestConfig(cfglib.SpecValidatedConfig):
+        cache_values = True
+
+        name = cfglib.StringSetting(default='x')
+        port = cfglib.IntSetting(on_missing=cfglib.LEAVE)
+
+    cfg = TestConfig([cfglib.DictConfig({'name': 'a'}), cfglib.DictConfig({})], validate=False)
+    stats = cfglib.ConfigStats()
+    assert cfg.instrument(stats) is stats
+
+    assert cfg.name == 'a'
+    assert cfg.name == 'a'
+    with pytest.raises(KeyError):
+        _ = cfg['port']
+
+    with pytest.raises(KeyError):
+        _ = cfg['unknown']
+
+    assert stats.accesses == {'name': 2, 'port': 1, 'unknown': 1}
+    assert stats.misses == {'port': 1, 'unknown': 1}
+    assert stats.resolved_by == {'name': {'0:DictConfig': 1}}
+    assert stats.validations == {'name': 1, 'port': 1}
+    assert set(stats.validation_time) == {'name', 'port'}
+
+    cfg.subconfigs[0]['name'] = 'b'
+    cfg.validate()
+    assert stats.validations == {'name': 2, 'port': 2}
+
+
+def test_stats_export(caplog):
+    exported = []
+    stats = cfglib.ConfigStats(exporter=exported.append)
+    cfg = cfglib.CompositeConfig([cfglib.DictConfig({'a': 1})])
+    cfg.instrument(stats)
+    _ = cfg['a']
+
+    stats.export(reset=True)
+    assert exported == [{
+        'accesses': {'a': 1},
+        'misses': {},
+        'resolved_by': {'a': {'0:DictConfig': 1}},
+        'layer_misses': {},
+        'validations': {},
+        'validation_time': {},
+    }]
+    assert not stats.accesses
+
+    stats.exporter = log_exporter()
+    with caplog.at_level(logging.INFO, logger='cfglib.stats'):
+        stats.export()
+
+    assert 'Config stats' in caplog.text
+
+    with pytest.raises(ValueError):
+        cfglib.ConfigStats().export()
@@ -0,0 +1,105 @@
+import cfglib
+
+
+def test_subscribe_keys():
+    events = []
+
+    low = cfglib.DictConfig({'x': 1, 'y': 2})
+    high = cfglib.DictConfig()
+    composite_config = cfglib.CompositeConfig([low, high])
+    subscription = composite_config.subscribe(
+        lambda *event: events.append(event),
+        keys=['x'],
+    )
+
+    low['y'] = 3
+    assert not events
+
+    high['x'] = 1
+    assert not events
+
+    high['x'] = 10
+    assert events == [('x', 1, 10)]
+
+    low['x'] = 5
+    assert events == [('x', 1, 10)]
+
+    events.clear()
+    del high['x']
+    del low['x']
+    assert events == [('x', 10, 5), ('x', 5, cfglib.MISSING)]
+
+    events.clear()
+    subscription.cancel()
+    low['x'] = 6
+    assert not events
+
+
+def test_subscribe_prefixes():
+    events = []
+
+    source_cfg = cfglib.DictConfig({'db_host': 'a', 'db_port': 1, 'other': 0})
+    cached_cfg = cfglib.CachingConfig(source_cfg)
+    cached_cfg.subscribe(lambda *event: events.append(event), prefixes=['db_'])
+
+    source_cfg['db_port'] = 2
+    source_cfg['db_user'] = 'user'
+    source_cfg['other'] = 1
+    assert not events
+
+    cached_cfg.reload()
+    assert sorted(events) == [('db_port', 1, 2), ('db_user', cfglib.MISSING, 'user')]
+
+
+def test_subscribe_reload_batched():
+    events = []
+
+    low_source = cfglib.DictConfig({'x': 1})
+    high_source = cfglib.DictConfig({})
+    composite_config = cfglib.CompositeConfig([
+        cfglib.CachingConfig(low_source),
+        cfglib.CachingConfig(high_source),
+    ])
+    composite_config.subscribe(lambda *event: events.append(event))
+
+    low_source['x'] = 2
+    high_source['x'] = 3
+    composite_config.reload()
+    assert events == [('x', 1, 3)]
+
+
+def test_subscribe_untracked():
+    events = []
+
+    data = {'x': 1}
+    composite_config = cfglib.CompositeConfig([cfglib.ProxyConfig(data)])
+    composite_config.subscribe(lambda *event: events.append(event), keys=['x'])
+
+    data['x'] = 2
+    assert not events
+
+    composite_config.reload()
+    assert events == [('x', 1, 2)]
+
+
+def test_subscribe_spec_validated_config():
+    events = []
+
+    class TestConfig(cfglib.SpecValidatedConfig):
+        cache_values = True
+
+        x = cfglib.IntSetting(default=0)
+        y = cfglib.IntSetting(default=0)
+
+    source_cfg = cfglib.DictConfig({'x': 1})
+    cfg = TestConfig([source_cfg])
+    cfg.subscribe(lambda *event: events.append(event), keys=['x'])
+
+    source_cfg['x'] = 'invalid'
+    assert not events
+
+    source_cfg['x'] = 2
+    assert cfg.x == 2
+    del source_cfg['x']
+    source_cfg['y'] = 1
+    assert events == [('x', 1, 2), ('x', 2, 0)]
@@ -0,0 +1,65 @@
+import asyncio
+import time
+
+import pytest
+
+import cfglib
+from cfglib.sources.aio import AsyncSourceConfig
+
+
+class _SlowSource(AsyncSourceConfig):
+    def __init__(self, contents, delay=0.0):
+        super().__init__()
+        self.contents = contents
+        self.delay = delay
+        self.started = self.finished = None
+
+    async def fetch(self):
+        self.started = time.monotonic()
+        await asyncio.sleep(self.delay)
+        self.finished = time.monotonic()
+        return self.contents
+
+
+def test_async_source():
+    source = _SlowSource({'x': 1})
+    assert source == {}
+
+    assert source.reload() == cfglib.ConfigDiff(added=['x'])
+    assert source == {'x': 1}
+
+    source.contents = None
+    assert not source.reload()
+    assert source == {'x': 1}
+
+    async def _reload_in_loop():
+        with pytest.raises(RuntimeError):
+            source.reload()
+
+        source.contents = {'x': 2}
+        return await source.loaded()
+
+    assert asyncio.run(_reload_in_loop()) == {'x': 2}
+
+
+def test_composite_areload_concurrent():
+    class TestConfig(cfglib.SpecValidatedConfig):
+        read_copy_update = True
+
+        x = cfglib.IntSetting(default=0)
+        y = cfglib.IntSetting(default=0)
+
+    sources = [_SlowSource({'x': 1}, delay=0.05), _SlowSource({'y': 2}, delay=0.05)]
+    cfg = TestConfig([cfglib.DictConfig(), cfglib.CompositeConfig(sources)])
+    assert cfg.snapshot() == {'x': 0, 'y': 0}
+
+    events = []
+    cfg.subscribe(lambda *event: events.append(event))
+
+    asyncio.run(cfg.areload())
+
+    # The sources were fetched at the same time
+    assert max(source.started for source in sources) < min(source.finished for source in sources)
+
+    assert cfg.snapshot() == {'x': 1, 'y': 2}
+    assert sorted(events) == [('x', 0, 1), ('y', 0, 2)]
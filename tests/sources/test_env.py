@@ -45,3 +45,35 @@ def test_env_config_projection():
 
     with pytest.raises(KeyError):
         cfg['test_var_inserted_UPPERCASE'] = '10'
+
+
+def test_env_config_snapshot():
+    os.environ['__CFGLIB_SNAPSHOT_VAR'] = 'testval'
+    cfg = EnvConfig(prefix='__CFGLIB_SNAPSHOT_', lowercase=True, live=False)
+    assert cfg.snapshot() == {'var': 'testval'}
+
+    os.environ['__CFGLIB_SNAPSHOT_VAR'] = 'testval2'
+    os.environ['__CFGLIB_SNAPSHOT_OTHER'] = 'other'
+    assert cfg['var'] == 'testval'
+    assert len(cfg) == 1
+
+    cfg.reload()
+    assert cfg['var'] == 'testval2'
+    assert cfg['other'] == 'other'
+
+    cfg['inserted'] = '9'
+    assert os.environ['__CFGLIB_SNAPSHOT_INSERTED'] == '9'
+    assert cfg['inserted'] == '9'
+
+    del cfg['inserted']
+    assert '__CFGLIB_SNAPSHOT_INSERTED' not in os.environ
+    with pytest.raises(KeyError):
+        _ = cfg['inserted']
+
+    with pytest.raises(KeyError):
+        cfg['INSERTED'] = '10'
+
+    del os.environ['__CFGLIB_SNAPSHOT_VAR']
+    del os.environ['__CFGLIB_SNAPSHOT_OTHER']
+    cfg.reload()
+    assert not cfg
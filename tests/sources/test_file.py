@@ -0,0 +1,96 @@
+import asyncio
+import os
+import sys
+
+import pytest
+
+import cfglib
+from cfglib.sources.file import JsonFileConfig, TomlFileConfig
+
+
+def test_json_file_config(tmp_path):
+    path = tmp_path / 'cfg.json'
+    path.write_text('{"a": 1, "b": [2]}')
+
+    cfg = JsonFileConfig(path)
+    assert cfg == {'a': 1, 'b': [2]}
+    assert 'cfg.json' in repr(cfg)
+    assert not cfg.reload()
+
+    path.write_text('{"a": 3, "c": 4}')
+    os.utime(path, ns=(0, 0))
+    assert cfg.reload() == cfglib.ConfigDiff(added=['c'], removed=['b'], changed=['a'])
+    assert cfg == {'a': 3, 'c': 4}
+
+
+def test_file_config_unchanged_stat(tmp_path):
+    path = tmp_path / 'cfg.json'
+    path.write_text('{"a": 1}')
+    os.utime(path, ns=(0, 0))
+    cfg = JsonFileConfig(path)
+
+    # Same size, mtime and inode: the file is not reread
+    path.write_text('{"a": 2}')
+    os.utime(path, ns=(0, 0))
+    assert not cfg.reload()
+    assert cfg['a'] == 1
+
+
+def test_file_config_replaced(tmp_path):
+    path = tmp_path / 'cfg.json'
+    path.write_text('{"a": 1}')
+    cfg = JsonFileConfig(path)
+
+    new_path = tmp_path / 'cfg.json.new'
+    new_path.write_text('{"a": 2}')
+    os.replace(new_path, path)
+    cfg.reload()
+    assert cfg['a'] == 2
+
+
+def test_file_config_missing(tmp_path):
+    path = tmp_path / 'cfg.json'
+
+    with pytest.raises(FileNotFoundError):
+        _ = JsonFileConfig(path)
+
+    cfg = JsonFileConfig(path, required=False)
+    assert cfg == {}
+
+    path.write_text('{"a": 1}')
+    cfg.reload()
+    assert cfg == {'a': 1}
+
+    path.unlink()
+    cfg.reload()
+    assert cfg == {}
+
+
+def test_file_config_not_mapping(tmp_path):
+    path = tmp_path / 'cfg.json'
+    path.write_text('[1, 2]')
+
+    with pytest.raises(ValueError):
+        _ = JsonFileConfig(path)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason='tomllib requires Python 3.11')
+def test_toml_file_config(tmp_path):
+    path = tmp_path / 'cfg.toml'
+    path.write_text('a = 1\n[db]\nhost = "localhost"\n')
+
+    cfg = TomlFileConfig(path)
+    assert cfg == {'a': 1, 'db': {'host': 'localhost'}}
+
+
+def test_file_config_areload(tmp_path):
+    path = tmp_path / 'cfg.json'
+    path.write_text('{"a": 1}')
+    cfg = cfglib.CachingConfig(cfglib.ProjectedConfig(
+        JsonFileConfig(path),
+        cfglib.UPPERCASE_PROJECTION,
+    ))
+
+    path.write_text('{"a": 22}')
+    assert asyncio.run(cfg.areload()) == cfglib.ConfigDiff(changed=['A'])
+    assert cfg['A'] == 22
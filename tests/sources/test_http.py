@@ -0,0 +1,173 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import cfglib
+from cfglib.sources.http import HttpConfig, HttpConfigError
+
+
+class _ConfigServer(ThreadingHTTPServer):  # pylint: disable=too-many-instance-attributes
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), _Handler)
+        self.document = {'x': 1}
+        self.version = 1
+        self.status = 200
+        self.connections = 0
+        self.full_responses = 0
+        self.requests = 0
+        self.long_polling = True
+        self.changed = threading.Condition()
+
+    def update(self, document):
+        with self.changed:
+            self.document = document
+            self.version += 1
+            self.changed.notify_all()
+
+    @property
+    def url(self):
+        return f'http://127.0.0.1:{self.server_address[1]}/config?env=test'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    server: _ConfigServer
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        assert self.path == '/config?env=test'
+        self.server.requests += 1
+        if self.server.status != 200:
+            self._respond(self.server.status, b'')
+            return
+
+        etag = f'"{self.server.version}"'
+        if self.headers.get('If-None-Match') == etag:
+            prefer = self.headers.get('Prefer', '')
+            if prefer.startswith('wait=') and self.server.long_polling:
+                with self.server.changed:
+                    self.server.changed.wait_for(
+                        lambda: f'"{self.server.version}"' != etag,
+                        timeout=float(prefer[len('wait='):]),
+                    )
+
+        etag = f'"{self.server.version}"'
+        if self.headers.get('If-None-Match') == etag:
+            self._respond(304, b'')
+            return
+
+        self.server.full_responses += 1
+        self._respond(200, json.dumps(self.server.document).encode(), etag)
+
+    def _respond(self, status, body, etag=None):
+        self.send_response(status)
+        if etag:
+            self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+@pytest.fixture(name='server')
+def _server():
+    config_server = _ConfigServer()
+    thread = threading.Thread(target=config_server.serve_forever, daemon=True)
+    thread.start()
+    yield config_server
+    config_server.shutdown()
+    config_server.server_close()
+
+
+def test_http_config(server):
+    cfg = HttpConfig(server.url)
+    assert cfg == {'x': 1}
+    assert 'HttpConfig' in repr(cfg)
+
+    for _ in range(5):
+        assert not cfg.reload()
+
+    server.update({'x': 2})
+    assert cfg.reload() == cfglib.ConfigDiff(changed=['x'])
+    assert cfg == {'x': 2}
+
+    assert server.connections == 1
+    assert server.full_responses == 2
+    cfg.close()
+
+
+def test_http_config_stale_on_error(server):
+    cfg = HttpConfig(server.url)
+
+    server.status = 500
+    assert not cfg.reload()
+    assert cfg == {'x': 1}
+    assert isinstance(cfg.last_error, HttpConfigError)
+
+    server.status = 200
+    server.update({'x': 2})
+    cfg.reload()
+    assert cfg == {'x': 2}
+    assert cfg.last_error is None
+
+    strict_cfg = HttpConfig(server.url, stale_on_error=False)
+    server.status = 500
+    with pytest.raises(HttpConfigError):
+        strict_cfg.reload()
+
+    with pytest.raises(HttpConfigError):
+        _ = HttpConfig(server.url)
+
+    with pytest.raises(ValueError):
+        _ = HttpConfig('ftp://localhost/config')
+
+    with pytest.raises(ValueError):
+        _ = HttpConfig('http:///config')
+
+
+def test_http_config_watch(server):
+    cfg = HttpConfig(server.url)
+    composite_config = cfglib.CompositeConfig([cfg])
+
+    cfg.start_watching(wait=5)
+    try:
+        time.sleep(0.1)
+        server.update({'x': 3})
+
+        deadline = time.monotonic() + 5
+        while composite_config['x'] != 3:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+    finally:
+        server.update({'x': 4})
+        cfg.close()
+
+
+def test_http_config_watch_interval(server):
+    server.long_polling = False
+    cfg = HttpConfig(server.url)
+
+    started = time.monotonic()
+    cfg.start_watching(wait=5, min_interval=0.1)
+    try:
+        # The initial load and three requests of the watcher
+        deadline = started + 5
+        while server.requests < 4:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+    finally:
+        cfg.close()
+
+    # The watcher's requests start at least 0.1s apart
+    assert time.monotonic() - started >= 0.2
+    assert cfg.last_error is None
@@ -0,0 +1,172 @@
+import multiprocessing
+import os
+import stat
+import sys
+
+import pytest
+
+import cfglib
+from cfglib.sources.shared import SharedSnapshotConfig, SnapshotPublisher, default_snapshot_path
+
+
+class _DbConfig(cfglib.SpecValidatedConfig):
+    host = cfglib.StringSetting(default='localhost')
+    port = cfglib.IntSetting(default=5432)
+
+
+class _ToolConfig(cfglib.SpecValidatedConfig):
+    name = cfglib.StringSetting()
+    db = cfglib.DictSetting(subtype=_DbConfig, default={})
+    tags = cfglib.ListSetting(default=[])
+    comment = cfglib.StringSetting(on_missing=cfglib.LEAVE)
+
+
+def test_shared_snapshot(tmp_path):
+    path = tmp_path / 'tool.snapshot'
+    source = cfglib.DictConfig({'name': 'tool', 'db': {'port': 1}})
+
+    with SnapshotPublisher(_ToolConfig([source]), path) as publisher:
+        cfg = SharedSnapshotConfig(path)
+        assert cfg == {'name': 'tool', 'db': {'host': 'localhost', 'port': 1}, 'tags': []}
+        assert cfg.generation == 0
+        assert 'tool.snapshot' in repr(cfg)
+
+        assert not cfg.is_stale
+        assert not cfg.reload()
+
+        source['tags'] = ['x'] * 10_000
+        assert publisher.publish() == 2
+        assert cfg.is_stale
+        assert cfg.reload() == cfglib.ConfigDiff(changed=['tags'])
+        assert cfg['tags'] == ['x'] * 10_000
+        assert cfg.generation == 2
+
+        composite_config = cfglib.CompositeConfig([cfg])
+        source['name'] = 'renamed'
+        assert composite_config['name'] == 'tool'
+        publisher.publish()
+        cfg.reload()
+        assert composite_config['name'] == 'renamed'
+
+        cfg.close()
+
+    with pytest.raises(ValueError):
+        publisher.publish()
+
+
+def test_shared_snapshot_invalid_file(tmp_path):
+    path = tmp_path / 'garbage'
+    path.write_bytes(b'x' * 100)
+
+    with pytest.raises(ValueError):
+        _ = SharedSnapshotConfig(path)
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='Requires POSIX permissions')
+def test_restarted_publisher(tmp_path):
+    path = tmp_path / 'tool.snapshot'
+    source = cfglib.DictConfig({'name': 'tool'})
+
+    with SnapshotPublisher(_ToolConfig([source]), path) as publisher:
+        publisher.publish()
+    cfg = SharedSnapshotConfig(path)
+    assert cfg.generation == 2
+
+    # Attached workers see the snapshots of the new publisher
+    source['name'] = 'restarted'
+    with SnapshotPublisher(_ToolConfig([source]), path) as publisher:
+        assert cfg.reload() == cfglib.ConfigDiff(changed=['name'])
+        assert cfg['name'] == 'restarted'
+        assert cfg.generation == 4
+
+        source['tags'] = ['x'] * 10_000
+        assert publisher.publish() == 6
+        cfg.reload()
+        assert cfg['tags'] == ['x'] * 10_000
+
+    cfg.close()
+
+
+def test_shared_snapshot_timeout(tmp_path):
+    path = tmp_path / 'tool.snapshot'
+    with SnapshotPublisher(_ToolConfig([cfglib.DictConfig({'name': 'tool'})]), path) as publisher:
+        cfg = SharedSnapshotConfig(path, timeout=0.01)
+
+        # A publisher that died while writing leaves an odd generation
+        with open(path, 'r+b') as file:
+            file.seek(8)
+            file.write((3).to_bytes(8, 'little'))
+
+        with pytest.raises(TimeoutError):
+            cfg.reload()
+        assert cfg['name'] == 'tool'
+
+        publisher.publish()
+        assert not cfg.reload()
+        assert cfg.generation == 2
+        cfg.close()
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='Requires POSIX permissions')
+def test_shared_snapshot_permissions(tmp_path):
+    path = tmp_path / 'tool.snapshot'
+    config = _ToolConfig([cfglib.DictConfig({'name': 'tool'})])
+
+    with pytest.raises(ValueError):
+        _ = SnapshotPublisher(config, path, mode=0o666)
+
+    with SnapshotPublisher(config, path, mode=0o640):
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o640
+        assert SharedSnapshotConfig(path)['name'] == 'tool'
+
+        with pytest.raises(PermissionError, match='untrusted user'):
+            _ = SharedSnapshotConfig(path, owners=[os.getuid() + 1])
+
+        os.chmod(path, 0o662)
+        with pytest.raises(PermissionError, match='writable'):
+            _ = SharedSnapshotConfig(path)
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='Requires POSIX permissions')
+def test_default_snapshot_path():
+    path = default_snapshot_path('cfglib-test')
+    directory = os.path.dirname(path)
+    assert os.path.basename(directory) == f'cfglib-{os.getuid()}'
+    assert stat.S_IMODE(os.stat(directory).st_mode) == 0o700
+    assert default_snapshot_path('cfglib-test') == path
+
+
+def _worker(path, queue):
+    cfg = SharedSnapshotConfig(path)
+    queue.put(dict(cfg))
+    while cfg['name'] != 'done':
+        cfg.reload()
+
+    queue.put(cfg.generation)
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='Requires fork')
+def test_shared_snapshot_between_processes(tmp_path):
+    path = tmp_path / 'tool.snapshot'
+    source = cfglib.DictConfig({'name': 'tool'})
+    publisher = SnapshotPublisher(_ToolConfig([source]), path)
+
+    context = multiprocessing.get_context('fork')
+    queue = context.Queue()
+    process = context.Process(target=_worker, args=(str(path), queue))
+    process.start()
+    try:
+        assert queue.get(timeout=10)['name'] == 'tool'
+
+        for i in range(100):
+            source['tags'] = list(range(i * 100))
+            publisher.publish()
+
+        source['name'] = 'done'
+        generation = publisher.publish()
+        assert queue.get(timeout=10) == generation
+    finally:
+        process.join(timeout=10)
+        publisher.unlink()
+
+    assert not path.exists()
@@ -0,0 +1,122 @@
+import gc
+import os
+import sys
+import time
+
+import pytest
+
+import cfglib
+from cfglib.sources.file import JsonFileConfig
+from cfglib.sources.watch import FileWatcher
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError('Condition not reached in time')
+        time.sleep(0.01)
+
+
+def _write_json(path, text):
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as file:
+        file.write(text)
+    os.replace(tmp_path, path)
+
+
+@pytest.mark.parametrize('use_inotify', [
+    pytest.param(True, marks=pytest.mark.skipif(
+        not sys.platform.startswith('linux'), reason='inotify is Linux only',
+    )),
+    False,
+])
+def test_watcher_reloads_changed_config(tmp_path, use_inotify):
+    changed_path = tmp_path / 'changed.json'
+    changed_path.write_text('{"x": 1}')
+    other_path = tmp_path / 'other.json'
+    other_path.write_text('{"y": 1}')
+
+    changed_cfg = JsonFileConfig(changed_path)
+    other_cfg = JsonFileConfig(other_path)
+    reloads = []
+    other_cfg.reload = lambda: reloads.append(other_cfg)  # type: ignore
+
+    class TestConfig(cfglib.SpecValidatedConfig):
+        cache_values = True
+
+        x = cfglib.IntSetting()
+        y = cfglib.IntSetting()
+
+    cfg = TestConfig([other_cfg, changed_cfg])
+    assert cfg.x == 1
+
+    with FileWatcher(
+        [changed_cfg, other_cfg],
+        debounce=0.01,
+        poll_interval=0.05 if not use_inotify else 60,
+        use_inotify=use_inotify,
+    ) as watcher:
+        assert watcher.uses_inotify == use_inotify
+
+        _write_json(changed_path, '{"x": 2}')
+        _wait_for(lambda: cfg.x == 2)
+
+    if use_inotify:
+        assert not reloads
+
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason='inotify is Linux only')
+def test_watcher_symlink_swap(tmp_path):
+    # The layout Kubernetes uses for mounted ConfigMaps
+    (tmp_path / 'v1').mkdir()
+    (tmp_path / 'v1' / 'cfg.json').write_text('{"x": 1}')
+    os.symlink('v1', tmp_path / '..data')
+    os.symlink('..data/cfg.json', tmp_path / 'cfg.json')
+
+    cfg = JsonFileConfig(tmp_path / 'cfg.json')
+    assert cfg['x'] == 1
+
+    with FileWatcher([cfg], debounce=0.01, poll_interval=60, use_inotify=True):
+        (tmp_path / 'v2').mkdir()
+        (tmp_path / 'v2' / 'cfg.json').write_text('{"x": 2}')
+        os.symlink('v2', tmp_path / '..data_tmp')
+        os.replace(tmp_path / '..data_tmp', tmp_path / '..data')
+
+        _wait_for(lambda: cfg['x'] == 2)
+
+
+def test_watcher_debounces_and_reports_errors(tmp_path):
+    path = tmp_path / 'cfg.json'
+    path.write_text('{"x": 1}')
+    cfg = JsonFileConfig(path)
+
+    errors = []
+    with FileWatcher(
+        [cfg],
+        debounce=0.2,
+        poll_interval=0.05,
+        on_error=lambda config, exc: errors.append(config),
+    ):
+        path.write_text('{"x": ')
+        _wait_for(lambda: errors)
+        assert cfg['x'] == 1
+
+        for i in range(10):
+            _write_json(path, f'{{"x": {i}}}')
+        _wait_for(lambda: cfg['x'] == 9)
+
+
+
+@pytest.mark.skipif(not os.path.isdir('/proc/self/fd'), reason='Requires /proc')
+def test_watcher_closes_fds_when_collected(tmp_path):
+    path = tmp_path / 'cfg.json'
+    path.write_text('{"x": 1}')
+    fds = set(os.listdir('/proc/self/fd'))
+
+    watcher = FileWatcher([JsonFileConfig(path)])
+    assert set(os.listdir('/proc/self/fd')) != fds
+
+    del watcher
+    gc.collect()
+    assert set(os.listdir('/proc/self/fd')) == fds
@@ -0,0 +1,110 @@
+import itertools
+
+import pytest
+
+import cfglib
+from cfglib.validation import one_of, value_type
+
+
+class _SubConfig(cfglib.SpecValidatedConfig):
+    x = cfglib.IntSetting(default=1)
+
+
+class _UpperStringSetting(cfglib.StringSetting):
+    def validate_value_custom(self, value):
+        return super().validate_value_custom(value).upper()
+
+
+class _NeverMissingSetting(cfglib.Setting):
+    def validate_value(self, value):
+        return 'never missing' if value is cfglib.MISSING else value
+
+
+def _settings():
+    actions = [cfglib.ERROR, cfglib.USE_DEFAULT, cfglib.LEAVE]
+    for i, (setting_type, on_missing, on_null, default) in enumerate(itertools.product(
+        [cfglib.Setting, cfglib.StringSetting, cfglib.BoolSetting, cfglib.IntSetting,
+         cfglib.FloatSetting, cfglib.DictSetting, cfglib.ListSetting, _UpperStringSetting],
+        actions,
+        actions,
+        [cfglib.MISSING, None],
+    )):
+        yield setting_type(
+            name=f's{i}', on_missing=on_missing, on_null=on_null, default=default,
+        )
+
+    yield cfglib.IntSetting(name='validated', validators=[value_type(int), one_of([1, 2])])
+    yield cfglib.DictSetting(name='sub', subtype=_SubConfig, default=None)
+    yield cfglib.ListSetting(name='list', subsetting=cfglib.IntSetting(), on_empty=cfglib.ERROR)
+    yield _NeverMissingSetting(name='never_missing')
+
+
+def _valid_value(setting):
+    valid_values = [
+        (cfglib.BoolSetting, True),
+        (cfglib.IntSetting, 1),
+        (cfglib.FloatSetting, 1.5),
+        (cfglib.DictSetting, {'x': 2}),
+        (cfglib.ListSetting, [1]),
+    ]
+    for setting_type, value in valid_values:
+        if isinstance(setting, setting_type):
+            return value
+
+    return 'a'
+
+
+def _outcome(spec, config):
+    try:
+        return 'ok', spec.validate_config(config)
+    except Exception as exc:  # pylint: disable=broad-except
+        return type(exc), str(exc)
+
+
+def _assert_same_outcome(spec, compiled_spec, data):
+    # Plain dicts and other mappings are read differently by compiled specs
+    for config in [cfglib.DictConfig(data), cfglib.CompositeConfig([cfglib.DictConfig(data)])]:
+        assert _outcome(compiled_spec, config) == _outcome(spec, config)
+
+
+@pytest.mark.parametrize('allow_extra', [False, True])
+def test_compiled_spec(allow_extra):
+    settings = list(_settings())
+    spec = cfglib.ConfigSpec(settings, allow_extra=allow_extra)
+    compiled_spec = cfglib.ConfigSpec(settings, allow_extra=allow_extra)
+    assert not compiled_spec.compiled
+    compiled_spec.compile()
+    assert compiled_spec.compiled
+
+    values = [cfglib.MISSING, None, 'a', True, 1, 1.5, {'x': 2}, [], [1], ['a'], {}]
+    for setting in settings:
+        for value in values:
+            data = {other.name: _valid_value(other) for other in settings}
+            if value is cfglib.MISSING:
+                del data[setting.name]
+            else:
+                data[setting.name] = value
+
+            _assert_same_outcome(spec, compiled_spec, data)
+
+    valid_data = {setting.name: _valid_value(setting) for setting in settings}
+    assert _outcome(compiled_spec, cfglib.DictConfig(valid_data))[0] == 'ok'
+
+    _assert_same_outcome(spec, compiled_spec, {**valid_data, 'extra': 1})
+
+
+def test_compiled_spec_validated_config():
+    class CompiledConfig(cfglib.SpecValidatedConfig):
+        compile_spec = True
+
+        name = cfglib.StringSetting(default='x', validators=[one_of(['x', 'y'])])
+        sub = cfglib.DictSetting(subtype=_SubConfig, default={})
+
+    assert CompiledConfig.SPEC.compiled
+
+    cfg = CompiledConfig([cfglib.DictConfig({'sub': {}})])
+    assert cfg.validate() == {'name': 'x', 'sub': cfg.sub}
+    assert cfg.sub.x == 1
+
+    with pytest.raises(cfglib.ValidationError):
+        _ = CompiledConfig([cfglib.DictConfig({'name': 'z'})])
@@ -0,0 +1,128 @@
+import copy
+import functools
+import pickle
+import sys
+
+import pytest
+
+import cfglib
+
+
+class _DbConfig(cfglib.SpecValidatedConfig):
+    host = cfglib.StringSetting(default='localhost')
+    port = cfglib.IntSetting(default=5432)
+
+
+class _ToolConfig(cfglib.SpecValidatedConfig):
+    name = cfglib.StringSetting()
+    db = cfglib.DictSetting(subtype=_DbConfig, default={})
+    tags = cfglib.ListSetting(default=[])
+    labels = cfglib.DictSetting(default={})
+    comment = cfglib.StringSetting(on_missing=cfglib.LEAVE)
+
+
+def test_freeze():
+    source = cfglib.DictConfig({'name': 'tool', 'db': {'port': 1}, 'tags': ['a', 'b']})
+    cfg = _ToolConfig([source])
+    frozen = cfg.freeze()
+
+    assert isinstance(frozen, cfglib.FrozenConfig)
+    assert type(frozen).__name__ == 'Frozen_ToolConfig'
+    assert not hasattr(frozen, '__dict__')
+
+    assert frozen.name == 'tool'
+    assert frozen['name'] == 'tool'
+    assert frozen.db.port == 1
+    assert isinstance(frozen.db, cfglib.FrozenConfig)
+    assert frozen.tags == ('a', 'b')
+    assert frozen.labels == {}
+    assert isinstance(frozen.labels, cfglib.FrozenDict)
+
+    with pytest.raises(AttributeError):
+        _ = frozen.comment
+
+    with pytest.raises(KeyError):
+        _ = frozen['comment']
+
+    with pytest.raises(KeyError):
+        _ = frozen['unknown']
+
+    assert 'name' in frozen
+    assert 'comment' not in frozen
+    assert list(frozen) == ['name', 'db', 'tags', 'labels']
+    assert len(frozen) == 4
+    assert frozen._fields == ('name', 'db', 'tags', 'labels', 'comment')
+    assert frozen._asdict()['name'] == 'tool'
+    assert repr(frozen).startswith("Frozen_ToolConfig(name='tool', db=Frozen_DbConfig(")
+
+    with pytest.raises(AttributeError):
+        frozen.name = 'other'
+
+    with pytest.raises(AttributeError):
+        del frozen.name
+
+    with pytest.raises(TypeError):
+        frozen.labels['a'] = 1
+
+    # The snapshot doesn't follow the sources
+    source['name'] = 'renamed'
+    assert frozen.name == 'tool'
+    assert cfg.freeze().name == 'renamed'
+
+
+def test_frozen_equality_and_hash():
+    def make(**data):
+        return _ToolConfig([cfglib.DictConfig({'name': 'tool', **data})]).freeze()
+
+    assert make() == make()
+    assert hash(make()) == hash(make())
+    assert make(labels={'a': [1]}) == make(labels={'a': [1]})
+    assert hash(make(labels={'a': [1]})) == hash(make(labels={'a': [1]}))
+    assert make() != make(comment='x')
+    assert make() != make(db={'port': 2})
+    assert make() != _DbConfig([]).freeze()
+    assert type(make()) is type(make())
+
+    calls = []
+
+    @functools.lru_cache()
+    def connect(cfg):
+        calls.append(cfg)
+        return cfg.name
+
+    assert connect(make()) == connect(make()) == 'tool'
+    assert len(calls) == 1
+
+
+def test_frozen_copy_and_pickle():
+    frozen = _ToolConfig([cfglib.DictConfig({'name': 'tool', 'labels': {'a': 1}})]).freeze()
+    assert copy.copy(frozen) is frozen
+    assert copy.deepcopy(frozen) is frozen
+
+    restored = pickle.loads(pickle.dumps(frozen))
+    assert restored == frozen
+    assert restored.labels == {'a': 1}
+    assert type(restored) is type(frozen)
+
+
+def test_frozen_read_copy_update():
+    class RcuConfig(cfglib.SpecValidatedConfig):
+        read_copy_update = True
+
+        name = cfglib.StringSetting(default='x')
+
+    assert RcuConfig([]).freeze().name == 'x'
+
+
+def test_frozen_size():
+    cfg = _ToolConfig([cfglib.DictConfig({'name': 'tool'})])
+    frozen = cfg.freeze()
+    assert sys.getsizeof(frozen) < sys.getsizeof(frozen._asdict())
+
+
+def test_freeze_invalid_names():
+    class InvalidConfig(cfglib.SpecValidatedConfig):
+        SPEC = cfglib.ConfigSpec([cfglib.StringSetting(name='not an identifier', default='x')])
+
+    with pytest.raises(ValueError):
+        InvalidConfig([]).freeze()
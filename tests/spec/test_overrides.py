@@ -0,0 +1,133 @@
+import asyncio
+import threading
+from typing import List
+
+import pytest
+
+import cfglib
+from cfglib.validation import value_range
+
+
+_validated: List[str] = []
+
+
+def _record(ctx, value):
+    _validated.append(ctx.field_name)
+    return value
+
+
+class _LimitsConfig(cfglib.SpecValidatedConfig):
+    cache_values = True
+
+    max_connections = cfglib.IntSetting(default=10, validators=[value_range(1, 100), _record])
+    timeout = cfglib.FloatSetting(default=1.0, validators=[_record])
+    name = cfglib.StringSetting(on_missing=cfglib.LEAVE, validators=[_record])
+
+
+class _RcuLimitsConfig(_LimitsConfig):
+    SPEC = _LimitsConfig.SPEC
+    cache_values = False
+    read_copy_update = True
+
+
+@pytest.mark.parametrize('config_class', [_LimitsConfig, _RcuLimitsConfig])
+def test_override(config_class):
+    source = cfglib.DictConfig({'timeout': 2.0})
+    cfg = config_class([source])
+    _validated.clear()
+
+    with cfg.override(max_connections=5) as overridden:
+        assert overridden is cfg
+        assert _validated == ['max_connections']
+        assert cfg.max_connections == 5
+        assert cfg['timeout'] == 2.0
+        assert cfg.get_many(['max_connections', 'timeout']) == (5, 2.0)
+
+        with cfg.override({'timeout': 3.0}, name='tenant'):
+            assert (cfg.max_connections, cfg.timeout, cfg.name) == (5, 3.0, 'tenant')
+            assert cfg.snapshot() == {'max_connections': 5, 'timeout': 3.0, 'name': 'tenant'}
+            assert cfg.freeze().timeout == 3.0
+
+        assert cfg.timeout == 2.0
+        assert 'name' not in cfg
+
+        # Changes of sources are seen for settings that aren't overridden
+        source['timeout'] = 4.0
+        assert cfg.timeout == 4.0
+        assert cfg.validate()['max_connections'] == 10
+
+    assert cfg.max_connections == 10
+    assert cfg.snapshot() == {'max_connections': 10, 'timeout': 4.0}
+
+
+def test_override_errors():
+    cfg = _LimitsConfig({})
+
+    with pytest.raises(cfglib.ValidationError):
+        with cfg.override(max_connections=1000):
+            pass  # pragma: no cover
+
+    with pytest.raises(KeyError):
+        with cfg.override(unknown=1):
+            pass  # pragma: no cover
+
+    with pytest.raises(RuntimeError):
+        with cfg.override(max_connections=5):
+            raise RuntimeError()
+
+    assert cfg.max_connections == 10
+
+
+def test_override_threads():
+    cfg = _LimitsConfig({})
+    seen = []
+
+    with cfg.override(max_connections=5):
+        thread = threading.Thread(target=lambda: seen.append(cfg.max_connections))
+        thread.start()
+        thread.join()
+        assert cfg.max_connections == 5
+
+    assert seen == [10]
+
+
+def test_override_tasks():
+    cfg = _LimitsConfig({})
+
+    async def _with_override(override_started, base_checked):
+        with cfg.override(max_connections=5):
+            override_started.set()
+            await base_checked.wait()
+            child = asyncio.create_task(_read())
+            return cfg.max_connections, await child
+
+    async def _read():
+        return cfg.max_connections
+
+    async def _without_override(override_started, base_checked):
+        await override_started.wait()
+        value = cfg.max_connections
+        base_checked.set()
+        return value
+
+    async def _main():
+        # Events are bound to the running loop on Python < 3.10
+        override_started = asyncio.Event()
+        base_checked = asyncio.Event()
+        return await asyncio.gather(
+            _with_override(override_started, base_checked),
+            _without_override(override_started, base_checked),
+        )
+
+    assert asyncio.run(_main()) == [(5, 5), 10]
+
+
+def test_override_stats():
+    cfg = _LimitsConfig({})
+    stats = cfg.instrument()
+
+    with cfg.override(name='tenant'):
+        assert cfg.name == 'tenant'
+
+    assert stats.accesses['name'] == 1
+    assert stats.misses['name'] == 0
@@ -0,0 +1,176 @@
+import concurrent.futures
+import pickle
+import time
+
+import pytest
+
+import cfglib
+from cfglib.validation import one_of, value_range, value_type
+
+
+def _slow_validator(ctx, value):
+    time.sleep(0.05)
+    if value == 'invalid':
+        raise cfglib.ValidationError(f'{ctx.field_name} is invalid')
+
+    return value
+
+
+def _double(_ctx, value):
+    return value * 2
+
+
+def _list_length(_ctx, value):
+    return len(value)
+
+
+def _spec():
+    return cfglib.ConfigSpec([
+        cfglib.StringSetting(name='name', validators=[one_of(['a', 'b'])]),
+        cfglib.IntSetting(name='port', validators=[value_range(1, 65535)]),
+        cfglib.Setting(name='slow1', validators=[_slow_validator]),
+        cfglib.Setting(name='slow2', validators=[_slow_validator]),
+        cfglib.Setting(name='absent', on_missing=cfglib.LEAVE),
+        cfglib.IntSetting(name='default', default=5),
+        cfglib.ListSetting(
+            name='items',
+            subsetting=cfglib.IntSetting(validators=[value_type(int), _double]),
+            validators=[_list_length],
+        ),
+        cfglib.ListSetting(name='short', subsetting=cfglib.IntSetting()),
+    ])
+
+
+def _data(**overrides):
+    data = {
+        'name': 'a',
+        'port': 80,
+        'slow1': 1,
+        'slow2': 2,
+        'items': list(range(100)),
+        'short': [1, 2],
+    }
+    data.update(overrides)
+    return data
+
+
+@pytest.mark.parametrize('executor_class', [
+    concurrent.futures.ThreadPoolExecutor,
+    concurrent.futures.ProcessPoolExecutor,
+])
+def test_same_results(executor_class):
+    spec = _spec()
+    config = cfglib.DictConfig(_data())
+    expected = spec.validate_config(config)
+    assert expected['absent'] is cfglib.MISSING
+    assert expected['items'] == 100
+
+    with executor_class(max_workers=4) as executor:
+        assert spec.validate_config(config, executor=executor) == expected
+        assert spec.validate_config(config, executor=executor, chunk_size=7) == expected
+
+        result = spec.validate_config(config, executor=executor)
+        assert result['absent'] is cfglib.MISSING
+
+
+def test_parallel():
+    intervals = []
+
+    def _timed_validator(_ctx, value):
+        start = time.monotonic()
+        time.sleep(0.05)
+        intervals.append((start, time.monotonic()))
+        return value
+
+    spec = cfglib.ConfigSpec([
+        cfglib.Setting(name=f'slow{i}', validators=[_timed_validator])
+        for i in range(8)
+    ])
+    config = cfglib.DictConfig({f'slow{i}': i for i in range(8)})
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        spec.validate_config(config, executor=executor)
+
+    # Some validators ran at the same time
+    assert len(intervals) == 8
+    assert any(
+        other_start < end and start < other_end
+        for i, (start, end) in enumerate(intervals)
+        for other_start, other_end in intervals[i + 1:]
+    )
+
+
+def test_deterministic_errors():
+    spec = _spec()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        # slow1 fails last, but comes first in the spec
+        config = cfglib.DictConfig(_data(slow1='invalid', short=['x']))
+        for _ in range(3):
+            with pytest.raises(cfglib.ValidationError, match='slow1 is invalid'):
+                spec.validate_config(config, executor=executor)
+
+        items = list(range(100))
+        items[30] = 'x'
+        items[90] = None
+        config = cfglib.DictConfig(_data(items=items))
+        with pytest.raises(cfglib.ValidationError) as serial_error:
+            spec.validate_config(config)
+
+        for chunk_size in (7, 50, 1000):
+            with pytest.raises(cfglib.ValidationError) as parallel_error:
+                spec.validate_config(config, executor=executor, chunk_size=chunk_size)
+
+            assert str(parallel_error.value) == str(serial_error.value)
+
+        with pytest.raises(cfglib.ValidationError, match='Unexpected fields'):
+            spec.validate_config(cfglib.DictConfig(_data(extra=1)), executor=executor)
+
+
+def test_stats():
+    spec = _spec()
+    stats = cfglib.ConfigStats()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        config = cfglib.DictConfig(_data())
+        spec.validate_config(config, stats=stats, executor=executor, chunk_size=10)
+
+    assert set(stats.validations) == set(spec.settings)
+    assert stats.validation_time['slow1'] >= 0.05
+
+
+def test_spec_validated_config():
+    class ServiceConfig(cfglib.SpecValidatedConfig):
+        name = cfglib.StringSetting()
+        hosts = cfglib.ListSetting(subsetting=cfglib.StringSetting(validators=[_slow_validator]))
+
+    class ServiceRcuConfig(ServiceConfig):
+        SPEC = ServiceConfig.SPEC
+        read_copy_update = True
+
+    source = cfglib.DictConfig({'name': 'svc', 'hosts': ['a', 'b']})
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        cfg = ServiceConfig([source], validate=False)
+        assert cfg.validate(executor) == {'name': 'svc', 'hosts': ['a', 'b']}
+
+        rcu_source = cfglib.DictConfig(source)
+        rcu_cfg = ServiceRcuConfig([rcu_source])
+        rcu_source['name'] = 'other'
+        assert rcu_cfg.validate(executor=executor)['name'] == 'other'
+
+        source['hosts'] = ['invalid']
+        with pytest.raises(cfglib.ValidationError):
+            cfg.validate(executor)
+
+
+def test_builtin_validators_pickle():
+    setting = cfglib.IntSetting(
+        name='a',
+        validators=[value_type(int), one_of([1, 2]), one_of([[1], 1]), value_range(0, 2)],
+    )
+    restored = pickle.loads(pickle.dumps(setting))
+    assert restored.validate_value(1) == 1
+    assert restored.validate_values([1, 1]) == [1, 1]
+    with pytest.raises(cfglib.ValidationError, match='one of: 1, 2'):
+        restored.validate_value(0)
+
+    assert pickle.loads(pickle.dumps(cfglib.MISSING)) is cfglib.MISSING
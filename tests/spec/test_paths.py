@@ -0,0 +1,178 @@
+import pytest
+
+import cfglib
+from cfglib.validation import value_range
+
+
+_POOL_SPEC = cfglib.ConfigSpec([
+    cfglib.IntSetting(name='size', default=5, validators=[value_range(1, 100)]),
+    cfglib.FloatSetting(name='timeout', on_missing=cfglib.LEAVE),
+])
+
+
+class _DbConfig(cfglib.SpecValidatedConfig):
+    instances = 0
+
+    host = cfglib.StringSetting(default='localhost')
+    pool = cfglib.DictSetting(subtype=_POOL_SPEC, default={})
+
+    def __init__(self, *args, **kwargs):
+        _DbConfig.instances += 1
+        super().__init__(*args, **kwargs)
+
+
+class _AppConfig(cfglib.SpecValidatedConfig):
+    name = cfglib.StringSetting(default='app')
+    db = cfglib.DictSetting(subtype=_DbConfig, default={})
+    replica = cfglib.DictSetting(subtype=_DbConfig, on_null=cfglib.LEAVE, on_missing=cfglib.LEAVE)
+
+
+class _CachedAppConfig(_AppConfig):
+    SPEC = _AppConfig.SPEC
+    cache_values = True
+
+
+class _RcuAppConfig(_AppConfig):
+    SPEC = _AppConfig.SPEC
+    read_copy_update = True
+
+
+def _chained(cfg, names):
+    value = cfg
+    for name in names:
+        value = value[name]
+
+    return value
+
+
+def _outcome(func, *args):
+    try:
+        return 'ok', func(*args)
+    except Exception as exc:  # pylint: disable=broad-except
+        return type(exc), str(exc)
+
+
+SOURCES = [
+    {},
+    {'db': {'host': 'db', 'pool': {'size': 10, 'timeout': 1.5}}},
+    {'db': {'pool': {}}},
+    {'db': {'pool': None}},
+    {'db': {'pool': {'size': 1000}}},
+    {'db': {'pool': 'x'}},
+    {'db': None},
+    {'replica': None},
+    {'replica': {'pool': {'size': 2}}},
+]
+
+PATHS = [
+    'name',
+    'db',
+    'db.host',
+    'db.pool',
+    'db.pool.size',
+    'db.pool.timeout',
+    'replica.host',
+    'replica.pool.size',
+]
+
+
+@pytest.mark.parametrize('config_class', [_AppConfig, _CachedAppConfig, _RcuAppConfig])
+def test_get_path(config_class):
+    for source in SOURCES:
+        validate = not config_class.read_copy_update
+        created = _outcome(config_class, [cfglib.DictConfig(source)], validate)
+        if created[0] != 'ok':
+            continue
+
+        cfg = created[1]
+        for path in PATHS:
+            names = path.split('.')
+            expected = _outcome(_chained, cfg, names)
+            # Nested ConfigSpecs give dicts with MISSING values, get_path() treats them as absent
+            if expected[0] is KeyError or expected == ('ok', cfglib.MISSING):
+                expected = (KeyError, repr(f'Key {path} not found'))
+
+            assert _outcome(cfg.get_path, path) == expected, (source, path)
+            assert _outcome(cfg.get_path, names) == expected, (source, path)
+            if expected[0] is KeyError:
+                assert cfg.get_path(path, None) is None
+
+
+def test_get_path_without_nested_configs():
+    cfg = _AppConfig([cfglib.DictConfig({'db': {'pool': {'size': 10}}})], validate=False)
+    _DbConfig.instances = 0
+
+    assert cfg.get_path('db.pool.size') == 10
+    assert cfg.get_path('replica.pool.size', None) is None
+    assert cfg.nested.db.pool.size == 10
+    assert _DbConfig.instances == 0
+
+    assert isinstance(cfg.get_path('db'), _DbConfig)
+
+
+def test_get_path_extra_fields():
+    extra_spec = cfglib.ConfigSpec([cfglib.IntSetting(name='size')], allow_extra=True)
+
+    class LenientConfig(cfglib.SpecValidatedConfig):
+        pool = cfglib.DictSetting(subtype=extra_spec)
+
+    source = cfglib.DictConfig({'db': {'pool': {'size': 5, 'bogus': 1}}})
+    cfg = _AppConfig([source], validate=False)
+    for path in ('db.pool.size', 'db.pool'):
+        # The same as chained access
+        expected = _outcome(_chained, cfg, path.split('.'))
+        assert expected == (cfglib.ValidationError, 'Unexpected fields in the config: bogus')
+        assert _outcome(cfg.get_path, path) == expected
+
+    cfg = LenientConfig([cfglib.DictConfig({'pool': {'size': 5, 'bogus': 1}})])
+    assert cfg.get_path('pool.size') == 5
+
+
+def test_get_path_cached():
+    cfg = _CachedAppConfig([cfglib.DictConfig({'db': {'pool': {'size': 10}}})])
+    db = cfg.db
+    assert db.pool == {'size': 10, 'timeout': cfglib.MISSING}
+
+    _DbConfig.instances = 0
+    assert cfg.get_path('db.pool.size') == 10
+    assert cfg.get_path('db.pool.timeout', 1.0) == 1.0
+    assert _DbConfig.instances == 0
+
+    with cfg.override(db={'pool': {'size': 20}}):
+        assert cfg.get_path('db.pool.size') == 20
+        assert cfg.nested.db.pool.size == 20
+
+    assert cfg.get_path('db.pool.size') == 10
+
+
+def test_unknown_paths():
+    cfg = _AppConfig({})
+
+    for path in ('nope', 'name.x', 'db.pool.size.x', 'db.nope', ''):
+        with pytest.raises(KeyError, match='Unknown setting path'):
+            cfg.get_path(path, None)
+
+    with pytest.raises(AttributeError, match='Unknown setting path'):
+        _ = cfg.nested.db.nope
+
+
+def test_nested_views():
+    cfg = _AppConfig([cfglib.DictConfig({'db': {'host': 'db'}})])
+
+    db_view, db_view_again = cfg.nested.db, cfg.nested.db
+    assert db_view is db_view_again
+    pool_view, pool_view_again = cfg.nested.db.pool, cfg.nested.db.pool
+    assert pool_view is pool_view_again
+    assert cfg.nested.name == 'app'
+    assert cfg.nested.db.host == 'db'
+
+    # The default of pool isn't validated, like with cfg['db']['pool']['size']
+    with pytest.raises(AttributeError):
+        _ = cfg.nested.db.pool.size
+
+    cfg = _AppConfig([cfglib.DictConfig({'db': {'pool': {}}})])
+    assert cfg.nested.db.pool.size == 5
+    with pytest.raises(AttributeError):
+        _ = cfg.nested.db.pool.timeout
+
+    assert 'db' in repr(cfg.nested.db)
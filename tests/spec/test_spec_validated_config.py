@@ -1,3 +1,5 @@
+import threading
+
 import pytest
 
 import cfglib
@@ -381,3 +383,281 @@ def test_cfg_with_spec_attributes():
     cfg = TestConfig([cfglib.DictConfig({'X': 'x_value'})])
     assert cfg.X == 'x_value'
     assert isinstance(cfg.SPEC.settings['X'], cfglib.StringSetting)
+
+
+def test_cached_values():
+    validated = []
+
+    def _counting_validator(ctx, value):
+        validated.append(ctx.field_name)
+        return value
+
+    class TestConfig(cfglib.SpecValidatedConfig):
+        cache_values = True
+
+        X = cfglib.StringSetting(validators=[_counting_validator])
+        Y = cfglib.IntSetting(default=1)
+
+    source = cfglib.DictConfig({'X': 'a'})
+    cfg = TestConfig([source])
+    assert cfg.validate() == {'X': 'a', 'Y': 1}
+    validated.clear()
+
+    assert cfg.X == 'a'
+    assert cfg['X'] == 'a'
+    assert not validated
+
+    source['X'] = 'b'
+    assert cfg.X == 'b'
+    assert cfg.X == 'b'
+    assert validated == ['X']
+
+    cfg.subconfigs.append(cfglib.DictConfig({'X': 'c'}))
+    assert cfg.X == 'c'
+
+    cfg.subconfigs = [cfglib.DictConfig({'X': 'd'})]
+    assert cfg.X == 'd'
+    assert cfg.snapshot() == cfg.validate()
+
+
+def test_cached_values_reload():
+    class TestConfig(cfglib.SpecValidatedConfig):
+        cache_values = True
+
+        X = cfglib.StringSetting()
+
+    class ReloadedConfig(cfglib.DictConfig):
+        def __init__(self, data):
+            super().__init__(data)
+            self.data = data
+
+        def reload(self):
+            self.replace(self.data)
+
+    data = {'X': 'a'}
+    cfg = TestConfig([ReloadedConfig(data)])
+    assert cfg.X == 'a'
+
+    # The change is only picked up on reload
+    data['X'] = 'b'
+    assert cfg.X == 'a'
+
+    cfg.reload()
+    assert cfg.X == 'b'
+
+    # Plain mappings are not tracked, so values aren't cached at all
+    data = {'X': 'a'}
+    cfg = TestConfig([cfglib.ProxyConfig(data)])
+    assert cfg.X == 'a'
+
+    data['X'] = 'b'
+    assert cfg.X == 'b'
+
+    data['X'] = 1
+    with pytest.raises(cfglib.ValidationError):
+        cfg.validate()
+
+
+def test_validate_ignores_cache():
+    class TestConfig(cfglib.SpecValidatedConfig):
+        cache_values = True
+
+        X = cfglib.IntSetting()
+
+    source = cfglib.DictConfig({'X': 1})
+    cfg = TestConfig([source])
+    assert cfg.X == 1
+
+    # Bypass change notifications
+    dict.__setitem__(source, 'X', 'not an int')
+    assert cfg.X == 1
+    with pytest.raises(cfglib.ValidationError):
+        cfg.validate()
+
+
+def test_spec_validated_config_as_subconfig():
+    class TestConfig(cfglib.SpecValidatedConfig):
+        X = cfglib.StringSetting(on_missing=cfglib.LEAVE)
+
+    composite_config = cfglib.CompositeConfig([
+        cfglib.DictConfig({'X': 'low'}),
+        TestConfig([cfglib.DictConfig()]),
+    ])
+    assert composite_config['X'] == 'low'
+
+
+def test_lazy_validation():
+    validated = []
+
+    def _counting_validator(ctx, value):
+        validated.append(ctx.field_name)
+        return value
+
+    class TestConfig(cfglib.SpecValidatedConfig):
+        X = cfglib.StringSetting(validators=[_counting_validator])
+        Y = cfglib.IntSetting(validators=[_counting_validator])
+
+    cfg = TestConfig([cfglib.DictConfig({'X': 'a', 'Y': 'invalid'})], validate='lazy')
+    assert not validated
+
+    assert cfg.X == 'a'
+    assert cfg.X == 'a'
+    assert validated == ['X']
+
+    with pytest.raises(cfglib.ValidationError):
+        _ = cfg.Y
+
+    with pytest.raises(cfglib.ValidationError):
+        cfg.validate()
+
+    cfg.subconfigs.append(cfglib.DictConfig({'Y': 1}))
+    validated.clear()
+    assert cfg.Y == 1
+    assert validated == ['Y']
+
+    # validate() always validates the sources
+    assert cfg.validate() == {'X': 'a', 'Y': 1}
+    assert validated == ['Y', 'X', 'Y']
+
+    with pytest.raises(ValueError):
+        _ = TestConfig({}, validate='sometimes')
+
+
+def test_read_copy_update():
+    class TestConfig(cfglib.SpecValidatedConfig):
+        read_copy_update = True
+
+        a = cfglib.IntSetting()
+        b = cfglib.IntSetting()
+        c = cfglib.IntSetting(on_missing=cfglib.LEAVE)
+
+    source_cfg = cfglib.DictConfig({'a': 0, 'b': 0})
+    cached_cfg = cfglib.CachingConfig(source_cfg)
+    cfg = TestConfig([cached_cfg])
+    assert cfg.snapshot() == {'a': 0, 'b': 0}
+    with pytest.raises(KeyError):
+        _ = cfg['c']
+    with pytest.raises(KeyError):
+        _ = cfg['unknown']
+
+    errors = []
+    stop = threading.Event()
+
+    def _read():
+        while not stop.is_set():
+            snapshot = cfg.snapshot()
+            if snapshot['a'] != snapshot['b']:
+                errors.append(snapshot)
+
+    readers = [threading.Thread(target=_read) for _ in range(8)]
+    for reader in readers:
+        reader.start()
+
+    for i in range(1, 200):
+        source_cfg.update(a=i, b=i)
+        cfg.reload()
+        assert cfg.a == cfg.b == i
+
+    stop.set()
+    for reader in readers:
+        reader.join()
+    assert not errors
+
+    source_cfg['a'] = 'invalid'
+    with pytest.raises(cfglib.ValidationError):
+        cfg.reload()
+    assert cfg.a == 199
+
+    cached_cfg['a'] = 1000
+    assert cfg.a == 1000
+
+    with pytest.raises(ValueError):
+        _ = TestConfig([cached_cfg], validate=False)
+
+
+def test_read_copy_update_invalid_change():
+    class TestConfig(cfglib.SpecValidatedConfig):
+        read_copy_update = True
+
+        x = cfglib.IntSetting()
+
+    source = cfglib.DictConfig({'x': 1})
+    cfg = TestConfig([source])
+    sibling = cfglib.CompositeConfig([source])
+
+    # The error doesn't stop other dependents of the source from seeing the change
+    source['y'] = 5
+    assert len(sibling) == 2
+    assert cfg.x == 1
+    assert isinstance(cfg.last_error, cfglib.ValidationError)
+
+    with pytest.raises(cfglib.ValidationError):
+        cfg.validate()
+
+    del source['y']
+    assert cfg.last_error is None
+    source['x'] = 2
+    assert cfg.x == 2
+
+
+@pytest.mark.parametrize('mode', ['plain', 'cache_values', 'read_copy_update', 'instrumented'])
+def test_get_many(mode):
+    class TestConfig(cfglib.SpecValidatedConfig):
+        cache_values = mode == 'cache_values'
+        read_copy_update = mode == 'read_copy_update'
+
+        name = cfglib.StringSetting(default='x')
+        port = cfglib.IntSetting(on_missing=cfglib.LEAVE)
+        debug = cfglib.BoolSetting(default=False)
+
+    source = cfglib.DictConfig({'name': 'a'})
+    cfg = TestConfig([source, cfglib.DictConfig({'debug': True})])
+    if mode == 'instrumented':
+        stats = cfg.instrument()
+
+    assert cfg.get_many(['debug', 'name']) == (True, 'a')
+    assert cfg.get_many(['name', 'port'], default=None) == ('a', None)
+    assert cfg.get_many(['name', 'debug'], named=True).debug is True
+
+    with pytest.raises(KeyError):
+        cfg.get_many(['name', 'port'])
+
+    with pytest.raises(KeyError):
+        cfg.get_many(['name', 'unknown'], default=None)
+
+    source['name'] = 'b'
+    source['port'] = 80
+    assert cfg.get_many(['name', 'port']) == ('b', 80)
+
+    if mode == 'read_copy_update':
+        # The new generation fails to validate, the previous one stays published
+        source['port'] = 'invalid'
+        assert cfg.last_error is not None
+        assert cfg.get_many(['port']) == (80,)
+    else:
+        source['port'] = 'invalid'
+
+        with pytest.raises(cfglib.ValidationError):
+            cfg.get_many(['port'])
+
+    if mode == 'instrumented':
+        assert stats.accesses['name'] == 5
+        assert stats.resolved_by['debug'] == {'1:DictConfig': 2}
+
+
+def test_deferred_spec():
+    class DeferredConfig(cfglib.SpecValidatedConfig):
+        compile_spec = True
+
+        name = cfglib.StringSetting(default='x')
+
+    class DeferredSubConfig(DeferredConfig):
+        pass
+
+    assert not isinstance(DeferredConfig.__dict__['SPEC'], cfglib.ConfigSpec)
+
+    cfg = DeferredSubConfig({})
+    assert cfg.name == 'x'
+    assert isinstance(DeferredConfig.__dict__['SPEC'], cfglib.ConfigSpec)
+    assert DeferredSubConfig.SPEC is DeferredConfig.SPEC
+    assert DeferredConfig.SPEC.compiled
@@ -0,0 +1,183 @@
+import os
+import pickle
+from typing import List
+
+import cfglib
+from cfglib.sources.env import EnvConfig
+from cfglib.sources.file import JsonFileConfig
+
+
+VALIDATED: List[str] = []
+
+
+def _counting_validator(ctx, value):
+    VALIDATED.append(ctx.field_name)
+    return value
+
+
+class _DbConfig(cfglib.SpecValidatedConfig):
+    host = cfglib.StringSetting(default='localhost', validators=[_counting_validator])
+    port = cfglib.IntSetting(default=5432)
+
+
+class _ToolConfig(cfglib.SpecValidatedConfig):
+    name = cfglib.StringSetting(validators=[_counting_validator])
+    db = cfglib.DictSetting(subtype=_DbConfig, default={})
+    comment = cfglib.StringSetting(on_missing=cfglib.LEAVE)
+
+
+def _strip(_ctx, value):
+    return value.strip()
+
+
+_MAX_LENGTH = 10
+
+
+def _check_length(_ctx, value):
+    if len(value) > _MAX_LENGTH:
+        raise cfglib.ValidationError('Too long')
+
+    return value
+
+
+class _Strip:
+    def __call__(self, _ctx, value):
+        return value.strip()
+
+
+class _ServerConfig(cfglib.SpecValidatedConfig):
+    host = cfglib.StringSetting(default='localhost', validators=[_strip])
+    port = cfglib.IntSetting(default=5432)
+
+
+def _fingerprint(*validators, default=None):
+    return cfglib.ConfigSpec([
+        cfglib.StringSetting(name='name', validators=list(validators)),
+        cfglib.DictSetting(name='server', subtype=_ServerConfig, default=default or {}),
+    ]).fingerprint()
+
+
+def test_spec_fingerprint(monkeypatch):
+    class OtherConfig(cfglib.SpecValidatedConfig):
+        name = cfglib.StringSetting(validators=[_strip])
+        server = cfglib.DictSetting(subtype=_ServerConfig, default={})
+
+    fingerprint = _fingerprint(_strip)
+    assert fingerprint is not None
+    assert OtherConfig.SPEC.fingerprint() == fingerprint
+    assert _fingerprint(_strip, default={'port': 1}) != fingerprint
+    assert _fingerprint(_check_length) not in (None, fingerprint)
+
+    # Values of globals read by validators are part of the fingerprint
+    length_fingerprint = _fingerprint(_check_length)
+    monkeypatch.setitem(_check_length.__globals__, '_MAX_LENGTH', 20)
+    assert _fingerprint(_check_length) != length_fingerprint
+
+    # Callable objects and validators reading mutable globals can't be fingerprinted
+    assert _fingerprint(_Strip()) is None
+    assert _fingerprint(_counting_validator) is None
+    assert _ToolConfig.SPEC.fingerprint() is None
+
+
+def test_source_fingerprints(tmp_path, monkeypatch):
+    dict_config = cfglib.DictConfig({'a': 1})
+    fingerprint = dict_config.fingerprint()
+    assert cfglib.DictConfig({'a': 1}).fingerprint() == fingerprint
+    dict_config['a'] = 2
+    assert dict_config.fingerprint() != fingerprint
+
+    monkeypatch.setenv('TOOL_NAME', 'x')
+    env_config = EnvConfig(prefix='TOOL_')
+    fingerprint = env_config.fingerprint()
+    monkeypatch.setenv('OTHER_NAME', 'x')
+    assert env_config.fingerprint() == fingerprint
+    monkeypatch.setenv('TOOL_NAME', 'y')
+    assert env_config.fingerprint() != fingerprint
+
+    path = tmp_path / 'cfg.json'
+    path.write_text('{"a": 1}')
+    file_config = JsonFileConfig(path)
+    fingerprint = file_config.fingerprint()
+    path.write_text('{"a": 2, "b": 3}')
+    file_config.reload()
+    assert file_config.fingerprint() != fingerprint
+
+    composite_config = cfglib.CompositeConfig([dict_config, file_config])
+    fingerprint = composite_config.fingerprint()
+    dict_config['a'] = 3
+    assert composite_config.fingerprint() != fingerprint
+
+
+def test_validation_cache(tmp_path, monkeypatch):
+    class CachedToolConfig(_ToolConfig):
+        validation_cache_dir = str(tmp_path / 'cache')
+        # The spec of _ToolConfig can't be fingerprinted
+        validation_cache_key = 'tool'
+
+    path = tmp_path / 'cfg.json'
+    path.write_text('{"name": "tool", "db": {"host": "db"}}')
+    monkeypatch.setenv('TOOL_COMMENT', 'abc')
+
+    def load():
+        return CachedToolConfig([
+            JsonFileConfig(path),
+            EnvConfig(prefix='TOOL_', lowercase=True),
+        ])
+
+    VALIDATED.clear()
+    cfg = load()
+    assert set(VALIDATED) == {'name', 'host'}
+    assert cfg.db.host == 'db'
+    assert len(os.listdir(tmp_path / 'cache')) == 1
+
+    # The values are loaded, no validators are run
+    VALIDATED.clear()
+    cfg = load()
+    assert not VALIDATED
+
+    # EnvConfig doesn't report changes, so accesses validate the sources
+    assert cfg.name == 'tool'
+    assert cfg.db.host == 'db'
+    assert cfg.db.port == 5432
+    assert cfg.comment == 'abc'
+    assert set(VALIDATED) == {'name', 'host'}
+
+    monkeypatch.setenv('TOOL_COMMENT', 'def')
+    VALIDATED.clear()
+    cfg = load()
+    assert cfg.comment == 'def'
+    assert set(VALIDATED) == {'name', 'host'}
+
+    path.write_text('{"name": "renamed"}')
+    cfg = load()
+    assert cfg.name == 'renamed'
+    assert cfg.db == {}
+
+    # A corrupted cache is ignored
+    for name in os.listdir(tmp_path / 'cache'):
+        (tmp_path / 'cache' / name).write_bytes(b'garbage')
+
+    assert load().name == 'renamed'
+    assert len(os.listdir(tmp_path / 'cache')) == 1
+
+    # Without a key or a fingerprint nothing is stored
+    CachedToolConfig.validation_cache_key = None
+    VALIDATED.clear()
+    load()
+    assert VALIDATED == ['name']
+    assert len(os.listdir(tmp_path / 'cache')) == 1
+
+
+def test_pickle_spec_validated_config():
+    cfg = _ToolConfig([cfglib.DictConfig({'name': 'tool', 'db': {'port': 1}})])
+
+    VALIDATED.clear()
+    restored = pickle.loads(pickle.dumps(cfg))
+    assert VALIDATED == ['name']  # By validate() on dumping
+
+    VALIDATED.clear()
+    assert isinstance(restored, _ToolConfig)
+    assert restored.snapshot() == {'name': 'tool', 'db': {'host': 'localhost', 'port': 1}}
+    assert isinstance(restored.db, _DbConfig)
+    assert 'comment' not in restored
+    assert not VALIDATED
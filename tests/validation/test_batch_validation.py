@@ -0,0 +1,103 @@
+import enum
+
+import pytest
+
+import cfglib
+from cfglib import validation as val
+
+
+class _Color(enum.IntEnum):
+    RED = 1
+
+
+def _outcome(func, *args):
+    try:
+        return 'ok', func(*args)
+    except Exception as exc:  # pylint: disable=broad-except
+        return type(exc), str(exc)
+
+
+def _assert_batch_matches(setting, values):
+    expected = _outcome(lambda: [setting.validate_value(value) for value in values])
+    # Compared by repr since NaN != NaN
+    assert repr(_outcome(setting.validate_values, values)) == repr(expected)
+
+
+SETTINGS = [
+    cfglib.Setting(name='any'),
+    cfglib.StringSetting(name='string'),
+    cfglib.BoolSetting(name='bool'),
+    cfglib.IntSetting(name='int', validators=[val.value_range(0, 100)]),
+    cfglib.IntSetting(name='int_null', on_null=cfglib.USE_DEFAULT, default=-1),
+    cfglib.FloatSetting(name='float', validators=[val.value_range(max_value=1.5)]),
+    cfglib.Setting(name='typed', validators=[val.value_type(int), val.one_of([1, 2, 3])]),
+    cfglib.Setting(name='unhashable_options', validators=[val.one_of([[1], 2])]),
+    cfglib.Setting(name='range_options', validators=[val.value_range(0, 5), val.one_of([3, 0])]),
+    cfglib.Setting(name='convert', validators=[lambda ctx, value: value * 2]),
+]
+
+VALUES = [
+    [],
+    [1, 2, 3],
+    [1, True, 50, 100],
+    [0.5, 1.5, float('nan')],
+    [float('nan'), 2.0],
+    ['a', 'b'],
+    [True, False],
+    [1, None, 2],
+    [1, 'a', 200],
+    [200, 'a'],
+    [1, 2.5],
+    [_Color.RED, 2],
+    [-1, 1],
+    [[1], 2],
+    [cfglib.MISSING],
+]
+
+
+@pytest.mark.parametrize('setting', SETTINGS, ids=lambda setting: setting.name)
+def test_validate_values(setting):
+    for values in VALUES:
+        _assert_batch_matches(setting, values)
+
+
+def test_validate_values_large_float_list():
+    setting = cfglib.FloatSetting(name='weights', validators=[val.value_range(0.0, 1.0)])
+    values = [i / 100_000 for i in range(100_000)]
+    assert setting.validate_values(values) == values
+    assert setting.validate_values(values) is not values
+
+    values[50_000] = 2.0
+    _assert_batch_matches(setting, values)
+
+    values[50_000] = float('nan')
+    _assert_batch_matches(setting, values)
+
+
+def test_list_setting_batch():
+    class RoutesConfig(cfglib.SpecValidatedConfig):
+        ports = cfglib.ListSetting(
+            subsetting=cfglib.IntSetting(validators=[val.value_range(1, 65535)]),
+        )
+
+    routes = list(range(1, 10_000))
+    cfg = RoutesConfig([cfglib.DictConfig({'ports': routes})])
+    assert cfg.ports == routes
+    assert cfg.ports is not routes
+
+    with pytest.raises(cfglib.ValidationError, match='between 1 and 65535'):
+        _ = RoutesConfig([cfglib.DictConfig({'ports': routes + [70_000]})])
+
+    with pytest.raises(cfglib.ValidationError, match='must be an int'):
+        _ = RoutesConfig([cfglib.DictConfig({'ports': routes + ['80']})])
+
+
+def test_numpy_batch():
+    pytest.importorskip('numpy')
+
+    setting = cfglib.FloatSetting(name='weights', validators=[val.value_range(0.0, 1.0)])
+    values = [0.5] * 1000 + [float('nan')]
+    assert setting.validate_values(values) == values[:-1] + [values[-1]]
+
+    values.append(-1.0)
+    _assert_batch_matches(setting, values)
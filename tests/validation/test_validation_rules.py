@@ -35,3 +35,23 @@ def test_one_of():
 
     with pytest.raises(cfglib.ValidationError):
         field.validate_value(2)
+
+    field = cfglib.Setting(name='a', validators=[val.one_of(x for x in [1, 2])])
+    assert field.validate_value(2) == 2
+    assert field.validate_value(1) == 1
+    assert field.validate_values([1, 2]) == [1, 2]
+
+
+def test_value_range():
+    field = cfglib.Setting(name='a', validators=[val.value_range(1, 10)])
+
+    assert field.validate_value(1) == 1
+    assert field.validate_value(10.0) == 10.0
+
+    with pytest.raises(cfglib.ValidationError):
+        field.validate_value(0)
+
+    with pytest.raises(cfglib.ValidationError):
+        field.validate_value(11)
+
+    assert cfglib.Setting(name='a', validators=[val.value_range(min_value=1)]).validate_value(99)